@@ -72,7 +72,8 @@ setup(
   python_requires='>=3.5',
   entry_points={
     'console_scripts': [
-      'vsg = vsg.__main__:main'
+      'vsg = vsg.__main__:main',
+      'vsg_client = vsg.__client__:main'
     ]
   }
 )
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+
+def parse_command_line_arguments():
+    '''Parses the command line arguments and returns them.'''
+
+    parser = argparse.ArgumentParser(
+      prog='VHDL Style Guide (VSG) Client',
+      description='''Sends files to a VSG server started with the --server option and prints the results.''')
+
+    parser.add_argument('-s', '--socket', required=True, help='Unix domain socket the server is listening on')
+    parser.add_argument('-f', '--filename', nargs='+', default=[], help='File to analyze')
+    parser.add_argument('--stdin', default=None, metavar='FILENAME', help='Analyze text read from stdin and report it as FILENAME')
+    parser.add_argument('-of', '--output_format', default=None, choices=['vsg', 'syntastic', 'summary'], help='Sets the output format.')
+
+    if len(sys.argv) == 1:
+        parser.print_help()
+        sys.exit(1)
+    else:
+        return parser.parse_args()
+
+
+def create_requests(commandLineArguments):
+    '''
+    Returns the requests to send to the server.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+    Returns: (list of dictionaries)
+    '''
+    lReturn = []
+    sCwd = os.getcwd()
+    for sFileName in commandLineArguments.filename:
+        dRequest = {}
+        dRequest['filename'] = sFileName
+        dRequest['cwd'] = sCwd
+        dRequest['output_format'] = commandLineArguments.output_format
+        lReturn.append(dRequest)
+    if commandLineArguments.stdin is not None:
+        dRequest = {}
+        dRequest['filename'] = commandLineArguments.stdin
+        dRequest['cwd'] = sCwd
+        dRequest['output_format'] = commandLineArguments.output_format
+        dRequest['content'] = sys.stdin.read()
+        lReturn.append(dRequest)
+    return lReturn
+
+
+def send_requests(sSocketPath, lRequests):
+    '''
+    Sends requests to the server and returns the responses.
+
+    Parameters:
+
+      sSocketPath: (string)
+
+      lRequests: (list of dictionaries)
+
+    Returns: (list of dictionaries)
+    '''
+    lReturn = []
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as oSocket:
+        oSocket.connect(sSocketPath)
+        with oSocket.makefile('rwb') as oStream:
+            for dRequest in lRequests:
+                oStream.write(json.dumps(dRequest).encode('utf-8') + b'\n')
+                oStream.flush()
+                bLine = oStream.readline()
+                if not bLine:
+                    raise ConnectionError('server closed the connection')
+                lReturn.append(json.loads(bLine.decode('utf-8')))
+    return lReturn
+
+
+def main():
+    '''Main routine of the client'''
+
+    fExitStatus = 0
+
+    commandLineArguments = parse_command_line_arguments()
+
+    lRequests = create_requests(commandLineArguments)
+
+    try:
+        lResponses = send_requests(commandLineArguments.socket, lRequests)
+    except (OSError, ValueError) as e:
+        print(f'ERROR: could not communicate with the server at {commandLineArguments.socket}: {e}', file=sys.stderr)
+        sys.exit(2)
+
+    for dResponse in lResponses:
+        if dResponse['stdout']:
+            print(dResponse['stdout'])
+        if dResponse['stderr']:
+            print(dResponse['stderr'], file=sys.stderr)
+        fExitStatus = fExitStatus or dResponse['status']
+
+    sys.exit(fExitStatus)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,19 +4,24 @@ import sys
 import os
 import json
 import glob
+import io
 import yaml
-import functools
 import multiprocessing
 
 from . import apply_rules
+from . import changed_lines
 from . import cmd_line_args
 from . import config
 from . import utils
 
 from . import junit
+from . import profiler
 from . import rule_list
+from . import schedule
+from . import server
 from . import severity
 from . import version
+from . import watch
 from . import vhdlFile
 
 
@@ -76,10 +81,10 @@ def display_rule_configuration(commandLineArguments, oConfig):
         dOutputConfiguration = {}
         if commandLineArguments.local_rules:
             dOutputConfiguration['local_rules'] = commandLineArguments.local_rules
-        dFullConfiguration = oRules.get_configuration()
-        if commandLineArguments.rule_configuration in dFullConfiguration:
+        oRule = oRules.get_rule(commandLineArguments.rule_configuration)
+        if oRule is not None and not rule_list.is_rule_depricated(oRule):
             dOutputConfiguration['rule'] = {}
-            dOutputConfiguration['rule'][commandLineArguments.rule_configuration] = dFullConfiguration[commandLineArguments.rule_configuration]
+            dOutputConfiguration['rule'][commandLineArguments.rule_configuration] = oRule.get_configuration()
             # Format the data for displaying
             print(json.dumps(dOutputConfiguration, indent=2))
         else:
@@ -88,6 +93,91 @@ def display_rule_configuration(commandLineArguments, oConfig):
         sys.exit(fExitStatus)
 
 
+def run_stdin(commandLineArguments, oConfig):
+    '''
+    Fixes VHDL read from stdin and writes it to stdout.
+    Any violations which could not be fixed are written to stderr.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+    Returns:  Nothing
+    '''
+    if commandLineArguments.stdin:
+        sText, sEncoding = vhdlFile.utils.decode_vhdl_text(sys.stdin.buffer.read())
+        lFileContent = list(io.StringIO(sText, newline=None))
+        fExitStatus, lFixedLines, sOutputStd, sOutputErr = apply_rules.fix_text(commandLineArguments, oConfig, commandLineArguments.stdin, lFileContent)
+        sys.stdout.buffer.write(''.join(lFixedLines).encode(sEncoding))
+        sys.stdout.flush()
+        if sOutputStd:
+            print(sOutputStd, file=sys.stderr)
+        if sOutputErr:
+            print(sOutputErr, file=sys.stderr)
+        if commandLineArguments.profile:
+            profiler.write(commandLineArguments.profile)
+        sys.exit(fExitStatus)
+
+
+def run_server(commandLineArguments, oConfig):
+    '''
+    Analyzes files sent by vsg_client until the server is interrupted.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+    Returns:  Nothing
+    '''
+    if commandLineArguments.server:
+        server.serve(commandLineArguments.server, commandLineArguments, oConfig)
+        sys.exit(0)
+
+
+def restrict_to_changed_lines(commandLineArguments, oConfig):
+    '''
+    Removes files without changes from the files to analyze and stores the changed lines of the others in the configuration.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+    Returns:  Nothing
+    '''
+    if commandLineArguments.changed_since:
+        try:
+            oConfig.dChangedLines = changed_lines.get_changed_lines(commandLineArguments.changed_since)
+        except OSError as e:
+            print('ERROR: could not get the lines changed since ' + commandLineArguments.changed_since + ': ' + str(e))
+            sys.exit(1)
+        # Watch mode asks git again and filters the files every time they are analyzed
+        if not commandLineArguments.watch:
+            commandLineArguments.filename = changed_lines.filter_file_names(commandLineArguments.filename, oConfig.dChangedLines)
+
+
+def run_watch(commandLineArguments, oConfig):
+    '''
+    Analyzes files again whenever they change until interrupted.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+    Returns:  Nothing
+    '''
+    if commandLineArguments.watch:
+        watch.watch(commandLineArguments, oConfig)
+        sys.exit(0)
+
+
 def validate_files_exist_to_analyze(sName):
     if sName is None:
         print('ERROR: No file defined by the -f command line option or filename given in configuration file.')
@@ -101,6 +191,9 @@ def main():
 
     commandLineArguments = cmd_line_args.parse_command_line_arguments()
 
+    if commandLineArguments.profile:
+        profiler.enable()
+
     version.print_version(commandLineArguments)
 
     oConfig = config.New(commandLineArguments)
@@ -117,16 +210,24 @@ def main():
 
     display_rule_configuration(commandLineArguments, oConfig)
 
+    run_server(commandLineArguments, oConfig)
+
+    run_stdin(commandLineArguments, oConfig)
+
     validate_files_exist_to_analyze(commandLineArguments.filename)
 
+    restrict_to_changed_lines(commandLineArguments, oConfig)
+
+    run_watch(commandLineArguments, oConfig)
+
     dJson = create_json_dictionary()
 
-    f = functools.partial(apply_rules.apply_rules, commandLineArguments, oConfig)
-    # It's easier to debug when not using multiprocessing.Pool()
     lReturn = []
-    if commandLineArguments.jobs == 1:
+    iJobs = schedule.get_number_of_jobs(commandLineArguments.jobs, commandLineArguments.filename)
+    # It's easier to debug when not using multiprocessing.Pool()
+    if iJobs == 1:
         for iIndex, sFileName in enumerate(commandLineArguments.filename):
-            fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = f((iIndex, sFileName))
+            fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = apply_rules.apply_rules(commandLineArguments, oConfig, (iIndex, sFileName))
             lReturn.append((fStatus, testCase, dJsonEntry))
             if sOutputStd:
                 print(sOutputStd)
@@ -134,8 +235,11 @@ def main():
                 print(sOutputErr, file=sys.stderr)
 
     else:
-        with multiprocessing.Pool(commandLineArguments.jobs) as pool:
-            for tResult in pool.imap(f, enumerate(commandLineArguments.filename)):
+        # Files are scheduled largest first and results are reported in the original order
+        lBatches = schedule.create_batches(commandLineArguments.filename, iJobs)
+        # The configuration is handed to each worker once, so tasks only carry the file index and name
+        with multiprocessing.Pool(iJobs, apply_rules.initialize_worker, (commandLineArguments, oConfig)) as pool:
+            for tResult in schedule.collect_in_order(profiler.collect_from_workers(pool.imap_unordered(apply_rules.apply_rules_in_worker, lBatches))):
                 fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = tResult
                 lReturn.append((fStatus, testCase, dJsonEntry))
                 if sOutputStd:
@@ -161,6 +265,8 @@ def main():
         with open(commandLineArguments.json, 'w') as oFile:
             oFile.write(json.dumps(dJson, indent=2))
 
+    if commandLineArguments.profile:
+        profiler.write(commandLineArguments.profile)
 
     sys.exit(fExitStatus)
 
@@ -1,26 +1,73 @@
 
+import os
 import shutil
+import sys
 
+from . import cache
+from . import changed_lines
 from . import config
+from . import profiler
 from . import rule_list
 from . import utils
 from . import vhdlFile
 
+oRuleListFactory = None
+
+oWorkerCommandLineArguments = None
+oWorkerConfig = None
+
 
 def create_backup_file(sFileName):
     '''Copies existing file and adds .bak to the end.'''
     shutil.copy2(sFileName, sFileName + '.bak')
 
 
-def configure_rules(oConfig, oRules, configuration, iIndex, sFileName):
+def get_file_rule_configuration(configuration, sFileName):
+    '''
+    Returns the configuration given to a file in the file_list.
+
+    Parameters:
+
+      configuration: (configuration dictionary)
 
-    oRules.configure(oConfig)
+      sFileName: (string)
+
+    Returns: (config object) or None if the file does not have its own configuration
+    '''
     if is_filename_in_file_list(configuration, sFileName):
         iMyIndex = get_index_of_filename_in_file_list(configuration, sFileName)
-        oRuleConfig = config.config()
         if does_file_have_rule_configuration(configuration, iMyIndex, sFileName):
+            oRuleConfig = config.config()
             oRuleConfig.dConfig = configuration["file_list"][iMyIndex][sFileName]
-            oRules.configure(oRuleConfig)
+            return oRuleConfig
+    return None
+
+
+def create_rule_list(oVhdlFile, oConfig, sLocalRulesDirectory, sFileName):
+    '''
+    Returns a configured rule list for a file.
+    The rules are built once per process and reused for every file analyzed with the same configuration.
+
+    Parameters:
+
+      oVhdlFile: (vhdlFile object)
+
+      oConfig: (config object)
+
+      sLocalRulesDirectory: (string)
+
+      sFileName: (string)
+
+    Returns: (rule_list object)
+    '''
+    global oRuleListFactory
+    if oRuleListFactory is None or not oRuleListFactory.is_compatible(oConfig, sLocalRulesDirectory):
+        oRuleListFactory = rule_list.factory(oConfig, sLocalRulesDirectory)
+    try:
+        return oRuleListFactory.create(oVhdlFile, get_file_rule_configuration(oConfig.dConfig, sFileName))
+    except OSError:
+        oRuleListFactory = None
+        raise
 
 
 def is_filename_in_file_list(configuration, sFileName):
@@ -48,7 +95,7 @@ def does_file_have_rule_configuration(configuration, iMyIndex, sFileName):
 
 # This function is in a separate module from __main__ as a workaround for https://bugs.python.org/issue25053
 # see also https://stackoverflow.com/questions/41385708/multiprocessing-example-giving-attributeerror/42383397#42383397
-def apply_rules(commandLineArguments, oConfig, tIndexFileName):
+def apply_rules(commandLineArguments, oConfig, tIndexFileName, lFileContent=None):
     configuration = oConfig.dConfig
 
     dIndent = oConfig.dIndent
@@ -56,12 +103,26 @@ def apply_rules(commandLineArguments, oConfig, tIndexFileName):
 
     iIndex, sFileName = tIndexFileName
     dJsonEntry = {}
-    lFileContent, eError = vhdlFile.utils.read_vhdlfile(sFileName)
-    oVhdlFile = vhdlFile.vhdlFile(lFileContent, sFileName, eError)
-    oVhdlFile.set_indent_map(dIndent)
+
+    sFileDigest = None
+    sResultKey = None
+    if commandLineArguments.cache_dir is not None and lFileContent is None:
+        sFileDigest = cache.create_file_digest(sFileName)
+        sResultKey = create_result_key(commandLineArguments, oConfig, sFileName, sFileDigest)
+
+    if sResultKey is not None:
+        dResult = cache.read_result_cache(commandLineArguments.cache_dir, sResultKey)
+        if dResult is not None:
+            return replay_result(commandLineArguments, sFileName, dResult)
+
+    if lFileContent is None:
+        oVhdlFile = create_vhdlfile(sFileName, dIndent, commandLineArguments.cache_dir, sFileDigest)
+    else:
+        oVhdlFile = vhdlFile.vhdlFile(lFileContent, sFileName)
+        oVhdlFile.set_indent_map(dIndent)
     try:
-        oRules = rule_list.rule_list(
-            oVhdlFile, oConfig.severity_list, commandLineArguments.local_rules
+        oRules = create_rule_list(
+            oVhdlFile, oConfig, commandLineArguments.local_rules, sFileName
         )
     except OSError as e:
         sOutputStd = (
@@ -72,7 +133,7 @@ def apply_rules(commandLineArguments, oConfig, tIndexFileName):
         sOutputErr = None
         return 1, None, dJsonEntry, sOutputStd, sOutputErr
 
-    configure_rules(oConfig, oRules, configuration, iIndex, sFileName)
+    oRules.set_line_ranges(changed_lines.get_line_ranges(oConfig.dChangedLines, sFileName))
 
     if commandLineArguments.fix:
         if commandLineArguments.backup:
@@ -92,6 +153,9 @@ def apply_rules(commandLineArguments, oConfig, tIndexFileName):
     )
     fExitStatus = oRules.violations
 
+    if sResultKey is not None:
+        cache.write_result_cache(commandLineArguments.cache_dir, sResultKey, create_result(oRules))
+
     if commandLineArguments.junit:
         testCase = oRules.extract_junit_testcase(sFileName)
     else:
@@ -104,6 +168,226 @@ def apply_rules(commandLineArguments, oConfig, tIndexFileName):
     return fExitStatus, testCase, dJsonEntry, sOutputStd, sOutputErr
 
 
+def create_result_key(commandLineArguments, oConfig, sFileName, sFileDigest):
+    '''
+    Returns the key of the cached analysis results for a file.
+    Results are not cached when fixing or debugging, as both have side effects beyond the reported violations.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+      sFileName: (string)
+
+      sFileDigest: (string)
+
+    Returns: (string) or None if the results can not be cached
+    '''
+    configuration = oConfig.dConfig
+    if sFileDigest is None or commandLineArguments.fix or configuration.get('debug', False):
+        return None
+
+    dConfiguration = {}
+    for sKey in configuration:
+        if sKey != 'file_list':
+            dConfiguration[sKey] = configuration[sKey]
+    oRuleConfig = get_file_rule_configuration(configuration, sFileName)
+    if oRuleConfig is not None:
+        dConfiguration['file_list'] = oRuleConfig.dConfig
+
+    dOptions = {}
+    dOptions['all_phases'] = commandLineArguments.all_phases
+    dOptions['skip_phase'] = commandLineArguments.skip_phase
+    dOptions['indent'] = oConfig.dIndent
+    dOptions['line_ranges'] = changed_lines.get_line_ranges(oConfig.dChangedLines, sFileName)
+
+    sLocalRulesDigest = None
+    if commandLineArguments.local_rules:
+        sLocalRulesDigest = cache.create_directory_digest(commandLineArguments.local_rules)
+
+    return cache.create_result_key(sFileDigest, dConfiguration, dOptions, sLocalRulesDigest)
+
+
+def create_result(oRules):
+    '''
+    Returns the analysis results which are stored in the cache.
+
+    Parameters:
+
+      oRules: (rule_list object)
+
+    Returns: (dictionary)
+    '''
+    dResult = {}
+    dResult['status'] = oRules.violations
+    dResult['run_info'] = oRules.get_run_info()
+    dResult['junit'] = oRules.get_junit_failure_text()
+    dResult['violations'] = oRules.extract_violation_dictionary()['violations']
+    return dResult
+
+
+def replay_result(commandLineArguments, sFileName, dResult):
+    '''
+    Reports analysis results read from the cache as if the file had been analyzed.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      sFileName: (string)
+
+      dResult: (dictionary)
+
+    Returns: (boolean, junit testcase object, dictionary, string, string)
+    '''
+    dRunInfo = dResult['run_info']
+    dRunInfo['filename'] = sFileName
+    sOutputStd, sOutputErr = rule_list.print_output(dRunInfo, commandLineArguments.output_format)
+
+    if commandLineArguments.junit:
+        testCase = rule_list.create_junit_testcase(sFileName, dResult['junit'])
+    else:
+        testCase = None
+
+    dJsonEntry = {}
+    if commandLineArguments.json:
+        dJsonEntry["file_path"] = sFileName
+        dJsonEntry["violations"] = dResult['violations']
+
+    return dResult['status'], testCase, dJsonEntry, sOutputStd, sOutputErr
+
+
+def create_vhdlfile(sFileName, dIndent, sCacheDirectory=None, sFileDigest=None):
+    '''
+    Reads and classifies a VHDL file.
+    If a cache directory is given, the classified tokens are restored from it when the file has not changed.
+
+    Parameters:
+
+      sFileName: (string)
+
+      dIndent: (indent configuration dictionary)
+
+      sCacheDirectory: (string)
+
+      sFileDigest: (string)
+
+    Returns: (vhdlFile object)
+    '''
+    if sCacheDirectory is not None and sFileDigest is None:
+        sFileDigest = cache.create_file_digest(sFileName)
+
+    if sFileDigest is not None:
+        sKey = cache.create_parse_key(sFileDigest, dIndent)
+        lAllObjects = cache.read_parse_cache(sCacheDirectory, sKey)
+        if lAllObjects is not None:
+            oVhdlFile = vhdlFile.vhdlFile([], sFileName, lAllObjects=lAllObjects)
+            oVhdlFile.dIndentMap = dIndent
+            return oVhdlFile
+
+    with profiler.timer('open_file'):
+        oFileContent, eError = vhdlFile.utils.open_vhdlfile(sFileName)
+    oVhdlFile = vhdlFile.vhdlFile(oFileContent, sFileName, eError)
+    oVhdlFile.set_indent_map(dIndent)
+
+    if sFileDigest is not None and eError is None:
+        cache.write_parse_cache(sCacheDirectory, sKey, oVhdlFile.lAllObjects)
+
+    return oVhdlFile
+
+
+def fix_text(commandLineArguments, oConfig, sFileName, lFileContent):
+    '''
+    Fixes VHDL text and reports the violations which remain.
+    Nothing is read from or written to the filesystem.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+      sFileName: (string) the name used in the output and to look up file specific configuration
+
+      lFileContent: (list of strings)
+
+    Returns: (boolean, list of strings, string, string) the exit status, the fixed lines and the output
+    '''
+    oVhdlFile = vhdlFile.vhdlFile(lFileContent, sFileName)
+    oVhdlFile.set_indent_map(oConfig.dIndent)
+    try:
+        oRules = create_rule_list(oVhdlFile, oConfig, commandLineArguments.local_rules, sFileName)
+    except OSError as e:
+        sOutputStd = (
+            f"ERROR: encountered {e.__class__.__name__}, {e.args[1]} "
+            + commandLineArguments.local_rules
+            + " when trying to open local rules file."
+        )
+        return 1, lFileContent, sOutputStd, None
+
+    oRules.set_line_ranges(changed_lines.get_line_ranges(oConfig.dChangedLines, sFileName))
+
+    oRules.fix(commandLineArguments.fix_phase, commandLineArguments.skip_phase, oConfig.dFixOnly)
+
+    oRules.clear_violations()
+    oRules.check_rules(
+        bAllPhases=commandLineArguments.all_phases,
+        lSkipPhase=commandLineArguments.skip_phase,
+    )
+    sOutputStd, sOutputErr = oRules.report_violations(commandLineArguments.output_format)
+
+    lFixedLines = []
+    for sLine in oVhdlFile.get_lines()[1:]:
+        lFixedLines.append(sLine + '\n')
+
+    return oRules.violations, lFixedLines, sOutputStd, sOutputErr
+
+
+def initialize_worker(commandLineArguments, oConfig):
+    '''
+    Stores the command line arguments and configuration in a worker process.
+    This is used as the initializer of a multiprocessing.Pool so the configuration is sent to each worker once instead of with every file.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+    Returns: Nothing
+    '''
+    global oWorkerCommandLineArguments
+    global oWorkerConfig
+    oWorkerCommandLineArguments = commandLineArguments
+    oWorkerConfig = oConfig
+    if commandLineArguments.profile:
+        profiler.enable()
+    # Workers which are spawned instead of forked do not inherit the local rule path
+    if commandLineArguments.local_rules:
+        sLocalRulesPath = os.path.abspath(commandLineArguments.local_rules)
+        if sLocalRulesPath not in sys.path:
+            sys.path.append(sLocalRulesPath)
+
+
+def apply_rules_in_worker(lIndexFileNames):
+    '''
+    Applies rules to a batch of files using the configuration stored by initialize_worker.
+
+    Parameters:
+
+      lIndexFileNames: (list of (integer, string) tuples)
+
+    Returns: (list of (integer, apply_rules result) tuples, dictionary)
+      The dictionary holds the stages recorded while profiling the batch.
+    '''
+    lReturn = []
+    for tIndexFileName in lIndexFileNames:
+        lReturn.append((tIndexFileName[0], apply_rules(oWorkerCommandLineArguments, oWorkerConfig, tIndexFileName)))
+    return lReturn, profiler.collect()
+
+
 def write_vhdl_file(oVhdlFile):
     try:
         with open(oVhdlFile.filename, 'w') as oFile:
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+import argparse
+import json
+import sys
+
+from vsg import config
+from vsg import severity
+
+from vsg.benchmarks import generator
+from vsg.benchmarks import stages
+
+
+def parse_command_line_arguments():
+    '''Parses the command line arguments and returns them.'''
+
+    def check_positive(value):
+        iValue = int(value)
+        if iValue <= 0:
+            raise argparse.ArgumentTypeError(f"{value} is an invalid value, it must be at least 1")
+        return iValue
+
+    def check_not_negative(value):
+        iValue = int(value)
+        if iValue < 0:
+            raise argparse.ArgumentTypeError(f"{value} is an invalid value, it must be at least 0")
+        return iValue
+
+    parser = argparse.ArgumentParser(
+      prog='VHDL Style Guide (VSG) Benchmarks',
+      description='''Measures the time and memory used by each stage of VSG on synthetic VHDL of increasing size.''')
+
+    parser.add_argument('-l', '--lines', nargs='+', type=check_positive, default=[1000, 5000, 20000], help='Sizes of the synthetic VHDL in lines, add 200000 to measure very large files')
+    parser.add_argument('--ports', type=check_positive, default=8, help='Number of input and output ports of each entity, which is also the length of each port map')
+    parser.add_argument('--processes', type=check_not_negative, default=2, help='Number of processes in each architecture')
+    parser.add_argument('--depth', type=check_not_negative, default=3, help='Nesting depth of if, case and generate statements')
+    parser.add_argument('--generates', type=check_not_negative, default=1, help='Number of generate statements in each architecture')
+    parser.add_argument('--instances', type=check_not_negative, default=1, help='Number of instances in each architecture')
+    parser.add_argument('--no_violations', default=False, action='store_true', help='Generate VHDL without style violations')
+    parser.add_argument('--no_memory', default=False, action='store_true', help='Do not measure peak memory, which halves the run time')
+    parser.add_argument('-js', '--json', action='store', help='Write the results to a JSON file')
+
+    return parser.parse_args()
+
+
+def create_table(dResults):
+    '''
+    Returns the results formatted as a table.
+    The time per 1000 lines makes stages which grow faster than the number of lines stand out.
+
+    Parameters:
+
+      dResults: (dictionary of lists of (string, float, integer) tuples) results keyed by number of lines
+
+    Returns: (string)
+    '''
+    lReturn = []
+    lReturn.append(f'{"Lines":>8}  {"Stage":<24}  {"Time (s)":>10}  {"ms/kline":>10}  {"Peak (MiB)":>10}')
+    lReturn.append('-' * 70)
+    for iLines, lStages in dResults.items():
+        for sStage, fSeconds, iPeak in lStages:
+            fPerLine = fSeconds * 1000000 / iLines
+            if iPeak is None:
+                sPeak = '-'
+            else:
+                sPeak = f'{iPeak / 1048576:.2f}'
+            lReturn.append(f'{iLines:>8}  {sStage:<24}  {fSeconds:>10.4f}  {fPerLine:>10.3f}  {sPeak:>10}')
+        lReturn.append('')
+    return '\n'.join(lReturn)
+
+
+def main():
+    '''Main routine of the benchmarks'''
+
+    commandLineArguments = parse_command_line_arguments()
+
+    oConfig = config.config()
+    oConfig.dConfig = {'debug': False}
+    oConfig.dIndent = config.read_indent_configuration(oConfig.dConfig)
+    oConfig.severity_list = severity.create_list(oConfig.dConfig)
+
+    dResults = {}
+    for iLines in commandLineArguments.lines:
+        lLines = generator.create_design(
+            iLines,
+            iPorts=commandLineArguments.ports,
+            iProcesses=commandLineArguments.processes,
+            iDepth=commandLineArguments.depth,
+            iGenerates=commandLineArguments.generates,
+            iInstances=commandLineArguments.instances,
+            bViolations=not commandLineArguments.no_violations
+        )
+        dResults[len(lLines)] = stages.run_stages(lLines, oConfig, not commandLineArguments.no_memory)
+        print(f'INFO: measured {len(lLines)} lines', file=sys.stderr)
+
+    print(create_table(dResults))
+
+    if commandLineArguments.json:
+        dOutput = {}
+        for iLines, lStages in dResults.items():
+            dOutput[str(iLines)] = []
+            for sStage, fSeconds, iPeak in lStages:
+                dOutput[str(iLines)].append({'stage': sStage, 'seconds': fSeconds, 'peak_bytes': iPeak})
+        with open(commandLineArguments.json, 'w') as oFile:
+            oFile.write(json.dumps(dOutput, indent=2))
+
+
+if __name__ == '__main__':
+    main()
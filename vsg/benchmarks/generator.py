@@ -0,0 +1,245 @@
+
+def create_design(iLines, iPorts=8, iProcesses=2, iDepth=3, iGenerates=1, iInstances=1, bViolations=True):
+    '''
+    Creates synthetic VHDL with at least the requested number of lines.
+
+    The design is a chain of entities, each one instantiating the entity before it.
+    Entities are added until the number of lines is reached.
+
+    Parameters:
+
+      iLines: (integer)
+
+      iPorts: (integer) number of input and output ports of each entity, which is also the length of each port map
+
+      iProcesses: (integer) number of clocked processes in each architecture
+
+      iDepth: (integer) nesting depth of the if and case statements in processes and of the generate statements
+
+      iGenerates: (integer) number of generate statements in each architecture
+
+      iInstances: (integer) number of instances in each architecture
+
+      bViolations: (boolean) if True, every other entity is written with style violations which can be fixed
+
+    Returns: (list of strings) the lines of the design, each ending with a newline
+    '''
+    lReturn = []
+    iEntity = 0
+    while len(lReturn) < iLines:
+        lReturn.extend(create_entity(iEntity, iPorts, iProcesses, iDepth, iGenerates, iInstances, bViolations and iEntity % 2 == 1))
+        iEntity += 1
+    return [sLine + '\n' for sLine in lReturn]
+
+
+def create_entity(iEntity, iPorts, iProcesses, iDepth, iGenerates, iInstances, bViolations):
+    '''
+    Returns the lines of an entity and its architecture.
+
+    Parameters:
+
+      iEntity: (integer)
+
+      iPorts: (integer)
+
+      iProcesses: (integer)
+
+      iDepth: (integer)
+
+      iGenerates: (integer)
+
+      iInstances: (integer)
+
+      bViolations: (boolean)
+
+    Returns: (list of strings)
+    '''
+    sName = 'ent' + str(iEntity)
+    lReturn = []
+    lReturn.append('library ieee;')
+    lReturn.append('  use ieee.std_logic_1164.all;')
+    lReturn.append('')
+    lReturn.append('entity ' + sName + ' is')
+    lReturn.append('  port (')
+    lReturn.append('    clk : in    std_logic;')
+    lReturn.append('    rst : in    std_logic;')
+    for iPort in range(0, iPorts):
+        lReturn.append('    i_data' + str(iPort) + ' : in    std_logic_vector(7 downto 0);')
+    for iPort in range(0, iPorts):
+        sEnd = ';'
+        if iPort == iPorts - 1:
+            sEnd = ''
+        lReturn.append('    o_data' + str(iPort) + ' : out   std_logic_vector(7 downto 0)' + sEnd)
+    lReturn.append('  );')
+    lReturn.append('end entity ' + sName + ';')
+    lReturn.append('')
+    lReturn.append('architecture rtl of ' + sName + ' is')
+    lReturn.append('')
+    for iPort in range(0, iPorts):
+        lReturn.append('  signal s_data' + str(iPort) + ' : std_logic_vector(7 downto 0);')
+    lReturn.append('  signal s_gen : std_logic_vector(3 downto 0);')
+    lReturn.append('')
+    lReturn.append('begin')
+    lReturn.append('')
+
+    for iProcess in range(0, iProcesses):
+        lReturn.extend(create_process(iProcess, iPorts, iDepth, bViolations))
+        lReturn.append('')
+
+    for iGenerate in range(0, iGenerates):
+        lReturn.extend(create_generate('gen' + str(iGenerate), iDepth, '  '))
+        lReturn.append('')
+
+    if iEntity > 0:
+        for iInstance in range(0, iInstances):
+            lReturn.extend(create_instance('ent' + str(iEntity - 1), iInstance, iPorts, bViolations))
+            lReturn.append('')
+
+    for iPort in range(0, iPorts):
+        lReturn.append('  o_data' + str(iPort) + ' <= s_data' + str(iPort) + ';')
+    lReturn.append('')
+    lReturn.append('end architecture rtl;')
+    lReturn.append('')
+    return lReturn
+
+
+def create_process(iProcess, iPorts, iDepth, bViolations):
+    '''
+    Returns the lines of a clocked process with nested if and case statements.
+
+    Parameters:
+
+      iProcess: (integer)
+
+      iPorts: (integer)
+
+      iDepth: (integer)
+
+      bViolations: (boolean)
+
+    Returns: (list of strings)
+    '''
+    sLabel = 'proc' + str(iProcess)
+    lReturn = []
+    if bViolations:
+        lReturn.append('  ' + sLabel + ' : PROCESS(clk,rst) IS')
+        lReturn.append('  BEGIN')
+        lReturn.append('    IF(rst=\'1\')THEN')
+    else:
+        lReturn.append('  ' + sLabel + ' : process (clk, rst) is')
+        lReturn.append('  begin')
+        lReturn.append('    if (rst = \'1\') then')
+    for iPort in range(0, iPorts):
+        lReturn.append('      s_data' + str(iPort) + ' <= (others => \'0\');')
+    lReturn.append('    elsif rising_edge(clk) then')
+    lReturn.extend(create_sequential_statements(iDepth, iPorts, '      ', iProcess))
+    if bViolations:
+        lReturn.append('    END IF;')
+        lReturn.append('  END PROCESS ' + sLabel + ';')
+    else:
+        lReturn.append('    end if;')
+        lReturn.append('  end process ' + sLabel + ';')
+    return lReturn
+
+
+def create_sequential_statements(iDepth, iPorts, sIndent, iSeed):
+    '''
+    Returns nested if and case statements, alternating between the two at each level.
+
+    Parameters:
+
+      iDepth: (integer)
+
+      iPorts: (integer)
+
+      sIndent: (string)
+
+      iSeed: (integer) selects which ports are assigned
+
+    Returns: (list of strings)
+    '''
+    sTarget = 's_data' + str(iSeed % iPorts)
+    sSource = 'i_data' + str((iSeed + iDepth) % iPorts)
+    if iDepth == 0:
+        return [sIndent + sTarget + ' <= ' + sSource + ';']
+
+    lReturn = []
+    if iDepth % 2 == 1:
+        lReturn.append(sIndent + 'if (' + sSource + '(' + str(iDepth % 8) + ') = \'1\') then')
+        lReturn.extend(create_sequential_statements(iDepth - 1, iPorts, sIndent + '  ', iSeed + 1))
+        lReturn.append(sIndent + 'else')
+        lReturn.append(sIndent + '  ' + sTarget + ' <= not ' + sSource + ';')
+        lReturn.append(sIndent + 'end if;')
+    else:
+        lReturn.append(sIndent + 'case ' + sSource + '(1 downto 0) is')
+        lReturn.append(sIndent + '  when "00" =>')
+        lReturn.extend(create_sequential_statements(iDepth - 1, iPorts, sIndent + '    ', iSeed + 1))
+        lReturn.append(sIndent + '  when others =>')
+        lReturn.append(sIndent + '    ' + sTarget + ' <= ' + sSource + ';')
+        lReturn.append(sIndent + 'end case;')
+    return lReturn
+
+
+def create_generate(sLabel, iDepth, sIndent):
+    '''
+    Returns nested for and if generate statements, alternating between the two at each level.
+
+    Parameters:
+
+      sLabel: (string)
+
+      iDepth: (integer)
+
+      sIndent: (string)
+
+    Returns: (list of strings)
+    '''
+    lReturn = []
+    if iDepth % 2 == 1:
+        lReturn.append(sIndent + sLabel + ' : for g' + str(iDepth) + ' in 0 to 3 generate')
+    else:
+        lReturn.append(sIndent + sLabel + ' : if (s_gen(' + str(iDepth % 4) + ') = \'1\') generate')
+    if iDepth > 1:
+        lReturn.extend(create_generate(sLabel + '_' + str(iDepth - 1), iDepth - 1, sIndent + '  '))
+    else:
+        lReturn.append(sIndent + '  s_gen(0) <= clk;')
+    lReturn.append(sIndent + 'end generate ' + sLabel + ';')
+    return lReturn
+
+
+def create_instance(sEntity, iInstance, iPorts, bViolations):
+    '''
+    Returns the lines of an instance with a port map connecting every port.
+
+    Parameters:
+
+      sEntity: (string)
+
+      iInstance: (integer)
+
+      iPorts: (integer)
+
+      bViolations: (boolean)
+
+    Returns: (list of strings)
+    '''
+    lReturn = []
+    lReturn.append('  u_' + sEntity + '_' + str(iInstance) + ' : entity work.' + sEntity)
+    if bViolations:
+        lReturn.append('    PORT MAP(')
+    else:
+        lReturn.append('    port map (')
+    lReturn.append('      clk => clk,')
+    lReturn.append('      rst => rst,')
+    for iPort in range(0, iPorts):
+        lReturn.append('      i_data' + str(iPort) + ' => s_data' + str(iPort) + ',')
+    for iPort in range(0, iPorts):
+        sEnd = ','
+        if iPort == iPorts - 1:
+            sEnd = ''
+        if bViolations:
+            lReturn.append('      o_data' + str(iPort) + '=>open' + sEnd)
+        else:
+            lReturn.append('      o_data' + str(iPort) + ' => open' + sEnd)
+    lReturn.append('    );')
+    return lReturn
@@ -0,0 +1,156 @@
+
+import time
+import tracemalloc
+
+from vsg import rule_list
+
+from vsg.vhdlFile import lexer
+from vsg.vhdlFile import vhdlFile
+
+from vsg.vhdlFile.vhdlFile import combine_use_clause_selected_name
+from vsg.vhdlFile.vhdlFile import post_token_assignments
+from vsg.vhdlFile.vhdlFile import set_token_hierarchy_value
+
+from vsg.vhdlFile.classify import design_file
+
+from vsg.vhdlFile.indent.set_token_indent import set_token_indent
+
+from vsg.token_map import process_tokens
+
+
+def create_stages(lLines, oConfig, dState=None):
+    '''
+    Returns the stages VSG goes through when fixing a file.
+    The stages share their state and must be run in order.
+
+    Parameters:
+
+      lLines: (list of strings)
+
+      oConfig: (config object)
+
+      dState: (dictionary) holds the state shared by the stages, so it can be inspected after they run
+
+    Returns: (list of (string, function) tuples)
+    '''
+    if dState is None:
+        dState = {}
+
+    def create_objects():
+        dVars = {}
+        dVars['pragma'] = False
+        dState['lAllObjects'] = lexer.create_objects(lLines, ['--vhdl_comp_off'], ['--vhdl_comp_on'], dVars)
+
+    def classify_design_file():
+        design_file.tokenize(dState['lAllObjects'])
+
+    def assign_tokens():
+        lAllObjects = dState['lAllObjects']
+        post_token_assignments(lAllObjects)
+        lAllObjects = combine_use_clause_selected_name(lAllObjects)
+        set_token_hierarchy_value(lAllObjects)
+        dState['lAllObjects'] = lAllObjects
+
+    def create_token_map():
+        process_tokens(dState['lAllObjects'])
+
+    def indent_tokens():
+        set_token_indent(oConfig.dIndent, dState['lAllObjects'])
+
+    def create_rule_list():
+        oFile = vhdlFile([], lAllObjects=dState['lAllObjects'])
+        oFile.dIndentMap = oConfig.dIndent
+        oRules = rule_list.rule_list(oFile, oConfig.severity_list)
+        oRules.configure(oConfig)
+        dState['oRules'] = oRules
+
+    lReturn = []
+    lReturn.append(('lexer.create_objects', create_objects))
+    lReturn.append(('design_file.tokenize', classify_design_file))
+    lReturn.append(('post_token_assignments', assign_tokens))
+    lReturn.append(('process_tokens', create_token_map))
+    lReturn.append(('set_token_indent', indent_tokens))
+    lReturn.append(('rule_list', create_rule_list))
+
+    for iPhase in range(1, 8):
+        lReturn.append(('check_rules phase ' + str(iPhase), create_check_phase(dState, iPhase)))
+
+    for iPhase in range(1, 8):
+        lReturn.append(('fix phase ' + str(iPhase), create_fix_phase(dState, iPhase)))
+
+    return lReturn
+
+
+def create_check_phase(dState, iPhase):
+
+    def check_phase():
+        oRules = dState['oRules']
+        lSkipPhase = [iSkip for iSkip in range(1, 8) if iSkip != iPhase]
+        oRules.check_rules(bAllPhases=True, lSkipPhase=lSkipPhase)
+        oRules.clear_violations()
+
+    return check_phase
+
+
+def create_fix_phase(dState, iPhase):
+
+    def fix_phase():
+        dState['oRules'].fix_phase(iPhase)
+
+    return fix_phase
+
+
+def load_rules(oConfig):
+    '''
+    Imports every rule, so the time and memory of the first stage which uses a rule do not include importing it.
+
+    Parameters:
+
+      oConfig: (config object)
+
+    Returns: Nothing
+    '''
+    oRules = rule_list.rule_list(vhdlFile([], lAllObjects=[]), oConfig.severity_list)
+    for oRule in oRules.rules:
+        oRule.get_rule()
+
+
+def run_stages(lLines, oConfig, bMemory=True):
+    '''
+    Runs every stage and measures the time and memory used by each.
+
+    The stages are run twice when measuring memory.
+    Tracing memory allocations slows python down considerably, so the times are taken from a run without tracing.
+    Every rule is imported before the stages are run.
+
+    Parameters:
+
+      lLines: (list of strings)
+
+      oConfig: (config object)
+
+      bMemory: (boolean)
+
+    Returns: (list of (string, float, integer) tuples)
+      The name of the stage, the time in seconds and the peak memory allocated during the stage in bytes.
+      The peak memory is None when bMemory is False.
+    '''
+    load_rules(oConfig)
+
+    lReturn = []
+    for sStage, fStage in create_stages(lLines, oConfig):
+        fStart = time.perf_counter()
+        fStage()
+        lReturn.append([sStage, time.perf_counter() - fStart, None])
+
+    if bMemory:
+        for iStage, tStage in enumerate(create_stages(lLines, oConfig)):
+            tracemalloc.start()
+            try:
+                tStage[1]()
+                iCurrent, iPeak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            lReturn[iStage][2] = iPeak
+
+    return [tuple(lStage) for lStage in lReturn]
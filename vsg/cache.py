@@ -0,0 +1,247 @@
+
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+
+from . import version
+
+from .vhdlFile import token_store
+
+sSourceDigest = None
+
+
+def create_file_digest(sFileName):
+    '''
+    Returns a hash of the contents of a file.
+
+    Parameters:
+
+      sFileName: (string)
+
+    Returns: (string) or None if the file could not be read
+    '''
+    oHash = hashlib.sha256()
+    try:
+        with open(sFileName, 'rb') as oFile:
+            for bChunk in iter(lambda: oFile.read(1048576), b''):
+                oHash.update(bChunk)
+    except OSError:
+        return None
+    return oHash.hexdigest()
+
+
+def create_directory_digest(sDirectoryName):
+    '''
+    Returns a hash of the python files in a directory.
+
+    Parameters:
+
+      sDirectoryName: (string)
+
+    Returns: (string)
+    '''
+    oHash = hashlib.sha256()
+    try:
+        lFileNames = sorted(os.listdir(sDirectoryName))
+    except OSError:
+        return None
+    for sFileName in lFileNames:
+        if sFileName.endswith('.py'):
+            oHash.update(sFileName.encode('utf-8'))
+            oHash.update(str(create_file_digest(os.path.join(sDirectoryName, sFileName))).encode('utf-8'))
+    return oHash.hexdigest()
+
+
+def get_source_digest():
+    '''
+    Returns a hash of the python files of the vsg package, excluding the tests.
+    The hash is calculated once per process.
+
+    Returns: (string)
+    '''
+    global sSourceDigest
+    if sSourceDigest is None:
+        oHash = hashlib.sha256()
+        sPackageDirectory = os.path.dirname(os.path.abspath(__file__))
+        for sDirectory, lDirectories, lFileNames in os.walk(sPackageDirectory):
+            lDirectories[:] = sorted(sName for sName in lDirectories if sName not in ('tests', '__pycache__'))
+            for sFileName in sorted(lFileNames):
+                if sFileName.endswith('.py'):
+                    sPath = os.path.join(sDirectory, sFileName)
+                    oHash.update(os.path.relpath(sPath, sPackageDirectory).encode('utf-8'))
+                    oHash.update(str(create_file_digest(sPath)).encode('utf-8'))
+        sSourceDigest = oHash.hexdigest()
+    return sSourceDigest
+
+
+def create_key(*lValues):
+    '''
+    Combines the vsg version, a hash of the vsg sources and any number of values into a single cache key.
+    Including the sources makes entries written by a modified checkout of vsg, which keeps the same version, misses.
+
+    Parameters:
+
+      lValues: (json serializable objects)
+
+    Returns: (string)
+    '''
+    oHash = hashlib.sha256()
+    oHash.update(str(version.sVersion).encode('utf-8'))
+    oHash.update(str(version.sShaNum).encode('utf-8'))
+    oHash.update(get_source_digest().encode('utf-8'))
+    for value in lValues:
+        oHash.update(json.dumps(value, sort_keys=True, default=str).encode('utf-8'))
+    return oHash.hexdigest()
+
+
+def create_parse_key(sFileDigest, dIndent):
+    '''
+    Returns the key used to store the classified tokens of a file.
+
+    Parameters:
+
+      sFileDigest: (string)
+
+      dIndent: (indent configuration dictionary)
+
+    Returns: (string)
+    '''
+    return create_key('parse', sFileDigest, dIndent)
+
+
+def create_result_key(sFileDigest, dConfiguration, dOptions, sLocalRulesDigest):
+    '''
+    Returns the key used to store the violations found in a file.
+
+    Parameters:
+
+      sFileDigest: (string)
+
+      dConfiguration: (configuration dictionary applied to the file)
+
+      dOptions: (dictionary of command line options which alter the analysis)
+
+      sLocalRulesDigest: (string)
+
+    Returns: (string)
+    '''
+    return create_key('result', sFileDigest, dConfiguration, dOptions, sLocalRulesDigest)
+
+
+def get_cache_file_name(sCacheDirectory, sCategory, sKey):
+    return os.path.join(sCacheDirectory, sCategory, sKey)
+
+
+def read_parse_cache(sCacheDirectory, sKey):
+    '''
+    Returns the classified tokens stored under the key.
+
+    Parameters:
+
+      sCacheDirectory: (string)
+
+      sKey: (string)
+
+    Returns: (list of token objects) or None if the key is not in the cache
+    '''
+    sFileName = get_cache_file_name(sCacheDirectory, 'parse', sKey)
+    try:
+        with open(sFileName, 'rb') as oFile:
+            oTokenStore = token_store.from_bytes(zlib.decompress(oFile.read()))
+        return oTokenStore.create_objects()
+    except (OSError, zlib.error, ValueError, IndexError, AttributeError, ImportError):
+        return None
+
+
+def write_parse_cache(sCacheDirectory, sKey, lAllObjects):
+    '''
+    Stores the classified tokens of a file under the key.
+    The tokens are stored as a token_store.
+    Entries are data only and are never unpickled, as the cache directory may be shared.
+
+    Parameters:
+
+      sCacheDirectory: (string)
+
+      sKey: (string)
+
+      lAllObjects: (list of token objects)
+
+    Returns: Nothing
+    '''
+    try:
+        bData = zlib.compress(token_store.create(lAllObjects).to_bytes(), 1)
+    except (TypeError, ValueError):
+        return
+    write_cache_file(get_cache_file_name(sCacheDirectory, 'parse', sKey), bData)
+
+
+def write_cache_file(sFileName, bData):
+    '''
+    Writes a cache entry.
+    The entry is written to a temporary file and then renamed so parallel jobs never read a partial entry.
+    Failures are ignored as the cache is only an optimization.
+
+    Parameters:
+
+      sFileName: (string)
+
+      bData: (bytes)
+
+    Returns: Nothing
+    '''
+    sDirectory = os.path.dirname(sFileName)
+    try:
+        os.makedirs(sDirectory, exist_ok=True)
+        iHandle, sTempFileName = tempfile.mkstemp(dir=sDirectory)
+    except OSError:
+        return
+    try:
+        with os.fdopen(iHandle, 'wb') as oFile:
+            oFile.write(bData)
+        os.replace(sTempFileName, sFileName)
+    except OSError:
+        try:
+            os.remove(sTempFileName)
+        except OSError:
+            pass
+
+
+def read_result_cache(sCacheDirectory, sKey):
+    '''
+    Returns the analysis results stored under the key.
+
+    Parameters:
+
+      sCacheDirectory: (string)
+
+      sKey: (string)
+
+    Returns: (dictionary) or None if the key is not in the cache
+    '''
+    sFileName = get_cache_file_name(sCacheDirectory, 'result', sKey)
+    try:
+        with open(sFileName) as oFile:
+            return json.load(oFile)
+    except (OSError, ValueError):
+        return None
+
+
+def write_result_cache(sCacheDirectory, sKey, dResult):
+    '''
+    Stores the analysis results of a file under the key.
+
+    Parameters:
+
+      sCacheDirectory: (string)
+
+      sKey: (string)
+
+      dResult: (dictionary)
+
+    Returns: Nothing
+    '''
+    bData = json.dumps(dResult).encode('utf-8')
+    write_cache_file(get_cache_file_name(sCacheDirectory, 'result', sKey), bData)
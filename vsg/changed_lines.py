@@ -0,0 +1,191 @@
+
+import bisect
+import os
+import re
+import subprocess
+import sys
+
+from . import parser
+
+reHunkHeader = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+def run_git(lArguments):
+    '''
+    Runs a git command and returns its output.
+
+    Parameters:
+
+      lArguments: (list of strings)
+
+    Returns: (string)
+    '''
+    oResult = subprocess.run(['git', '-c', 'core.quotePath=false'] + lArguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
+    if oResult.returncode != 0:
+        raise OSError(oResult.stderr.strip())
+    return oResult.stdout
+
+
+def parse_diff(lLines):
+    '''
+    Extracts the lines added or modified in each file from the output of git diff --unified=0.
+
+    Parameters:
+
+      lLines: (list of strings)
+
+    Returns: (dictionary of lists of (integer, integer) tuples)
+      The keys are the file names given in the diff.
+      The tuples are the first and last line of each range of changed lines.
+      Files which only had lines removed are not included.
+    '''
+    dReturn = {}
+    sFileName = None
+    for sLine in lLines:
+        if sLine.startswith('+++ '):
+            if sLine.startswith('+++ b/'):
+                sFileName = sLine[6:].rstrip('\n')
+            else:
+                sFileName = None
+            continue
+        if sFileName is None:
+            continue
+        oMatch = reHunkHeader.match(sLine)
+        if oMatch is None:
+            continue
+        iStart = int(oMatch.group(1))
+        if oMatch.group(2) is None:
+            iLength = 1
+        else:
+            iLength = int(oMatch.group(2))
+        if iLength == 0:
+            continue
+        dReturn.setdefault(sFileName, []).append((iStart, iStart + iLength - 1))
+    return dReturn
+
+
+def get_changed_lines(sRevision):
+    '''
+    Asks git which lines changed in the working tree since a revision.
+    Files which are not tracked by git, and not ignored, are treated as entirely changed.
+
+    Parameters:
+
+      sRevision: (string)
+
+    Returns: (dictionary of lists of (integer, integer) tuples)
+      The keys are the real paths of the files.
+    '''
+    sTopLevel = run_git(['rev-parse', '--show-toplevel']).strip()
+
+    sDiff = run_git(['-C', sTopLevel, 'diff', '--unified=0', '--no-color', '--no-ext-diff', '--no-renames', sRevision, '--'])
+    dReturn = {}
+    for sFileName, lRanges in parse_diff(sDiff.splitlines()).items():
+        dReturn[os.path.realpath(os.path.join(sTopLevel, sFileName))] = lRanges
+
+    sUntracked = run_git(['-C', sTopLevel, 'ls-files', '--others', '--exclude-standard'])
+    for sFileName in sUntracked.splitlines():
+        dReturn[os.path.realpath(os.path.join(sTopLevel, sFileName))] = [(1, sys.maxsize)]
+
+    return dReturn
+
+
+def get_line_ranges(dChangedLines, sFileName):
+    '''
+    Returns the ranges of changed lines in a file.
+
+    Parameters:
+
+      dChangedLines: (dictionary returned by get_changed_lines) or None
+
+      sFileName: (string)
+
+    Returns: (list of (integer, integer) tuples) or None if every line should be analyzed
+    '''
+    if dChangedLines is None:
+        return None
+    return dChangedLines.get(os.path.realpath(sFileName), [])
+
+
+def filter_file_names(lFileNames, dChangedLines):
+    '''
+    Returns the files which have changed lines.
+
+    Parameters:
+
+      lFileNames: (list of strings)
+
+      dChangedLines: (dictionary returned by get_changed_lines)
+
+    Returns: (list of strings)
+    '''
+    lReturn = []
+    for sFileName in lFileNames:
+        if len(get_line_ranges(dChangedLines, sFileName)) > 0:
+            lReturn.append(sFileName)
+    return lReturn
+
+
+def is_line_in_ranges(iLineNumber, lRanges):
+    '''
+    Checks if a line is within any of a sorted list of ranges.
+
+    Parameters:
+
+      iLineNumber: (integer)
+
+      lRanges: (list of (integer, integer) tuples)
+
+    Returns: (boolean)
+    '''
+    iIndex = bisect.bisect_right(lRanges, (iLineNumber, sys.maxsize)) - 1
+    if iIndex < 0:
+        return False
+    return iLineNumber <= lRanges[iIndex][1]
+
+
+def get_tokens_in_ranges(lTokens, lRanges):
+    '''
+    Returns the tokens on the lines within a sorted list of ranges.
+
+    Parameters:
+
+      lTokens: (list of token objects)
+
+      lRanges: (list of (integer, integer) tuples)
+
+    Returns: (set of token objects)
+    '''
+    setReturn = set()
+    iLine = 1
+    for oToken in lTokens:
+        if is_line_in_ranges(iLine, lRanges):
+            setReturn.add(oToken)
+        if oToken.category & parser.iCarriageReturn:
+            iLine += 1
+    return setReturn
+
+
+def get_ranges_of_tokens(lTokens, setTokens):
+    '''
+    Returns the ranges of lines which hold any of a set of tokens.
+
+    Parameters:
+
+      lTokens: (list of token objects)
+
+      setTokens: (set of token objects)
+
+    Returns: (list of (integer, integer) tuples)
+    '''
+    lReturn = []
+    iLine = 1
+    for oToken in lTokens:
+        if oToken in setTokens:
+            if len(lReturn) > 0 and lReturn[-1][1] >= iLine - 1:
+                lReturn[-1] = (lReturn[-1][0], iLine)
+            else:
+                lReturn.append((iLine, iLine))
+        if oToken.category & parser.iCarriageReturn:
+            iLine += 1
+    return lReturn
@@ -25,6 +25,11 @@ def parse_command_line_arguments():
             raise argparse.ArgumentTypeError(f"{value} is an invalid value for number of jobs")
         return iValue
 
+    def check_jobs(value):
+        if value.strip() == 'auto':
+            return 'auto'
+        return check_strict_positive(value)
+
     parser = argparse.ArgumentParser(
       prog='VHDL Style Guide (VSG)',
       description='''Analyzes VHDL files for style guide violations.
@@ -50,10 +55,16 @@ def parse_command_line_arguments():
         "-p",
         "--jobs",
         action="store",
-        default=os.cpu_count(),
-        type=check_strict_positive,
-        help="number of parallel jobs to use, default is the number of cpu cores",
+        default='auto',
+        type=check_jobs,
+        help="number of parallel jobs to use, default is auto which picks a number based on the cpu cores and size of the files",
     )
+    parser.add_argument('--cache_dir', default=None, action='store', help='Directory used to cache results between runs')
+    parser.add_argument('--changed_since', default=None, action='store', metavar='REVISION', help='Only report violations on lines changed since a git revision')
+    parser.add_argument('--stdin', nargs='?', const='stdin', default=None, metavar='FILENAME', help='Fix VHDL read from stdin and write it to stdout, FILENAME is used in messages')
+    parser.add_argument('--watch', default=False, action='store_true', help='Analyze files again whenever they change')
+    parser.add_argument('--server', default=None, action='store', metavar='SOCKET', help='Analyze files sent by vsg_client over a Unix domain socket')
+    parser.add_argument('--profile', default=None, action='store', metavar='FILE', help='Write the time spent in each stage and rule to a JSON file')
     parser.add_argument('--debug', default=False, action='store_true', help='Displays verbose debug information')
 
     args_ = parser.parse_args()
@@ -61,7 +72,7 @@ def parse_command_line_arguments():
     validate_backup_argument(args_)
     validate_ap_argument(args_)
 
-    if sys.platform == "win32":
+    if sys.platform == "win32" and args_.jobs != 'auto':
         # Work around https://bugs.python.org/issue26903
         args_.jobs = min(args_.jobs, 60)
 
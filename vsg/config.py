@@ -216,13 +216,16 @@ def New(commandLineArguments):
     else:
         oReturn.dFixOnly = None
 
+    oReturn.dChangedLines = None
+
     return oReturn
 
 
 class config():
 
     def __init__(self):
-        dIndent = None
-        dConfig = None
-        dFixOnly = None
-        severity_list = None
+        self.dIndent = None
+        self.dConfig = None
+        self.dFixOnly = None
+        self.dChangedLines = None
+        self.severity_list = None
@@ -1,33 +1,126 @@
 
+import builtins
+
 ###############################################################################
 # Base object
 ###############################################################################
 
 
-class item():
+lTokenTypes = []
+
+tEmpty = ()
+
+tAllCodeTags = ('all',)
+
+dCodeTags = {(): tEmpty, tAllCodeTags: tAllCodeTags}
+
+iWhitespace = 1
+iCarriageReturn = 2
+iComment = 4
+iBlankLine = 8
+iPreprocessor = 16
+iKeyword = 32
+
+iWhitespaceCategories = iWhitespace | iCarriageReturn | iBlankLine | iPreprocessor
+iWhitespaceOrCommentCategories = iWhitespaceCategories | iComment
+
+
+def extract_unique_id(oClass):
+    '''
+    Returns the base and sub token names from the unique_id line of the docstring of a token class.
+
+    Parameters:
+
+      oClass: (class)
+
+    Returns: (string, string) or (None, None) if the docstring does not have a unique_id
+    '''
+    try:
+        lDoc = oClass.__doc__.split()
+        for iDoc, sDoc in enumerate(lDoc):
+            if sDoc == 'unique_id':
+                return lDoc[iDoc + 2], lDoc[iDoc + 4]
+        return None, None
+    except AttributeError:
+        return None, None
+
+
+def register_token_type(oClass):
+    '''
+    Sets the token identity of a class.
+    The identity is read from the docstring once, when the class is created, instead of every time a token is created.
+    Each class also gets a small integer which is its index in lTokenTypes.
+
+    The category of a class is a bitmask combining the category_flag of the class and of all the classes it inherits from.
+    Checking the category replaces several isinstance calls with a single bitwise and.
+
+    The type_ids of a class are the type_id of the class and of all the token classes it inherits from.
+    Checking if the type_id of a class is in the type_ids of a token gives the same answer as isinstance.
+
+    Parameters:
+
+      oClass: (class)
+
+    Returns: Nothing
+    '''
+    oClass.base_token, oClass.sub_token = extract_unique_id(oClass)
+    oClass.type_id = len(lTokenTypes)
+    oClass.category = 0
+    for oBaseClass in oClass.__mro__:
+        oClass.category |= vars(oBaseClass).get('category_flag', 0)
+    oClass.type_ids = frozenset(oBaseClass.type_id for oBaseClass in oClass.__mro__ if 'type_id' in vars(oBaseClass))
+    lTokenTypes.append(oClass)
+
+
+def intern_code_tags(lCodeTags):
+    '''
+    Returns a tuple with the code tags.
+    Equal lists of code tags return the same tuple, so tokens with the same code tags share it.
+
+    Parameters:
+
+      lCodeTags: (list of strings)
+
+    Returns: (tuple of strings)
+    '''
+    tCodeTags = tuple(lCodeTags)
+    try:
+        return dCodeTags[tCodeTags]
+    except KeyError:
+        return dCodeTags.setdefault(tCodeTags, tCodeTags)
+
+
+class token_class(builtins.type):
+    '''
+    Metaclass of all tokens.
+    Adds an empty __slots__ to every token class which does not declare its own.
+    This keeps the attributes of a token in the slots declared by the item class instead of in a dictionary per token.
+    '''
+
+    def __new__(mcs, sName, tBases, dNamespace, **kwargs):
+        dNamespace.setdefault('__slots__', ())
+        return super().__new__(mcs, sName, tBases, dNamespace, **kwargs)
+
+
+class item(metaclass=token_class):
     '''
     unique_id = parser : item
     '''
 
+    __slots__ = ('value', 'indent', 'hierarchy', 'context', 'code_tags', 'filename')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        register_token_type(cls)
+
     def __init__(self, sString):
         self.value = sString
         self.indent = None
         self.hierarchy = None
-        self.context = []
-        self.code_tags = []
-        self.base_token, self.sub_token = self.update_token_types()
+        self.context = tEmpty
+        self.code_tags = tEmpty
         self.filename = None
 
-    def update_token_types(self):
-        try:
-            lDoc = self.__doc__.split()
-            for iDoc, sDoc in enumerate(lDoc):
-                if sDoc == 'unique_id':
-                    return lDoc[iDoc + 2], lDoc[iDoc + 4]
-            return None, None
-        except AttributeError:
-            return None, None
-
     def get_value(self):
         return self.value
 
@@ -50,29 +143,31 @@ class item():
         return self.hierarchy
 
     def add_context(self, sContext):
-        self.context.extend(sContext)
+        self.context = self.context + tuple(sContext)
 
     def pop_context(self):
-        return self.context.pop()
+        sReturn = self.context[-1]
+        self.context = self.context[:-1]
+        return sReturn
 
     def get_context(self):
         return self.context
 
     def set_code_tags(self, lCodeTags):
-        self.code_tags = lCodeTags.copy()
+        self.code_tags = intern_code_tags(lCodeTags)
 
     def has_code_tag(self, sCodeTag):
-        if self.code_tags == ['all']:
+        if self.code_tags == tAllCodeTags:
             return True
         if sCodeTag in self.code_tags:
             return True
         return False
 
     def clear_code_tags(self):
-        self.code_tags = []
+        self.code_tags = tEmpty
 
     def set_all_code_tags(self):
-        self.code_tags = ['all']
+        self.code_tags = tAllCodeTags
 
     def get_unique_id(self, sJoin=None):
         if sJoin is None:
@@ -92,6 +187,9 @@ class item():
         return self.filename
 
 
+register_token_type(item)
+
+
 class todo(item):
     '''
     unique_id = parser : todo
@@ -109,6 +207,8 @@ class preprocessor(item):
     unique_id = parser : preprocessor
     '''
 
+    category_flag = iPreprocessor
+
     def __init__(self, sString):
         item.__init__(self, sString)
 
@@ -208,6 +308,8 @@ class carriage_return(item):
     unique_id = parser : carriage_return
     '''
 
+    category_flag = iCarriageReturn
+
     def __init__(self):
         item.__init__(self, '\n')
 
@@ -217,6 +319,8 @@ class blank_line(item):
     unique_id = parser : blank_line
     '''
 
+    category_flag = iBlankLine
+
     def __init__(self):
         item.__init__(self, '')
 
@@ -235,6 +339,8 @@ class keyword(item):
     unique_id = parser : keyword
     '''
 
+    category_flag = iKeyword
+
     def __init__(self, sString):
         item.__init__(self, sString)
 
@@ -289,6 +395,8 @@ class whitespace(item):
     unique_id = parser : whitespace
     '''
 
+    category_flag = iWhitespace
+
     def __init__(self, sString):
         item.__init__(self, sString)
 
@@ -298,6 +406,8 @@ class comment(item):
     unique_id = parser : comment
     '''
 
+    category_flag = iComment
+
     def __init__(self, sString):
         item.__init__(self, sString)
 
@@ -0,0 +1,204 @@
+
+import json
+import sys
+import time
+
+bEnabled = False
+
+dStages = {}
+
+
+def enable():
+    '''
+    Starts recording the time spent in each stage.
+    Anything recorded previously is discarded.
+
+    Returns: Nothing
+    '''
+    global bEnabled
+    bEnabled = True
+    dStages.clear()
+
+
+def record(sStage, fSeconds, iCalls=1):
+    '''
+    Adds time spent in a stage.
+
+    Parameters:
+
+      sStage: (string)
+
+      fSeconds: (float)
+
+      iCalls: (integer)
+
+    Returns: Nothing
+    '''
+    try:
+        lStage = dStages[sStage]
+    except KeyError:
+        lStage = [0, 0.0]
+        dStages[sStage] = lStage
+    lStage[0] += iCalls
+    lStage[1] += fSeconds
+
+
+def timer(sStage, *lDetails, iCalls=1):
+    '''
+    Returns a context manager which records the time spent in a with block when profiling is enabled.
+
+    The name of the stage is the stage and the details joined by spaces.
+    The name is only built when profiling is enabled, so timers in loops cost little when it is not.
+
+    Parameters:
+
+      sStage: (string)
+
+      lDetails: (objects) added to the name of the stage, such as a rule or phase
+
+      iCalls: (integer) the number of calls the block represents
+
+    Returns: (context manager)
+    '''
+    if not bEnabled:
+        return oDisabledTimer
+    return stage_timer(sStage, lDetails, iCalls)
+
+
+class stage_timer():
+    '''
+    Records the time spent in a with block.
+
+    Parameters:
+
+      sStage: (string)
+
+      lDetails: (tuple of objects)
+
+      iCalls: (integer)
+    '''
+
+    def __init__(self, sStage, lDetails, iCalls):
+        self.sStage = sStage
+        self.lDetails = lDetails
+        self.iCalls = iCalls
+        self.fStart = None
+
+    def __enter__(self):
+        self.fStart = time.perf_counter()
+        return self
+
+    def __exit__(self, oType, oValue, oTraceback):
+        fSeconds = time.perf_counter() - self.fStart
+        sStage = self.sStage
+        for oDetail in self.lDetails:
+            sStage += ' ' + str(oDetail)
+        record(sStage, fSeconds, self.iCalls)
+        return False
+
+
+class disabled_timer():
+    '''
+    Does nothing, so a single instance is returned by timer while profiling is disabled.
+    '''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, oType, oValue, oTraceback):
+        return False
+
+
+oDisabledTimer = disabled_timer()
+
+
+def collect():
+    '''
+    Returns the stages recorded so far and starts recording again from zero.
+    This is used to hand the stages recorded in a worker process to the main process.
+
+    Returns: (dictionary)
+    '''
+    dReturn = dict(dStages)
+    dStages.clear()
+    return dReturn
+
+
+def merge(dOtherStages):
+    '''
+    Adds stages recorded in another process.
+
+    Parameters:
+
+      dOtherStages: (dictionary returned by collect)
+
+    Returns: Nothing
+    '''
+    for sStage, lStage in dOtherStages.items():
+        record(sStage, lStage[1], lStage[0])
+
+
+def collect_from_workers(iterBatches):
+    '''
+    Merges the stages recorded by workers and yields their results.
+
+    Parameters:
+
+      iterBatches: (iterable of (list, dictionary) tuples) as returned by apply_rules.apply_rules_in_worker
+
+    Returns: (generator of lists)
+    '''
+    for lResults, dWorkerStages in iterBatches:
+        merge(dWorkerStages)
+        yield lResults
+
+
+def get_sorted_stages():
+    '''
+    Returns the stages ordered by the total time spent in them, largest first.
+
+    Returns: (list of (string, integer, float) tuples)
+    '''
+    lReturn = []
+    for sStage, lStage in dStages.items():
+        lReturn.append((sStage, lStage[0], lStage[1]))
+    lReturn.sort(key=lambda tStage: (-tStage[2], tStage[0]))
+    return lReturn
+
+
+def create_table():
+    '''
+    Returns the stages formatted as a table.
+
+    Returns: (string)
+    '''
+    lStages = get_sorted_stages()
+    iWidth = max([len('Stage')] + [len(tStage[0]) for tStage in lStages])
+    lReturn = []
+    lReturn.append(f'{"Stage":<{iWidth}}  {"Calls":>9}  {"Total (s)":>10}  {"Mean (ms)":>10}')
+    lReturn.append('-' * (iWidth + 35))
+    for sStage, iCalls, fSeconds in lStages:
+        fMean = fSeconds * 1000 / max(1, iCalls)
+        lReturn.append(f'{sStage:<{iWidth}}  {iCalls:>9}  {fSeconds:>10.4f}  {fMean:>10.4f}')
+    return '\n'.join(lReturn)
+
+
+def write(sFileName):
+    '''
+    Writes the stages to a JSON file and prints them as a table to stderr.
+    Times include the time spent in any stages nested inside them.
+
+    Parameters:
+
+      sFileName: (string)
+
+    Returns: Nothing
+    '''
+    dOutput = {}
+    for sStage, iCalls, fSeconds in get_sorted_stages():
+        dOutput[sStage] = {}
+        dOutput[sStage]['calls'] = iCalls
+        dOutput[sStage]['seconds'] = fSeconds
+    with open(sFileName, 'w') as oFile:
+        oFile.write(json.dumps(dOutput, indent=2))
+    print(create_table(), file=sys.stderr)
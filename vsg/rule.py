@@ -1,5 +1,7 @@
 
 
+from vsg import changed_lines
+from vsg import profiler
 from vsg import severity
 from vsg import utils
 
@@ -23,6 +25,8 @@ class Rule():
         self.dFix['violations'] = {}
         self.configuration = ['indentSize', 'phase', 'disable', 'fixable', 'severity']
         self.depricated = False
+        self.lLineRanges = None
+        self.oCodeTagRegions = None
 
     def configure(self, oConfig):
         '''Configures attributes on rules using a dictionary of the following form:
@@ -94,11 +98,13 @@ class Rule():
         Applies fixes for any rule violations.
         '''
         if self.fixable:
-            self.analyze(oFile)
+            with profiler.timer('rule.analyze', self.unique_id):
+                self.analyze(oFile)
             self._print_debug_message('Fixing rule: ' + self.unique_id)
             self._filter_out_fix_only_violations(dFixOnly)
-            for oViolation in self.violations[::-1]:
-                self._fix_violation(oViolation)
+            with profiler.timer('rule._fix_violation', self.unique_id, iCalls=len(self.violations)):
+                for oViolation in self.violations[::-1]:
+                    self._fix_violation(oViolation)
             oFile.update(self.violations)
             self.clear_violations()
 
@@ -121,9 +127,34 @@ class Rule():
     def add_violation(self, violation):
         '''
         Adds a linenumber to a violations list.
+        Violations outside of the line ranges set by set_line_ranges are dropped.
         '''
-        if not violation.has_code_tag(self.unique_id):
-            self.violations.append(violation)
+        if violation.has_code_tag(self.unique_id, self.oCodeTagRegions):
+            return
+        if self.lLineRanges is not None and not changed_lines.is_line_in_ranges(violation.get_line_number(), self.lLineRanges):
+            return
+        self.violations.append(violation)
+
+    def set_line_ranges(self, lLineRanges):
+        '''
+        Restricts violations to ranges of lines.
+
+        Parameters:
+
+          lLineRanges: (list of (integer, integer) tuples) or None to report violations on every line
+        '''
+        self.lLineRanges = lLineRanges
+
+    def set_code_tag_regions(self, oCodeTagRegions):
+        '''
+        Sets the code tag regions of the file being analyzed.
+        Violations are checked against the regions instead of each of their tokens.
+
+        Parameters:
+
+          oCodeTagRegions: (code_tags.regions object) or None to check the tokens of each violation
+        '''
+        self.oCodeTagRegions = oCodeTagRegions
 
     def analyze(self, oFile):
         '''
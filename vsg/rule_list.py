@@ -1,11 +1,14 @@
 
+import copy
 import os
 import importlib
 import inspect
 
 from . import depricated_rule
 from . import junit
+from . import profiler
 from . import report
+from . import rule_registry
 from . import utils
 from . import severity
 
@@ -65,20 +68,14 @@ def load_local_rules(sDirectoryName):
 
 def load_rules():
     '''
-    Loads rules from the vsg/rules directory.
+    Loads rules listed in the manifest of the vsg/rules directory.
+    Each rule is imported when it is first needed.
 
     Parameters:  None
 
-    Returns:  (rule object list)
+    Returns:  (rule_proxy object list)
     '''
-    lRules = []
-    for name, oPackage in inspect.getmembers(importlib.import_module('vsg.rules')):
-        if inspect.ismodule(oPackage):
-            for name, oRule in inspect.getmembers(oPackage):
-                if inspect.isclass(oRule) and name.startswith('rule_'):
-                    lRules.append(oRule())
-
-    return lRules
+    return rule_registry.create_proxies()
 
 
 def maximum_phase(lRules):
@@ -142,18 +139,46 @@ class rule_list():
                     self.oVhdlFile.set_token_indent()
                 continue
 
-            for subphase in range(0, 5):
-                lRules = self.get_rules_in_phase(phase)
-                lRules = self.get_rules_in_subphase(lRules, subphase)
-                lRules = filter_out_disabled_rules(lRules)
+            self.fix_phase(phase, dFixOnly)
+
+    def fix_phase(self, iPhase, dFixOnly=None):
+        '''
+        Applies fixes to all violations found by the rules in a single phase.
+
+        Parameters:
+
+          iPhase : (integer)
+
+          dFixOnly : (fix list dictionary)
+        '''
+        for subphase in range(0, 5):
+            lRules = self.get_rules_in_phase(iPhase)
+            lRules = self.get_rules_in_subphase(lRules, subphase)
+            lRules = filter_out_disabled_rules(lRules)
+            with profiler.timer('rule_list.fix phase', iPhase, 'subphase', subphase):
                 for oRule in lRules:
+                    self.prepare_rule(oRule)
                     if oRule.severity.type == severity.error_type:
                         oRule.fix(self.oVhdlFile, dFixOnly)
                     else:
-                        oRule.analyze(self.oVhdlFile)
+                        with profiler.timer('rule.analyze', oRule.unique_id):
+                            oRule.analyze(self.oVhdlFile)
 
-            if phase == 1:
-                self.oVhdlFile.fix_blank_lines()
+        if iPhase == 1:
+            self.oVhdlFile.fix_blank_lines()
+
+    def prepare_rule(self, oRule):
+        '''
+        Passes the code tag regions and the changed lines of the file to a rule.
+
+        Parameters:
+
+          oRule : (rule object)
+
+        Returns: Nothing
+        '''
+        oRule.set_code_tag_regions(self.oVhdlFile.get_code_tag_regions())
+        oRule.set_line_ranges(self.oVhdlFile.get_line_ranges())
 
     def get_rules_in_phase(self, iPhaseNumber):
         '''
@@ -213,11 +238,14 @@ class rule_list():
                 lRules = self.get_rules_in_subphase(lRules, subphase)
                 lRules = filter_out_disabled_rules(lRules)
 
-                for oRule in lRules:
-                    oRule.analyze(self.oVhdlFile)
-                    if oRule.severity.type == severity.error_type:
-                        iFailures += len(oRule.violations)
-                    self.iNumberRulesRan += 1
+                with profiler.timer('rule_list.check_rules phase', phase, 'subphase', subphase):
+                    for oRule in lRules:
+                        self.prepare_rule(oRule)
+                        with profiler.timer('rule.analyze', oRule.unique_id):
+                            oRule.analyze(self.oVhdlFile)
+                        if oRule.severity.type == severity.error_type:
+                            iFailures += len(oRule.violations)
+                        self.iNumberRulesRan += 1
                 self.lastPhaseRan = phase
                 if iFailures > 0:
                     self.violations = True
@@ -233,7 +261,14 @@ class rule_list():
 
           sOutputFormat (string)
         '''
-#        print('--> report_violations')
+        return print_output(self.get_run_info(), sOutputFormat)
+
+    def get_run_info(self):
+        '''
+        Returns a dictionary summarizing the violations found.
+
+        Returns: (dictionary)
+        '''
         dRunInfo = {}
         dRunInfo['filename'] = self.oVhdlFile.filename
         dRunInfo['stopPhase'] = 7
@@ -242,7 +277,6 @@ class rule_list():
         for oRule in self.rules:
             if oRule.has_violations():
                 lViolations = oRule.get_violations()
-#                    print(f'{oRule.name}_{oRule.identifier} | {iLineNumber} | {len(lViolations)}')
                 dRunInfo['violations'].extend(lViolations)
         dRunInfo['violations'] = sorted(dRunInfo['violations'], key=lambda x: int(x['lineNumber']))
         dRunInfo['stopPhase'] = self.lastPhaseRan
@@ -257,14 +291,7 @@ class rule_list():
             name = dViolation['severity']['name']
             dRunInfo['severities'][name] = dRunInfo['severities'][name] + 1
 
-#        print(dRunInfo)
-        if sOutputFormat == 'vsg':
-            sOutputStd, sOutputErr = report.vsg_stdout.print_output(dRunInfo)
-        elif sOutputFormat == 'syntastic':
-            sOutputStd, sOutputErr = report.syntastic_stdout.print_output(dRunInfo)
-        else:
-            sOutputStd, sOutputErr = report.summary_stdout.print_output(dRunInfo)
-        return sOutputStd, sOutputErr
+        return dRunInfo
 
     def configure(self, oConfig):
         '''
@@ -327,18 +354,23 @@ class rule_list():
 
         Returns: (junit testcase object)
         '''
-        oTestcase = junit.testcase(sVhdlFileName, str(0), 'failure')
-        oFailure = junit.failure('Failure')
+        return create_junit_testcase(sVhdlFileName, self.get_junit_failure_text())
+
+    def get_junit_failure_text(self):
+        '''
+        Returns a line of text for every error found.
+
+        Returns: (list of strings)
+        '''
+        lReturn = []
         for oRule in self.rules:
             if len(oRule.violations) > 0 and oRule.severity.type == severity.error_type:
                 for dViolation in oRule.violations:
                     sLine = oRule.name + '_' + oRule.identifier + ': '
                     sLine += str(utils.get_violation_line_number(dViolation)) + ' : '
                     sLine += dViolation.get_solution()
-                    oFailure.add_text(sLine)
-        oTestcase.add_failure(oFailure)
-
-        return oTestcase
+                    lReturn.append(sLine)
+        return lReturn
 
     def extract_violation_dictionary(self):
         '''
@@ -380,10 +412,178 @@ class rule_list():
         for oRule in self.rules:
             oRule.clear_violations()
 
+    def set_line_ranges(self, lLineRanges):
+        '''
+        Restricts the violations reported by every rule to ranges of lines.
+        The ranges are kept by the file, which moves them when fixes insert or remove lines.
+
+        Parameters:
+
+          lLineRanges: (list of (integer, integer) tuples) or None to report violations on every line
+        '''
+        self.oVhdlFile.set_line_ranges(lLineRanges)
+        for oRule in self.rules:
+            oRule.set_line_ranges(lLineRanges)
+
+    def reset(self, oVhdlFile):
+        '''
+        Prepares the rule list to analyze another file.
+        The configuration of the rules is kept, but any line ranges are removed.
+
+        Parameters:
+
+          oVhdlFile: (vhdlFile object)
+        '''
+        self.oVhdlFile = oVhdlFile
+        self.iNumberRulesRan = 0
+        self.lastPhaseRan = 0
+        self.violations = False
+        self.clear_violations()
+        self.set_line_ranges(None)
+
+    def copy(self):
+        '''
+        Returns a copy of the rule list which can be configured without affecting this one.
+
+        Returns: (rule_list object)
+        '''
+        oReturn = copy.copy(self)
+        oReturn.rules = []
+        for oRule in self.rules:
+            oNewRule = copy.copy(oRule)
+            oNewRule.clear_violations()
+            oReturn.rules.append(oNewRule)
+        return oReturn
+
+    def get_rule(self, sUniqueId):
+        '''
+        Returns the rule with the given unique id.
+
+        Parameters:
+
+          sUniqueId: (string)
+
+        Returns: (rule object) or None if the rule does not exist
+        '''
+        for oRule in self.rules:
+            if oRule.unique_id == sUniqueId:
+                return oRule
+        return None
+
+    def load_enabled_rules(self):
+        '''
+        Imports every enabled rule now instead of when it is first analyzed.
+        '''
+        for oRule in filter_out_disabled_rules(self.rules):
+            if isinstance(oRule, rule_registry.rule_proxy):
+                oRule.get_rule()
+
     def get_number_of_rules_ran(self):
         return self.iNumberRulesRan
 
 
+class factory():
+    '''
+    Creates rule lists for multiple files.
+    The rules are loaded and configured once, when the first rule list is created.
+    Every file then reuses the configured rules.
+    Files with their own configuration in the file_list get a copy with that configuration applied on top.
+
+    Parameters:
+
+      oConfig: (config object)
+
+      sLocalRulesDirectory: (string) (optional)
+    '''
+    def __init__(self, oConfig, sLocalRulesDirectory=None):
+        self.oConfig = oConfig
+        self.sLocalRulesDirectory = sLocalRulesDirectory
+        self.oRules = None
+
+    def is_compatible(self, oConfig, sLocalRulesDirectory=None):
+        '''
+        Returns True if rule lists for the configuration can be created by this factory.
+
+        Parameters:
+
+          oConfig: (config object)
+
+          sLocalRulesDirectory: (string)
+
+        Returns: (boolean)
+        '''
+        if oConfig is self.oConfig:
+            return sLocalRulesDirectory == self.sLocalRulesDirectory
+        return sLocalRulesDirectory == self.sLocalRulesDirectory and oConfig.dConfig == self.oConfig.dConfig
+
+    def create(self, oVhdlFile, oFileConfig=None):
+        '''
+        Returns a configured rule list for a file.
+
+        Parameters:
+
+          oVhdlFile: (vhdlFile object)
+
+          oFileConfig: (config object)
+            Configuration which only applies to this file.
+
+        Returns: (rule_list object)
+        '''
+        if self.oRules is None:
+            self.oRules = rule_list(oVhdlFile, self.oConfig.severity_list, self.sLocalRulesDirectory)
+            self.oRules.configure(self.oConfig)
+
+        if oFileConfig is None:
+            oReturn = self.oRules
+        else:
+            oReturn = self.oRules.copy()
+        oReturn.reset(oVhdlFile)
+
+        if oFileConfig is not None:
+            oReturn.configure(oFileConfig)
+
+        return oReturn
+
+
+def print_output(dRunInfo, sOutputFormat):
+    '''
+    Formats the violations summarized in a run information dictionary.
+
+    Parameters:
+
+      dRunInfo (dictionary)
+
+      sOutputFormat (string)
+
+    Returns: (string, string)
+    '''
+    if sOutputFormat == 'vsg':
+        return report.vsg_stdout.print_output(dRunInfo)
+    elif sOutputFormat == 'syntastic':
+        return report.syntastic_stdout.print_output(dRunInfo)
+    return report.summary_stdout.print_output(dRunInfo)
+
+
+def create_junit_testcase(sVhdlFileName, lFailureText):
+    '''
+    Creates a JUnit testcase from lines of failure text.
+
+    Parameters:
+
+      sVhdlFileName (string)
+
+      lFailureText (list of strings)
+
+    Returns: (junit testcase object)
+    '''
+    oTestcase = junit.testcase(sVhdlFileName, str(0), 'failure')
+    oFailure = junit.failure('Failure')
+    for sLine in lFailureText:
+        oFailure.add_text(sLine)
+    oTestcase.add_failure(oFailure)
+    return oTestcase
+
+
 def filter_out_disabled_rules(lRules):
     '''
     Removes rules which are disabled from a list of rule objects.
@@ -402,6 +602,8 @@ def filter_out_disabled_rules(lRules):
 
 
 def is_rule_depricated(oRule):
+    if isinstance(oRule, rule_registry.rule_proxy):
+        return oRule.depricated
     if isinstance(oRule, depricated_rule.Depricated):
         return True
     return False
@@ -0,0 +1,636 @@
+# This file is generated by running:
+#
+#   python -m vsg.rule_registry
+#
+# Run it again after adding, removing or changing the defaults of a rule.
+
+lRules = [
+    {'name': 'after', 'identifier': '001', 'package': 'after', 'class': 'rule_001', 'phase': 1, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'magnitude', 'units']},
+    {'name': 'after', 'identifier': '002', 'package': 'after', 'class': 'rule_002', 'phase': 5, 'subphase': 2, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group']},
+    {'name': 'after', 'identifier': '003', 'package': 'after', 'class': 'rule_003', 'phase': 1, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'magnitude', 'units']},
+    {'name': 'architecture', 'identifier': '001', 'package': 'architecture', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '003', 'package': 'architecture', 'class': 'rule_003', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'architecture', 'identifier': '004', 'package': 'architecture', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'architecture', 'identifier': '005', 'package': 'architecture', 'class': 'rule_005', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '006', 'package': 'architecture', 'class': 'rule_006', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '007', 'package': 'architecture', 'class': 'rule_007', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '008', 'package': 'architecture', 'class': 'rule_008', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '009', 'package': 'architecture', 'class': 'rule_009', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'architecture', 'identifier': '010', 'package': 'architecture', 'class': 'rule_010', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'architecture', 'identifier': '011', 'package': 'architecture', 'class': 'rule_011', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'architecture', 'identifier': '012', 'package': 'architecture', 'class': 'rule_012', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '013', 'package': 'architecture', 'class': 'rule_013', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'architecture', 'identifier': '014', 'package': 'architecture', 'class': 'rule_014', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'architecture', 'identifier': '015', 'package': 'architecture', 'class': 'rule_015', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'architecture', 'identifier': '016', 'package': 'architecture', 'class': 'rule_016', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'architecture', 'identifier': '017', 'package': 'architecture', 'class': 'rule_017', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'architecture', 'identifier': '018', 'package': 'architecture', 'class': 'rule_018', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'architecture', 'identifier': '019', 'package': 'architecture', 'class': 'rule_019', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'architecture', 'identifier': '020', 'package': 'architecture', 'class': 'rule_020', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'architecture', 'identifier': '021', 'package': 'architecture', 'class': 'rule_021', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'architecture', 'identifier': '022', 'package': 'architecture', 'class': 'rule_022', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '024', 'package': 'architecture', 'class': 'rule_024', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'architecture', 'identifier': '025', 'package': 'architecture', 'class': 'rule_025', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'names']},
+    {'name': 'architecture', 'identifier': '026', 'package': 'architecture', 'class': 'rule_026', 'phase': 5, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'architecture', 'identifier': '027', 'package': 'architecture', 'class': 'rule_027', 'phase': 5, 'subphase': 4, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment', 'include_lines_without_comments']},
+    {'name': 'architecture', 'identifier': '028', 'package': 'architecture', 'class': 'rule_028', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'architecture', 'identifier': '029', 'package': 'architecture', 'class': 'rule_029', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'architecture', 'identifier': '030', 'package': 'architecture', 'class': 'rule_030', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '031', 'package': 'architecture', 'class': 'rule_031', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '032', 'package': 'architecture', 'class': 'rule_032', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '033', 'package': 'architecture', 'class': 'rule_033', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '200', 'package': 'architecture', 'class': 'rule_200', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'architecture', 'identifier': '600', 'package': 'architecture', 'class': 'rule_600', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'architecture', 'identifier': '601', 'package': 'architecture', 'class': 'rule_601', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'assert', 'identifier': '001', 'package': 'assert_statement', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'assert', 'identifier': '002', 'package': 'assert_statement', 'class': 'rule_002', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'assert', 'identifier': '003', 'package': 'assert_statement', 'class': 'rule_003', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'assert', 'identifier': '004', 'package': 'assert_statement', 'class': 'rule_004', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'assert', 'identifier': '005', 'package': 'assert_statement', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'assert', 'identifier': '400', 'package': 'assert_statement', 'class': 'rule_400', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'alignment']},
+    {'name': 'attribute', 'identifier': '001', 'package': 'attribute', 'class': 'rule_001', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'attribute', 'identifier': '002', 'package': 'attribute', 'class': 'rule_002', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'attribute_declaration', 'identifier': '100', 'package': 'attribute_declaration', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'attribute_declaration', 'identifier': '101', 'package': 'attribute_declaration', 'class': 'rule_101', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'attribute_declaration', 'identifier': '300', 'package': 'attribute_declaration', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'attribute_declaration', 'identifier': '500', 'package': 'attribute_declaration', 'class': 'rule_500', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'attribute_declaration', 'identifier': '501', 'package': 'attribute_declaration', 'class': 'rule_501', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'attribute_declaration', 'identifier': '502', 'package': 'attribute_declaration', 'class': 'rule_502', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'attribute_specification', 'identifier': '100', 'package': 'attribute_specification', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'attribute_specification', 'identifier': '101', 'package': 'attribute_specification', 'class': 'rule_101', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'attribute_specification', 'identifier': '300', 'package': 'attribute_specification', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'attribute_specification', 'identifier': '500', 'package': 'attribute_specification', 'class': 'rule_500', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'attribute_specification', 'identifier': '501', 'package': 'attribute_specification', 'class': 'rule_501', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'attribute_specification', 'identifier': '502', 'package': 'attribute_specification', 'class': 'rule_502', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'attribute_specification', 'identifier': '503', 'package': 'attribute_specification', 'class': 'rule_503', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'block', 'identifier': '001', 'package': 'block', 'class': 'rule_001', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '002', 'package': 'block', 'class': 'rule_002', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'block', 'identifier': '003', 'package': 'block', 'class': 'rule_003', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '004', 'package': 'block', 'class': 'rule_004', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '005', 'package': 'block', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '006', 'package': 'block', 'class': 'rule_006', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '007', 'package': 'block', 'class': 'rule_007', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'block', 'identifier': '100', 'package': 'block', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '101', 'package': 'block', 'class': 'rule_101', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '200', 'package': 'block', 'class': 'rule_200', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'block', 'identifier': '201', 'package': 'block', 'class': 'rule_201', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'block', 'identifier': '202', 'package': 'block', 'class': 'rule_202', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'block', 'identifier': '203', 'package': 'block', 'class': 'rule_203', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'block', 'identifier': '204', 'package': 'block', 'class': 'rule_204', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'block', 'identifier': '205', 'package': 'block', 'class': 'rule_205', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'block', 'identifier': '300', 'package': 'block', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '301', 'package': 'block', 'class': 'rule_301', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '302', 'package': 'block', 'class': 'rule_302', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'block', 'identifier': '400', 'package': 'block', 'class': 'rule_400', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'block', 'identifier': '401', 'package': 'block', 'class': 'rule_401', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'block', 'identifier': '500', 'package': 'block', 'class': 'rule_500', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'block', 'identifier': '501', 'package': 'block', 'class': 'rule_501', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'block', 'identifier': '502', 'package': 'block', 'class': 'rule_502', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'block', 'identifier': '503', 'package': 'block', 'class': 'rule_503', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'block', 'identifier': '504', 'package': 'block', 'class': 'rule_504', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'block', 'identifier': '505', 'package': 'block', 'class': 'rule_505', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'block', 'identifier': '506', 'package': 'block', 'class': 'rule_506', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'block', 'identifier': '600', 'package': 'block', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'block', 'identifier': '601', 'package': 'block', 'class': 'rule_601', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'block_comment', 'identifier': '001', 'package': 'block_comment', 'class': 'rule_001', 'phase': 1, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'min_height', 'allow_indenting', 'header_left', 'header_left_repeat', 'header_string', 'header_right_repeat', 'header_alignment', 'max_header_column']},
+    {'name': 'block_comment', 'identifier': '002', 'package': 'block_comment', 'class': 'rule_002', 'phase': 1, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'min_height', 'allow_indenting', 'comment_left']},
+    {'name': 'block_comment', 'identifier': '003', 'package': 'block_comment', 'class': 'rule_003', 'phase': 1, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'min_height', 'allow_indenting', 'footer_left', 'footer_left_repeat', 'footer_string', 'footer_right_repeat', 'footer_alignment', 'max_footer_column']},
+    {'name': 'case', 'identifier': '001', 'package': 'case', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '002', 'package': 'case', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '003', 'package': 'case', 'class': 'rule_003', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '004', 'package': 'case', 'class': 'rule_004', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '005', 'package': 'case', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '006', 'package': 'case', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '007', 'package': 'case', 'class': 'rule_007', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'case', 'identifier': '008', 'package': 'case', 'class': 'rule_008', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'case', 'identifier': '009', 'package': 'case', 'class': 'rule_009', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'case', 'identifier': '010', 'package': 'case', 'class': 'rule_010', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'case', 'identifier': '011', 'package': 'case', 'class': 'rule_011', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '012', 'package': 'case', 'class': 'rule_012', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '013', 'package': 'case', 'class': 'rule_013', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '014', 'package': 'case', 'class': 'rule_014', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'case', 'identifier': '015', 'package': 'case', 'class': 'rule_015', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'case', 'identifier': '016', 'package': 'case', 'class': 'rule_016', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'case', 'identifier': '017', 'package': 'case', 'class': 'rule_017', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'case', 'identifier': '018', 'package': 'case', 'class': 'rule_018', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'case', 'identifier': '019', 'package': 'case', 'class': 'rule_019', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '020', 'package': 'case', 'class': 'rule_020', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'case', 'identifier': '021', 'package': 'case', 'class': 'rule_021', 'phase': 4, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'comment', 'identifier': '004', 'package': 'comment', 'class': 'rule_004', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'comment', 'identifier': '010', 'package': 'comment', 'class': 'rule_010', 'phase': 4, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'comment', 'identifier': '011', 'package': 'comment', 'class': 'rule_011', 'phase': 1, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'comment', 'identifier': '100', 'package': 'comment', 'class': 'rule_100', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '001', 'package': 'component', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '002', 'package': 'component', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '003', 'package': 'component', 'class': 'rule_003', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'component', 'identifier': '004', 'package': 'component', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'component', 'identifier': '005', 'package': 'component', 'class': 'rule_005', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '006', 'package': 'component', 'class': 'rule_006', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'component', 'identifier': '007', 'package': 'component', 'class': 'rule_007', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '008', 'package': 'component', 'class': 'rule_008', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'component', 'identifier': '009', 'package': 'component', 'class': 'rule_009', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '010', 'package': 'component', 'class': 'rule_010', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'component', 'identifier': '011', 'package': 'component', 'class': 'rule_011', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '012', 'package': 'component', 'class': 'rule_012', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'component', 'identifier': '013', 'package': 'component', 'class': 'rule_013', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '014', 'package': 'component', 'class': 'rule_014', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'component', 'identifier': '016', 'package': 'component', 'class': 'rule_016', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'component', 'identifier': '017', 'package': 'component', 'class': 'rule_017', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'component', 'identifier': '018', 'package': 'component', 'class': 'rule_018', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'component', 'identifier': '019', 'package': 'component', 'class': 'rule_019', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'component', 'identifier': '020', 'package': 'component', 'class': 'rule_020', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment', 'include_lines_without_comments']},
+    {'name': 'component', 'identifier': '021', 'package': 'component', 'class': 'rule_021', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'concurrent', 'identifier': '001', 'package': 'concurrent', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'concurrent', 'identifier': '002', 'package': 'concurrent', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'concurrent', 'identifier': '003', 'package': 'concurrent', 'class': 'rule_003', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'align_left', 'align_paren']},
+    {'name': 'concurrent', 'identifier': '004', 'package': 'concurrent', 'class': 'rule_004', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'concurrent', 'identifier': '005', 'package': 'concurrent', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'concurrent', 'identifier': '006', 'package': 'concurrent', 'class': 'rule_006', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'concurrent', 'identifier': '007', 'package': 'concurrent', 'class': 'rule_007', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'allow_single_line']},
+    {'name': 'concurrent', 'identifier': '008', 'package': 'concurrent', 'class': 'rule_008', 'phase': 5, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'include_lines_without_comments']},
+    {'name': 'concurrent', 'identifier': '009', 'package': 'concurrent', 'class': 'rule_009', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'align_left', 'align_paren', 'wrap_at_when', 'align_when_keywords', 'align_else_keywords']},
+    {'name': 'concurrent', 'identifier': '010', 'package': 'concurrent', 'class': 'rule_010', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'concurrent', 'identifier': '011', 'package': 'concurrent', 'class': 'rule_011', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'new_line_after_assign', 'ignore_single_line']},
+    {'name': 'constant', 'identifier': '001', 'package': 'constant', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'constant', 'identifier': '002', 'package': 'constant', 'class': 'rule_002', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'constant', 'identifier': '004', 'package': 'constant', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'constant', 'identifier': '005', 'package': 'constant', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'constant', 'identifier': '006', 'package': 'constant', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'constant', 'identifier': '007', 'package': 'constant', 'class': 'rule_007', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'constant', 'identifier': '010', 'package': 'constant', 'class': 'rule_010', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'constant', 'identifier': '011', 'package': 'constant', 'class': 'rule_011', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'constant', 'identifier': '012', 'package': 'constant', 'class': 'rule_012', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'align_left', 'align_paren']},
+    {'name': 'constant', 'identifier': '013', 'package': 'constant', 'class': 'rule_013', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'constant', 'identifier': '014', 'package': 'constant', 'class': 'rule_014', 'phase': 5, 'subphase': 4, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'constant', 'identifier': '015', 'package': 'constant', 'class': 'rule_015', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'constant', 'identifier': '016', 'package': 'constant', 'class': 'rule_016', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'first_paren_new_line', 'last_paren_new_line', 'open_paren_new_line', 'close_paren_new_line', 'new_line_after_comma', 'assign_on_single_line', 'ignore_single_line', 'move_last_comment']},
+    {'name': 'constant', 'identifier': '600', 'package': 'constant', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'context', 'identifier': '001', 'package': 'context', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '002', 'package': 'context', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '003', 'package': 'context', 'class': 'rule_003', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'context', 'identifier': '004', 'package': 'context', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'context', 'identifier': '005', 'package': 'context', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '006', 'package': 'context', 'class': 'rule_006', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '007', 'package': 'context', 'class': 'rule_007', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '008', 'package': 'context', 'class': 'rule_008', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '009', 'package': 'context', 'class': 'rule_009', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '010', 'package': 'context', 'class': 'rule_010', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '011', 'package': 'context', 'class': 'rule_011', 'phase': 1, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '012', 'package': 'context', 'class': 'rule_012', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'context', 'identifier': '013', 'package': 'context', 'class': 'rule_013', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'context', 'identifier': '014', 'package': 'context', 'class': 'rule_014', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'context', 'identifier': '015', 'package': 'context', 'class': 'rule_015', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'context', 'identifier': '016', 'package': 'context', 'class': 'rule_016', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'context', 'identifier': '017', 'package': 'context', 'class': 'rule_017', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '018', 'package': 'context', 'class': 'rule_018', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '019', 'package': 'context', 'class': 'rule_019', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '020', 'package': 'context', 'class': 'rule_020', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '021', 'package': 'context', 'class': 'rule_021', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'context', 'identifier': '022', 'package': 'context', 'class': 'rule_022', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'context', 'identifier': '023', 'package': 'context', 'class': 'rule_023', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'context', 'identifier': '024', 'package': 'context', 'class': 'rule_024', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'context', 'identifier': '025', 'package': 'context', 'class': 'rule_025', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'context', 'identifier': '026', 'package': 'context', 'class': 'rule_026', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context', 'identifier': '027', 'package': 'context', 'class': 'rule_027', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context_ref', 'identifier': '001', 'package': 'context_ref', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context_ref', 'identifier': '002', 'package': 'context_ref', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'context_ref', 'identifier': '003', 'package': 'context_ref', 'class': 'rule_003', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'context_ref', 'identifier': '004', 'package': 'context_ref', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'context_ref', 'identifier': '005', 'package': 'context_ref', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity', 'identifier': '001', 'package': 'entity', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity', 'identifier': '002', 'package': 'entity', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity', 'identifier': '003', 'package': 'entity', 'class': 'rule_003', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'entity', 'identifier': '004', 'package': 'entity', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'entity', 'identifier': '005', 'package': 'entity', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity', 'identifier': '006', 'package': 'entity', 'class': 'rule_006', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'entity', 'identifier': '007', 'package': 'entity', 'class': 'rule_007', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity', 'identifier': '008', 'package': 'entity', 'class': 'rule_008', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'entity', 'identifier': '009', 'package': 'entity', 'class': 'rule_009', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity', 'identifier': '010', 'package': 'entity', 'class': 'rule_010', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'entity', 'identifier': '011', 'package': 'entity', 'class': 'rule_011', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity', 'identifier': '012', 'package': 'entity', 'class': 'rule_012', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'entity', 'identifier': '013', 'package': 'entity', 'class': 'rule_013', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity', 'identifier': '014', 'package': 'entity', 'class': 'rule_014', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'entity', 'identifier': '015', 'package': 'entity', 'class': 'rule_015', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'entity', 'identifier': '016', 'package': 'entity', 'class': 'rule_016', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'entity', 'identifier': '017', 'package': 'entity', 'class': 'rule_017', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'entity', 'identifier': '018', 'package': 'entity', 'class': 'rule_018', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'entity', 'identifier': '019', 'package': 'entity', 'class': 'rule_019', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'entity', 'identifier': '020', 'package': 'entity', 'class': 'rule_020', 'phase': 5, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment', 'include_lines_without_comments']},
+    {'name': 'entity', 'identifier': '600', 'package': 'entity', 'class': 'rule_600', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity_specification', 'identifier': '100', 'package': 'entity_specification', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity_specification', 'identifier': '101', 'package': 'entity_specification', 'class': 'rule_101', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'entity_specification', 'identifier': '500', 'package': 'entity_specification', 'class': 'rule_500', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'entity_specification', 'identifier': '501', 'package': 'entity_specification', 'class': 'rule_501', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'entity_specification', 'identifier': '502', 'package': 'entity_specification', 'class': 'rule_502', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'entity_specification', 'identifier': '503', 'package': 'entity_specification', 'class': 'rule_503', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'exit_statement', 'identifier': '300', 'package': 'exit_statement', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'file', 'identifier': '001', 'package': 'file_statement', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'file', 'identifier': '002', 'package': 'file_statement', 'class': 'rule_002', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'file_statement', 'identifier': '003', 'package': 'file_statement', 'class': 'rule_003', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'for_loop', 'identifier': '001', 'package': 'for_loop', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'for_loop', 'identifier': '002', 'package': 'for_loop', 'class': 'rule_002', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'for_loop', 'identifier': '003', 'package': 'for_loop', 'class': 'rule_003', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'for_loop', 'identifier': '004', 'package': 'for_loop', 'class': 'rule_004', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'for_loop', 'identifier': '005', 'package': 'for_loop', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '001', 'package': 'function', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '002', 'package': 'function', 'class': 'rule_002', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'function', 'identifier': '003', 'package': 'function', 'class': 'rule_003', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'function', 'identifier': '004', 'package': 'function', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'function', 'identifier': '005', 'package': 'function', 'class': 'rule_005', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'function', 'identifier': '006', 'package': 'function', 'class': 'rule_006', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'function', 'identifier': '007', 'package': 'function', 'class': 'rule_007', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'function', 'identifier': '008', 'package': 'function', 'class': 'rule_008', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '009', 'package': 'function', 'class': 'rule_009', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '010', 'package': 'function', 'class': 'rule_010', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '012', 'package': 'function', 'class': 'rule_012', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'function', 'identifier': '013', 'package': 'function', 'class': 'rule_013', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'function', 'identifier': '014', 'package': 'function', 'class': 'rule_014', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'function', 'identifier': '015', 'package': 'function', 'class': 'rule_015', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'function', 'identifier': '016', 'package': 'function', 'class': 'rule_016', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '017', 'package': 'function', 'class': 'rule_017', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'function', 'identifier': '100', 'package': 'function', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '101', 'package': 'function', 'class': 'rule_101', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '201', 'package': 'function', 'class': 'rule_201', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'function', 'identifier': '202', 'package': 'function', 'class': 'rule_202', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'function', 'identifier': '203', 'package': 'function', 'class': 'rule_203', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'function', 'identifier': '204', 'package': 'function', 'class': 'rule_204', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'function', 'identifier': '300', 'package': 'function', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'function', 'identifier': '502', 'package': 'function', 'class': 'rule_502', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'function', 'identifier': '506', 'package': 'function', 'class': 'rule_506', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'generate', 'identifier': '001', 'package': 'generate', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '002', 'package': 'generate', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '003', 'package': 'generate', 'class': 'rule_003', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'generate', 'identifier': '004', 'package': 'generate', 'class': 'rule_004', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'generate', 'identifier': '005', 'package': 'generate', 'class': 'rule_005', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'generate', 'identifier': '006', 'package': 'generate', 'class': 'rule_006', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '007', 'package': 'generate', 'class': 'rule_007', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '008', 'package': 'generate', 'class': 'rule_008', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '009', 'package': 'generate', 'class': 'rule_009', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'generate', 'identifier': '010', 'package': 'generate', 'class': 'rule_010', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'generate', 'identifier': '011', 'package': 'generate', 'class': 'rule_011', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '012', 'package': 'generate', 'class': 'rule_012', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'generate', 'identifier': '013', 'package': 'generate', 'class': 'rule_013', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '014', 'package': 'generate', 'class': 'rule_014', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '015', 'package': 'generate', 'class': 'rule_015', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '016', 'package': 'generate', 'class': 'rule_016', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '017', 'package': 'generate', 'class': 'rule_017', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'generate', 'identifier': '018', 'package': 'generate', 'class': 'rule_018', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generate', 'identifier': '400', 'package': 'generate', 'class': 'rule_400', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group']},
+    {'name': 'generate', 'identifier': '401', 'package': 'generate', 'class': 'rule_401', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group']},
+    {'name': 'generate', 'identifier': '402', 'package': 'generate', 'class': 'rule_402', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group']},
+    {'name': 'generate', 'identifier': '403', 'package': 'generate', 'class': 'rule_403', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group']},
+    {'name': 'generate', 'identifier': '404', 'package': 'generate', 'class': 'rule_404', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group']},
+    {'name': 'generate', 'identifier': '405', 'package': 'generate', 'class': 'rule_405', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group']},
+    {'name': 'generate', 'identifier': '600', 'package': 'generate', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'generic', 'identifier': '001', 'package': 'generic', 'class': 'rule_001', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'generic', 'identifier': '002', 'package': 'generic', 'class': 'rule_002', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '003', 'package': 'generic', 'class': 'rule_003', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '004', 'package': 'generic', 'class': 'rule_004', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '005', 'package': 'generic', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '006', 'package': 'generic', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '007', 'package': 'generic', 'class': 'rule_007', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'generic', 'identifier': '008', 'package': 'generic', 'class': 'rule_008', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '009', 'package': 'generic', 'class': 'rule_009', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'generic', 'identifier': '010', 'package': 'generic', 'class': 'rule_010', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '013', 'package': 'generic', 'class': 'rule_013', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '014', 'package': 'generic', 'class': 'rule_014', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '016', 'package': 'generic', 'class': 'rule_016', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '017', 'package': 'generic', 'class': 'rule_017', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'generic', 'identifier': '018', 'package': 'generic', 'class': 'rule_018', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '019', 'package': 'generic', 'class': 'rule_019', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic', 'identifier': '020', 'package': 'generic', 'class': 'rule_020', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'generic', 'identifier': '600', 'package': 'generic', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'generic_map', 'identifier': '001', 'package': 'generic_map', 'class': 'rule_001', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'generic_map', 'identifier': '002', 'package': 'generic_map', 'class': 'rule_002', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'generic_map', 'identifier': '003', 'package': 'generic_map', 'class': 'rule_003', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic_map', 'identifier': '004', 'package': 'generic_map', 'class': 'rule_004', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic_map', 'identifier': '005', 'package': 'generic_map', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic_map', 'identifier': '006', 'package': 'generic_map', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic_map', 'identifier': '007', 'package': 'generic_map', 'class': 'rule_007', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'generic_map', 'identifier': '008', 'package': 'generic_map', 'class': 'rule_008', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '001', 'package': 'if_statement', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '002', 'package': 'if_statement', 'class': 'rule_002', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'parenthesis']},
+    {'name': 'if', 'identifier': '003', 'package': 'if_statement', 'class': 'rule_003', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '004', 'package': 'if_statement', 'class': 'rule_004', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '005', 'package': 'if_statement', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '006', 'package': 'if_statement', 'class': 'rule_006', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '007', 'package': 'if_statement', 'class': 'rule_007', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '008', 'package': 'if_statement', 'class': 'rule_008', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '009', 'package': 'if_statement', 'class': 'rule_009', 'phase': 4, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'align_left', 'align_paren']},
+    {'name': 'if', 'identifier': '010', 'package': 'if_statement', 'class': 'rule_010', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '011', 'package': 'if_statement', 'class': 'rule_011', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '012', 'package': 'if_statement', 'class': 'rule_012', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '013', 'package': 'if_statement', 'class': 'rule_013', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '014', 'package': 'if_statement', 'class': 'rule_014', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '015', 'package': 'if_statement', 'class': 'rule_015', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '020', 'package': 'if_statement', 'class': 'rule_020', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '021', 'package': 'if_statement', 'class': 'rule_021', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '022', 'package': 'if_statement', 'class': 'rule_022', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '023', 'package': 'if_statement', 'class': 'rule_023', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '024', 'package': 'if_statement', 'class': 'rule_024', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '025', 'package': 'if_statement', 'class': 'rule_025', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'if', 'identifier': '026', 'package': 'if_statement', 'class': 'rule_026', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'if', 'identifier': '027', 'package': 'if_statement', 'class': 'rule_027', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'if', 'identifier': '028', 'package': 'if_statement', 'class': 'rule_028', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'if', 'identifier': '029', 'package': 'if_statement', 'class': 'rule_029', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'if', 'identifier': '030', 'package': 'if_statement', 'class': 'rule_030', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'if', 'identifier': '031', 'package': 'if_statement', 'class': 'rule_031', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'if', 'identifier': '032', 'package': 'if_statement', 'class': 'rule_032', 'phase': 4, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '033', 'package': 'if_statement', 'class': 'rule_033', 'phase': 4, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '034', 'package': 'if_statement', 'class': 'rule_034', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'if', 'identifier': '035', 'package': 'if_statement', 'class': 'rule_035', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'if', 'identifier': '036', 'package': 'if_statement', 'class': 'rule_036', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'instantiation', 'identifier': '001', 'package': 'instantiation', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'instantiation', 'identifier': '002', 'package': 'instantiation', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'instantiation', 'identifier': '003', 'package': 'instantiation', 'class': 'rule_003', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'instantiation', 'identifier': '004', 'package': 'instantiation', 'class': 'rule_004', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'instantiation', 'identifier': '005', 'package': 'instantiation', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'instantiation', 'identifier': '006', 'package': 'instantiation', 'class': 'rule_006', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '007', 'package': 'instantiation', 'class': 'rule_007', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '008', 'package': 'instantiation', 'class': 'rule_008', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'instantiation', 'identifier': '009', 'package': 'instantiation', 'class': 'rule_009', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'instantiation', 'identifier': '010', 'package': 'instantiation', 'class': 'rule_010', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'instantiation', 'identifier': '011', 'package': 'instantiation', 'class': 'rule_011', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '012', 'package': 'instantiation', 'class': 'rule_012', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'instantiation', 'identifier': '013', 'package': 'instantiation', 'class': 'rule_013', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '014', 'package': 'instantiation', 'class': 'rule_014', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '016', 'package': 'instantiation', 'class': 'rule_016', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '017', 'package': 'instantiation', 'class': 'rule_017', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '018', 'package': 'instantiation', 'class': 'rule_018', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '019', 'package': 'instantiation', 'class': 'rule_019', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'instantiation', 'identifier': '020', 'package': 'instantiation', 'class': 'rule_020', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '021', 'package': 'instantiation', 'class': 'rule_021', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '022', 'package': 'instantiation', 'class': 'rule_022', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '023', 'package': 'instantiation', 'class': 'rule_023', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'instantiation', 'identifier': '024', 'package': 'instantiation', 'class': 'rule_024', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '025', 'package': 'instantiation', 'class': 'rule_025', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '026', 'package': 'instantiation', 'class': 'rule_026', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '027', 'package': 'instantiation', 'class': 'rule_027', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'instantiation', 'identifier': '028', 'package': 'instantiation', 'class': 'rule_028', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'instantiation', 'identifier': '029', 'package': 'instantiation', 'class': 'rule_029', 'phase': 5, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment', 'include_lines_without_comments']},
+    {'name': 'instantiation', 'identifier': '030', 'package': 'instantiation', 'class': 'rule_030', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'instantiation', 'identifier': '031', 'package': 'instantiation', 'class': 'rule_031', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'instantiation', 'identifier': '032', 'package': 'instantiation', 'class': 'rule_032', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'instantiation', 'identifier': '033', 'package': 'instantiation', 'class': 'rule_033', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'instantiation', 'identifier': '034', 'package': 'instantiation', 'class': 'rule_034', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'method']},
+    {'name': 'instantiation', 'identifier': '600', 'package': 'instantiation', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'instantiation', 'identifier': '601', 'package': 'instantiation', 'class': 'rule_601', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'length', 'identifier': '001', 'package': 'length', 'class': 'rule_001', 'phase': 7, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'length']},
+    {'name': 'length', 'identifier': '002', 'package': 'length', 'class': 'rule_002', 'phase': 7, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'length']},
+    {'name': 'length', 'identifier': '003', 'package': 'length', 'class': 'rule_003', 'phase': 7, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'length']},
+    {'name': 'library', 'identifier': '001', 'package': 'library', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'library', 'identifier': '002', 'package': 'library', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'library', 'identifier': '003', 'package': 'library', 'class': 'rule_003', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style', 'allow_library_clause']},
+    {'name': 'library', 'identifier': '004', 'package': 'library', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'library', 'identifier': '005', 'package': 'library', 'class': 'rule_005', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'library', 'identifier': '006', 'package': 'library', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'library', 'identifier': '007', 'package': 'library', 'class': 'rule_007', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'library', 'identifier': '008', 'package': 'library', 'class': 'rule_008', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'library', 'identifier': '009', 'package': 'library', 'class': 'rule_009', 'phase': 4, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'library', 'identifier': '010', 'package': 'library', 'class': 'rule_010', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'library', 'identifier': '011', 'package': 'library', 'class': 'rule_011', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'loop_statement', 'identifier': '300', 'package': 'loop_statement', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package', 'identifier': '001', 'package': 'package', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package', 'identifier': '002', 'package': 'package', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package', 'identifier': '003', 'package': 'package', 'class': 'rule_003', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'package', 'identifier': '004', 'package': 'package', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'package', 'identifier': '005', 'package': 'package', 'class': 'rule_005', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package', 'identifier': '006', 'package': 'package', 'class': 'rule_006', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'package', 'identifier': '007', 'package': 'package', 'class': 'rule_007', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'package', 'identifier': '008', 'package': 'package', 'class': 'rule_008', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'package', 'identifier': '009', 'package': 'package', 'class': 'rule_009', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package', 'identifier': '010', 'package': 'package', 'class': 'rule_010', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'package', 'identifier': '011', 'package': 'package', 'class': 'rule_011', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'package', 'identifier': '012', 'package': 'package', 'class': 'rule_012', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'package', 'identifier': '013', 'package': 'package', 'class': 'rule_013', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'package', 'identifier': '014', 'package': 'package', 'class': 'rule_014', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'package', 'identifier': '015', 'package': 'package', 'class': 'rule_015', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package', 'identifier': '016', 'package': 'package', 'class': 'rule_016', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'package', 'identifier': '017', 'package': 'package', 'class': 'rule_017', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'package', 'identifier': '018', 'package': 'package', 'class': 'rule_018', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'package', 'identifier': '019', 'package': 'package', 'class': 'rule_019', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'package', 'identifier': '400', 'package': 'package', 'class': 'rule_400', 'phase': 5, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'package', 'identifier': '401', 'package': 'package', 'class': 'rule_401', 'phase': 5, 'subphase': 4, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment', 'include_lines_without_comments']},
+    {'name': 'package_body', 'identifier': '001', 'package': 'package_body', 'class': 'rule_001', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package_body', 'identifier': '002', 'package': 'package_body', 'class': 'rule_002', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'package_body', 'identifier': '003', 'package': 'package_body', 'class': 'rule_003', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'package_body', 'identifier': '100', 'package': 'package_body', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package_body', 'identifier': '101', 'package': 'package_body', 'class': 'rule_101', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package_body', 'identifier': '200', 'package': 'package_body', 'class': 'rule_200', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'package_body', 'identifier': '201', 'package': 'package_body', 'class': 'rule_201', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'package_body', 'identifier': '202', 'package': 'package_body', 'class': 'rule_202', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'package_body', 'identifier': '203', 'package': 'package_body', 'class': 'rule_203', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'package_body', 'identifier': '300', 'package': 'package_body', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package_body', 'identifier': '301', 'package': 'package_body', 'class': 'rule_301', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'package_body', 'identifier': '400', 'package': 'package_body', 'class': 'rule_400', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'package_body', 'identifier': '500', 'package': 'package_body', 'class': 'rule_500', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'package_body', 'identifier': '501', 'package': 'package_body', 'class': 'rule_501', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'package_body', 'identifier': '502', 'package': 'package_body', 'class': 'rule_502', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'package_body', 'identifier': '503', 'package': 'package_body', 'class': 'rule_503', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'package_body', 'identifier': '504', 'package': 'package_body', 'class': 'rule_504', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'package_body', 'identifier': '505', 'package': 'package_body', 'class': 'rule_505', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'package_body', 'identifier': '506', 'package': 'package_body', 'class': 'rule_506', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'package_body', 'identifier': '507', 'package': 'package_body', 'class': 'rule_507', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'package_body', 'identifier': '600', 'package': 'package_body', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'package_body', 'identifier': '601', 'package': 'package_body', 'class': 'rule_601', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'port', 'identifier': '001', 'package': 'port', 'class': 'rule_001', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'port', 'identifier': '002', 'package': 'port', 'class': 'rule_002', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '003', 'package': 'port', 'class': 'rule_003', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '004', 'package': 'port', 'class': 'rule_004', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '005', 'package': 'port', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '007', 'package': 'port', 'class': 'rule_007', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '008', 'package': 'port', 'class': 'rule_008', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '009', 'package': 'port', 'class': 'rule_009', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '010', 'package': 'port', 'class': 'rule_010', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'port', 'identifier': '011', 'package': 'port', 'class': 'rule_011', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'port', 'identifier': '012', 'package': 'port', 'class': 'rule_012', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '013', 'package': 'port', 'class': 'rule_013', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '014', 'package': 'port', 'class': 'rule_014', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '015', 'package': 'port', 'class': 'rule_015', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '016', 'package': 'port', 'class': 'rule_016', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '017', 'package': 'port', 'class': 'rule_017', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'port', 'identifier': '018', 'package': 'port', 'class': 'rule_018', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'port', 'identifier': '019', 'package': 'port', 'class': 'rule_019', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'port', 'identifier': '020', 'package': 'port', 'class': 'rule_020', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '021', 'package': 'port', 'class': 'rule_021', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '022', 'package': 'port', 'class': 'rule_022', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '023', 'package': 'port', 'class': 'rule_023', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '024', 'package': 'port', 'class': 'rule_024', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port', 'identifier': '025', 'package': 'port', 'class': 'rule_025', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'port', 'identifier': '026', 'package': 'port', 'class': 'rule_026', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port_map', 'identifier': '001', 'package': 'port_map', 'class': 'rule_001', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'port_map', 'identifier': '002', 'package': 'port_map', 'class': 'rule_002', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'port_map', 'identifier': '003', 'package': 'port_map', 'class': 'rule_003', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port_map', 'identifier': '004', 'package': 'port_map', 'class': 'rule_004', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port_map', 'identifier': '005', 'package': 'port_map', 'class': 'rule_005', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port_map', 'identifier': '007', 'package': 'port_map', 'class': 'rule_007', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port_map', 'identifier': '008', 'package': 'port_map', 'class': 'rule_008', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'port_map', 'identifier': '009', 'package': 'port_map', 'class': 'rule_009', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '001', 'package': 'procedure', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '002', 'package': 'procedure', 'class': 'rule_002', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '003', 'package': 'procedure', 'class': 'rule_003', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '004', 'package': 'procedure', 'class': 'rule_004', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '005', 'package': 'procedure', 'class': 'rule_005', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '006', 'package': 'procedure', 'class': 'rule_006', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '007', 'package': 'procedure', 'class': 'rule_007', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '008', 'package': 'procedure', 'class': 'rule_008', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'procedure', 'identifier': '009', 'package': 'procedure', 'class': 'rule_009', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'procedure', 'identifier': '010', 'package': 'procedure', 'class': 'rule_010', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'procedure', 'identifier': '011', 'package': 'procedure', 'class': 'rule_011', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '100', 'package': 'procedure', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '101', 'package': 'procedure', 'class': 'rule_101', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure', 'identifier': '200', 'package': 'procedure', 'class': 'rule_200', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'procedure', 'identifier': '201', 'package': 'procedure', 'class': 'rule_201', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'procedure', 'identifier': '202', 'package': 'procedure', 'class': 'rule_202', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'procedure', 'identifier': '203', 'package': 'procedure', 'class': 'rule_203', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'procedure', 'identifier': '204', 'package': 'procedure', 'class': 'rule_204', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'procedure', 'identifier': '205', 'package': 'procedure', 'class': 'rule_205', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'procedure', 'identifier': '401', 'package': 'procedure', 'class': 'rule_401', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'procedure', 'identifier': '410', 'package': 'procedure', 'class': 'rule_410', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'procedure', 'identifier': '411', 'package': 'procedure', 'class': 'rule_411', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'procedure', 'identifier': '412', 'package': 'procedure', 'class': 'rule_412', 'phase': 5, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment', 'include_lines_without_comments']},
+    {'name': 'procedure', 'identifier': '500', 'package': 'procedure', 'class': 'rule_500', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'procedure', 'identifier': '501', 'package': 'procedure', 'class': 'rule_501', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'procedure', 'identifier': '502', 'package': 'procedure', 'class': 'rule_502', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'procedure', 'identifier': '503', 'package': 'procedure', 'class': 'rule_503', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'procedure', 'identifier': '504', 'package': 'procedure', 'class': 'rule_504', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'procedure', 'identifier': '505', 'package': 'procedure', 'class': 'rule_505', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'procedure', 'identifier': '506', 'package': 'procedure', 'class': 'rule_506', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'procedure', 'identifier': '507', 'package': 'procedure', 'class': 'rule_507', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure_call', 'identifier': '001', 'package': 'procedure_call', 'class': 'rule_001', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure_call', 'identifier': '002', 'package': 'procedure_call', 'class': 'rule_002', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure_call', 'identifier': '100', 'package': 'procedure_call', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure_call', 'identifier': '300', 'package': 'procedure_call', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure_call', 'identifier': '301', 'package': 'procedure_call', 'class': 'rule_301', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure_call', 'identifier': '302', 'package': 'procedure_call', 'class': 'rule_302', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'procedure_call', 'identifier': '500', 'package': 'procedure_call', 'class': 'rule_500', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'procedure_call', 'identifier': '501', 'package': 'procedure_call', 'class': 'rule_501', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'process', 'identifier': '001', 'package': 'process', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '002', 'package': 'process', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '003', 'package': 'process', 'class': 'rule_003', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '004', 'package': 'process', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'process', 'identifier': '005', 'package': 'process', 'class': 'rule_005', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'process', 'identifier': '006', 'package': 'process', 'class': 'rule_006', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '007', 'package': 'process', 'class': 'rule_007', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '008', 'package': 'process', 'class': 'rule_008', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'process', 'identifier': '009', 'package': 'process', 'class': 'rule_009', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'process', 'identifier': '010', 'package': 'process', 'class': 'rule_010', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '011', 'package': 'process', 'class': 'rule_011', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'process', 'identifier': '012', 'package': 'process', 'class': 'rule_012', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'process', 'identifier': '013', 'package': 'process', 'class': 'rule_013', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'process', 'identifier': '014', 'package': 'process', 'class': 'rule_014', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '015', 'package': 'process', 'class': 'rule_015', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'process', 'identifier': '016', 'package': 'process', 'class': 'rule_016', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '017', 'package': 'process', 'class': 'rule_017', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'process', 'identifier': '018', 'package': 'process', 'class': 'rule_018', 'phase': 1, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'action']},
+    {'name': 'process', 'identifier': '019', 'package': 'process', 'class': 'rule_019', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'process', 'identifier': '020', 'package': 'process', 'class': 'rule_020', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'align_left', 'align_paren']},
+    {'name': 'process', 'identifier': '021', 'package': 'process', 'class': 'rule_021', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'process', 'identifier': '022', 'package': 'process', 'class': 'rule_022', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'process', 'identifier': '023', 'package': 'process', 'class': 'rule_023', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'process', 'identifier': '024', 'package': 'process', 'class': 'rule_024', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '025', 'package': 'process', 'class': 'rule_025', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '026', 'package': 'process', 'class': 'rule_026', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'process', 'identifier': '027', 'package': 'process', 'class': 'rule_027', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'process', 'identifier': '028', 'package': 'process', 'class': 'rule_028', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '029', 'package': 'process', 'class': 'rule_029', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'clock']},
+    {'name': 'process', 'identifier': '030', 'package': 'process', 'class': 'rule_030', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '031', 'package': 'process', 'class': 'rule_031', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'process', 'identifier': '032', 'package': 'process', 'class': 'rule_032', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'process', 'identifier': '033', 'package': 'process', 'class': 'rule_033', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'process', 'identifier': '034', 'package': 'process', 'class': 'rule_034', 'phase': 5, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment', 'include_lines_without_comments']},
+    {'name': 'process', 'identifier': '035', 'package': 'process', 'class': 'rule_035', 'phase': 5, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment', 'include_lines_without_comments']},
+    {'name': 'process', 'identifier': '036', 'package': 'process', 'class': 'rule_036', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'process', 'identifier': '600', 'package': 'process', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'range', 'identifier': '001', 'package': 'ranges', 'class': 'rule_001', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'range', 'identifier': '002', 'package': 'ranges', 'class': 'rule_002', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'report_statement', 'identifier': '001', 'package': 'report_statement', 'class': 'rule_001', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'report_statement', 'identifier': '002', 'package': 'report_statement', 'class': 'rule_002', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'report_statement', 'identifier': '100', 'package': 'report_statement', 'class': 'rule_100', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'report_statement', 'identifier': '101', 'package': 'report_statement', 'class': 'rule_101', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'report_statement', 'identifier': '300', 'package': 'report_statement', 'class': 'rule_300', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'report_statement', 'identifier': '400', 'package': 'report_statement', 'class': 'rule_400', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'alignment']},
+    {'name': 'report_statement', 'identifier': '500', 'package': 'report_statement', 'class': 'rule_500', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'report_statement', 'identifier': '501', 'package': 'report_statement', 'class': 'rule_501', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'sequential', 'identifier': '001', 'package': 'sequential', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'sequential', 'identifier': '002', 'package': 'sequential', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'sequential', 'identifier': '003', 'package': 'sequential', 'class': 'rule_003', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'sequential', 'identifier': '004', 'package': 'sequential', 'class': 'rule_004', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'align_left', 'align_paren']},
+    {'name': 'sequential', 'identifier': '005', 'package': 'sequential', 'class': 'rule_005', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'sequential', 'identifier': '006', 'package': 'sequential', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'sequential', 'identifier': '007', 'package': 'sequential', 'class': 'rule_007', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'signal', 'identifier': '001', 'package': 'signal', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'signal', 'identifier': '002', 'package': 'signal', 'class': 'rule_002', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'signal', 'identifier': '003', 'package': 'signal', 'class': 'rule_003', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'signal', 'identifier': '004', 'package': 'signal', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'signal', 'identifier': '005', 'package': 'signal', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'signal', 'identifier': '006', 'package': 'signal', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'signal', 'identifier': '007', 'package': 'signal', 'class': 'rule_007', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'signal', 'identifier': '008', 'package': 'signal', 'class': 'rule_008', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'signal', 'identifier': '010', 'package': 'signal', 'class': 'rule_010', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'signal', 'identifier': '011', 'package': 'signal', 'class': 'rule_011', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'signal', 'identifier': '012', 'package': 'signal', 'class': 'rule_012', 'phase': 5, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment']},
+    {'name': 'signal', 'identifier': '014', 'package': 'signal', 'class': 'rule_014', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'signal', 'identifier': '015', 'package': 'signal', 'class': 'rule_015', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'consecutive']},
+    {'name': 'signal', 'identifier': '016', 'package': 'signal', 'class': 'rule_016', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'signal', 'identifier': '600', 'package': 'signal', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'source_file', 'identifier': '001', 'package': 'source_file', 'class': 'rule_001', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'subprogram_body', 'identifier': '400', 'package': 'subprogram_body', 'class': 'rule_400', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'subtype', 'identifier': '001', 'package': 'subtype', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'subtype', 'identifier': '002', 'package': 'subtype', 'class': 'rule_002', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'subtype', 'identifier': '003', 'package': 'subtype', 'class': 'rule_003', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'subtype', 'identifier': '004', 'package': 'subtype', 'class': 'rule_004', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'subtype', 'identifier': '600', 'package': 'subtype', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'type', 'identifier': '001', 'package': 'type_definition', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '002', 'package': 'type_definition', 'class': 'rule_002', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'type', 'identifier': '003', 'package': 'type_definition', 'class': 'rule_003', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'type', 'identifier': '004', 'package': 'type_definition', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'type', 'identifier': '005', 'package': 'type_definition', 'class': 'rule_005', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '006', 'package': 'type_definition', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '007', 'package': 'type_definition', 'class': 'rule_007', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '008', 'package': 'type_definition', 'class': 'rule_008', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '009', 'package': 'type_definition', 'class': 'rule_009', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '010', 'package': 'type_definition', 'class': 'rule_010', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'type', 'identifier': '011', 'package': 'type_definition', 'class': 'rule_011', 'phase': 3, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'style']},
+    {'name': 'type', 'identifier': '012', 'package': 'type_definition', 'class': 'rule_012', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '013', 'package': 'type_definition', 'class': 'rule_013', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'type', 'identifier': '014', 'package': 'type_definition', 'class': 'rule_014', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '015', 'package': 'type_definition', 'class': 'rule_015', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'type', 'identifier': '016', 'package': 'type_definition', 'class': 'rule_016', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'type', 'identifier': '400', 'package': 'type_definition', 'class': 'rule_400', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'separate_generic_port_alignment']},
+    {'name': 'type', 'identifier': '600', 'package': 'type_definition', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'variable', 'identifier': '001', 'package': 'variable', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'variable', 'identifier': '002', 'package': 'variable', 'class': 'rule_002', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case']},
+    {'name': 'variable', 'identifier': '003', 'package': 'variable', 'class': 'rule_003', 'phase': 0, 'subphase': 1, 'disable': True, 'depricated': True, 'configuration': []},
+    {'name': 'variable', 'identifier': '004', 'package': 'variable', 'class': 'rule_004', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'variable', 'identifier': '005', 'package': 'variable', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'variable', 'identifier': '006', 'package': 'variable', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'variable', 'identifier': '007', 'package': 'variable', 'class': 'rule_007', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'variable', 'identifier': '010', 'package': 'variable', 'class': 'rule_010', 'phase': 6, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'case', 'prefix_exceptions', 'suffix_exceptions']},
+    {'name': 'variable', 'identifier': '011', 'package': 'variable', 'class': 'rule_011', 'phase': 6, 'subphase': 2, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'variable', 'identifier': '012', 'package': 'variable', 'class': 'rule_012', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'prefixes']},
+    {'name': 'variable', 'identifier': '600', 'package': 'variable', 'class': 'rule_600', 'phase': 7, 'subphase': 1, 'disable': True, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'suffixes']},
+    {'name': 'variable_assignment', 'identifier': '001', 'package': 'variable_assignment', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'variable_assignment', 'identifier': '002', 'package': 'variable_assignment', 'class': 'rule_002', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'variable_assignment', 'identifier': '003', 'package': 'variable_assignment', 'class': 'rule_003', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'variable_assignment', 'identifier': '004', 'package': 'variable_assignment', 'class': 'rule_004', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'align_left', 'align_paren']},
+    {'name': 'variable_assignment', 'identifier': '005', 'package': 'variable_assignment', 'class': 'rule_005', 'phase': 5, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'compact_alignment', 'blank_line_ends_group', 'comment_line_ends_group', 'if_control_statements_ends_group', 'case_control_statements_ends_group', 'loop_control_statements_ends_group']},
+    {'name': 'variable_assignment', 'identifier': '006', 'package': 'variable_assignment', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'wait', 'identifier': '001', 'package': 'wait', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'when', 'identifier': '001', 'package': 'when', 'class': 'rule_001', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'while_loop', 'identifier': '001', 'package': 'while_loop', 'class': 'rule_001', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'while_loop', 'identifier': '002', 'package': 'while_loop', 'class': 'rule_002', 'phase': 4, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '001', 'package': 'whitespace', 'class': 'rule_001', 'phase': 1, 'subphase': 0, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '003', 'package': 'whitespace', 'class': 'rule_003', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '004', 'package': 'whitespace', 'class': 'rule_004', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '005', 'package': 'whitespace', 'class': 'rule_005', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '006', 'package': 'whitespace', 'class': 'rule_006', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '007', 'package': 'whitespace', 'class': 'rule_007', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '008', 'package': 'whitespace', 'class': 'rule_008', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '010', 'package': 'whitespace', 'class': 'rule_010', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '011', 'package': 'whitespace', 'class': 'rule_011', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'whitespace', 'identifier': '012', 'package': 'whitespace', 'class': 'rule_012', 'phase': 3, 'subphase': 3, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity', 'numBlankLines']},
+    {'name': 'whitespace', 'identifier': '013', 'package': 'whitespace', 'class': 'rule_013', 'phase': 2, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+    {'name': 'with', 'identifier': '001', 'package': 'with_statement', 'class': 'rule_001', 'phase': 1, 'subphase': 1, 'disable': False, 'depricated': False, 'configuration': ['indentSize', 'phase', 'disable', 'fixable', 'severity']},
+]
@@ -0,0 +1,268 @@
+
+import copy
+import importlib
+import inspect
+import os
+
+from vsg import profiler
+
+sManifestFileName = os.path.join(os.path.dirname(__file__), 'rule_manifest.py')
+
+lProxyAttributes = ['dEntry', 'name', 'identifier', 'unique_id', 'depricated', 'oRule', 'lConfigs', 'bDebug', 'lLineRanges', 'dAttributes']
+
+lManifestAttributes = ['phase', 'subphase', 'disable']
+
+
+def get_rule_packages():
+    '''
+    Returns the names of the packages in the vsg/rules directory.
+
+    Returns: (list of strings)
+    '''
+    sDirectoryName = os.path.join(os.path.dirname(__file__), 'rules')
+    lReturn = []
+    for sName in sorted(os.listdir(sDirectoryName)):
+        if os.path.isfile(os.path.join(sDirectoryName, sName, '__init__.py')):
+            lReturn.append(sName)
+    return lReturn
+
+
+def create_manifest():
+    '''
+    Imports every rule and returns an entry describing each one.
+    The entries are ordered the same way rules were loaded before the manifest existed.
+
+    Returns: (list of dictionaries)
+    '''
+    lReturn = []
+    for sPackage in get_rule_packages():
+        oPackage = importlib.import_module('vsg.rules.' + sPackage)
+        for sClass, oClass in inspect.getmembers(oPackage):
+            if inspect.isclass(oClass) and sClass.startswith('rule_'):
+                lReturn.append(create_entry(sPackage, sClass, oClass()))
+    return lReturn
+
+
+def create_entry(sPackage, sClass, oRule):
+    '''
+    Returns the manifest entry of a rule.
+
+    Parameters:
+
+      sPackage: (string)
+
+      sClass: (string)
+
+      oRule: (rule object)
+
+    Returns: (dictionary)
+    '''
+    dReturn = {}
+    dReturn['name'] = oRule.name
+    dReturn['identifier'] = oRule.identifier
+    dReturn['package'] = sPackage
+    dReturn['class'] = sClass
+    dReturn['phase'] = oRule.phase
+    dReturn['subphase'] = oRule.subphase
+    dReturn['disable'] = oRule.disable
+    dReturn['depricated'] = oRule.depricated
+    dReturn['configuration'] = list(oRule.configuration)
+    return dReturn
+
+
+def write_manifest(sFileName=sManifestFileName):
+    '''
+    Writes the manifest as a python module.
+
+    Parameters:
+
+      sFileName: (string)
+
+    Returns: Nothing
+    '''
+    lLines = []
+    lLines.append('# This file is generated by running:')
+    lLines.append('#')
+    lLines.append('#   python -m vsg.rule_registry')
+    lLines.append('#')
+    lLines.append('# Run it again after adding, removing or changing the defaults of a rule.')
+    lLines.append('')
+    lLines.append('lRules = [')
+    for dEntry in create_manifest():
+        lLines.append('    ' + repr(dEntry) + ',')
+    lLines.append(']')
+    with open(sFileName, 'w') as oFile:
+        oFile.write('\n'.join(lLines) + '\n')
+
+
+def create_rule(dEntry):
+    '''
+    Imports a rule described by a manifest entry and returns a new instance of it.
+
+    Parameters:
+
+      dEntry: (dictionary)
+
+    Returns: (rule object)
+    '''
+    with profiler.timer('rule_registry.create_rule'):
+        oPackage = importlib.import_module('vsg.rules.' + dEntry['package'])
+        return getattr(oPackage, dEntry['class'])()
+
+
+def create_proxies():
+    '''
+    Returns a proxy for every rule in the manifest.
+
+    Returns: (list of rule_proxy objects)
+    '''
+    from vsg import rule_manifest
+    return [rule_proxy(dEntry) for dEntry in rule_manifest.lRules]
+
+
+class rule_proxy():
+    '''
+    Stands in for a rule from the manifest until the rule is needed.
+
+    The phase, subphase and disable attributes are answered from the manifest and the configuration.
+    This allows rules to be ordered and filtered without importing them.
+    Accessing any other attribute imports the rule.
+    Configuration, debug and line ranges applied before then are applied to the rule when it is created.
+
+    Parameters:
+
+      dEntry: (dictionary) manifest entry of the rule
+    '''
+    def __init__(self, dEntry):
+        self.dEntry = dEntry
+        self.name = dEntry['name']
+        self.identifier = dEntry['identifier']
+        self.unique_id = str(self.name) + '_' + str(self.identifier)
+        self.depricated = dEntry['depricated']
+        self.oRule = None
+        self.lConfigs = []
+        self.bDebug = False
+        self.lLineRanges = None
+        self.dAttributes = {}
+        for sAttributeName in lManifestAttributes:
+            self.dAttributes[sAttributeName] = dEntry[sAttributeName]
+
+    def __getattr__(self, sName):
+        if sName.startswith('__') or 'dEntry' not in self.__dict__:
+            raise AttributeError(sName)
+        return getattr(self.get_rule(), sName)
+
+    def __setattr__(self, sName, value):
+        if sName in lProxyAttributes:
+            object.__setattr__(self, sName, value)
+        else:
+            setattr(self.get_rule(), sName, value)
+
+    def __copy__(self):
+        oReturn = rule_proxy(self.dEntry)
+        oReturn.lConfigs = list(self.lConfigs)
+        oReturn.bDebug = self.bDebug
+        oReturn.lLineRanges = self.lLineRanges
+        oReturn.dAttributes = dict(self.dAttributes)
+        if self.oRule is not None:
+            oReturn.oRule = copy.copy(self.oRule)
+        return oReturn
+
+    @property
+    def phase(self):
+        return self.get_attribute('phase')
+
+    @property
+    def subphase(self):
+        return self.get_attribute('subphase')
+
+    @property
+    def disable(self):
+        return self.get_attribute('disable')
+
+    @property
+    def violations(self):
+        if self.oRule is None:
+            return []
+        return self.oRule.violations
+
+    def is_loaded(self):
+        '''
+        Returns True if the rule has been imported and created.
+
+        Returns: (boolean)
+        '''
+        return self.oRule is not None
+
+    def get_rule(self):
+        '''
+        Returns the rule, creating it the first time it is needed.
+
+        Returns: (rule object)
+        '''
+        if self.oRule is None:
+            oRule = create_rule(self.dEntry)
+            for oConfig in self.lConfigs:
+                oRule.configure(oConfig)
+            if self.bDebug:
+                oRule.set_debug()
+            oRule.set_line_ranges(self.lLineRanges)
+            self.oRule = oRule
+        return self.oRule
+
+    def get_attribute(self, sAttributeName):
+        if self.oRule is None:
+            return self.dAttributes[sAttributeName]
+        return getattr(self.oRule, sAttributeName)
+
+    def configure(self, oConfig):
+        '''
+        Configures the rule, or records the configuration until the rule is created.
+        Depricated rules are created immediately if they are configured, so the error is reported.
+
+        Parameters:
+
+          oConfig: (config object)
+
+        Returns: (list of strings) error messages for depricated rules
+        '''
+        if self.oRule is None and self.depricated and self.unique_id in oConfig.dConfig['rule']:
+            self.get_rule()
+        if self.oRule is not None:
+            return self.oRule.configure(oConfig)
+
+        self.lConfigs.append(oConfig)
+        dRules = oConfig.dConfig['rule']
+        lConfigurations = [dRules.get('global')]
+        if not self.depricated:
+            lConfigurations.append(dRules.get(self.unique_id))
+        for dConfiguration in lConfigurations:
+            if dConfiguration is None:
+                continue
+            for sAttributeName in lManifestAttributes:
+                if sAttributeName in dConfiguration:
+                    self.dAttributes[sAttributeName] = dConfiguration[sAttributeName]
+        return []
+
+    def set_debug(self):
+        self.bDebug = True
+        if self.oRule is not None:
+            self.oRule.set_debug()
+
+    def set_line_ranges(self, lLineRanges):
+        self.lLineRanges = lLineRanges
+        if self.oRule is not None:
+            self.oRule.set_line_ranges(lLineRanges)
+
+    def clear_violations(self):
+        if self.oRule is not None:
+            self.oRule.clear_violations()
+
+    def has_violations(self):
+        if self.oRule is None:
+            return False
+        return self.oRule.has_violations()
+
+
+if __name__ == '__main__':
+    write_manifest()
@@ -77,55 +77,3 @@ from .multiline_alignment_between_tokens import multiline_alignment_between_toke
 from .remove_carriage_return_after_token import remove_carriage_return_after_token
 from .move_token_to_the_right_of_several_possible_tokens_if_it_exists_between_tokens import move_token_to_the_right_of_several_possible_tokens_if_it_exists_between_tokens
 from .number_of_lines_between_tokens import number_of_lines_between_tokens
-
-from vsg.rules import after
-from vsg.rules import architecture
-from vsg.rules import assert_statement
-from vsg.rules import attribute
-from vsg.rules import attribute_declaration
-from vsg.rules import attribute_specification
-from vsg.rules import block
-from vsg.rules import block_comment
-from vsg.rules import case
-from vsg.rules import comment
-from vsg.rules import component
-from vsg.rules import concurrent
-from vsg.rules import constant
-from vsg.rules import context
-from vsg.rules import context_ref
-from vsg.rules import entity
-from vsg.rules import entity_specification
-from vsg.rules import exit_statement
-from vsg.rules import file_statement
-from vsg.rules import for_loop
-from vsg.rules import function
-from vsg.rules import generate
-from vsg.rules import generic
-from vsg.rules import generic_map
-from vsg.rules import if_statement
-from vsg.rules import instantiation
-from vsg.rules import length
-from vsg.rules import library
-from vsg.rules import loop_statement
-from vsg.rules import package
-from vsg.rules import package_body
-from vsg.rules import port
-from vsg.rules import port_map
-from vsg.rules import procedure
-from vsg.rules import procedure_call
-from vsg.rules import process
-from vsg.rules import ranges
-from vsg.rules import report_statement
-from vsg.rules import sequential
-from vsg.rules import signal
-from vsg.rules import source_file
-from vsg.rules import subprogram_body
-from vsg.rules import subtype
-from vsg.rules import type_definition
-from vsg.rules import variable
-from vsg.rules import variable_assignment
-from vsg.rules import wait
-from vsg.rules import when
-from vsg.rules import while_loop
-from vsg.rules import whitespace
-from vsg.rules import with_statement
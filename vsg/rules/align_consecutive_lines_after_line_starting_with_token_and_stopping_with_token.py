@@ -50,9 +50,9 @@ class align_consecutive_lines_after_line_starting_with_token_and_stopping_with_t
                if isinstance(oToken, self.stop_token):
                    break
 
-               if isinstance(oToken, parser.carriage_return):
+               if oToken.category & parser.iCarriageReturn:
                    iLine += 1
-                   if isinstance(lTokens[iIndex + 1], parser.whitespace):
+                   if lTokens[iIndex + 1].category & parser.iWhitespace:
                        if len(lTokens[iIndex + 1].get_value()) != iWhitespaceLength:
                            oLineTokens = oFile.get_tokens_from_line(iLine)
                            oViolation = violation.New(iLine, oLineTokens, self.solution)
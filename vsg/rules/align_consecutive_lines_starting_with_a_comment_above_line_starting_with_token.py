@@ -52,7 +52,7 @@ class align_consecutive_lines_starting_with_a_comment_above_line_starting_with_t
                    break
 
                if iIndex == 0:
-                   if isinstance(lTokens[0], parser.whitespace):
+                   if lTokens[0].category & parser.iWhitespace:
                        if len(lTokens[0].get_value()) != iWhitespaceLength:
                            oLineTokens = oFile.get_tokens_from_line(iLine)
                            oViolation = violation.New(iLine, oLineTokens, self.solution)
@@ -72,9 +72,9 @@ class align_consecutive_lines_starting_with_a_comment_above_line_starting_with_t
                        self.add_violation(oViolation)
                        self._adjust_token_indent(lTokens[0], iTargetIndent)
 
-               if isinstance(oToken, parser.carriage_return):
+               if oToken.category & parser.iCarriageReturn:
                    iLine += 1
-                   if isinstance(lTokens[iIndex + 1], parser.whitespace):
+                   if lTokens[iIndex + 1].category & parser.iWhitespace:
                        if len(lTokens[iIndex + 1].get_value()) != iWhitespaceLength:
                            oLineTokens = oFile.get_tokens_from_line(iLine)
                            oViolation = violation.New(iLine, oLineTokens, self.solution)
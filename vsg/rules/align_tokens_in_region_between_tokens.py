@@ -76,7 +76,7 @@ class align_tokens_in_region_between_tokens(rule.Rule):
                            dAnalysis[iLine]['token_index'] = iToken
                            dAnalysis[iLine]['line_number'] = iLine
                            dAnalysis[iLine]['token_value'] = oToken.get_value()
-                           if isinstance(lTokens[iIndex -1], parser.whitespace):
+                           if lTokens[iIndex -1].category & parser.iWhitespace:
                                dAnalysis[iLine]['left_column'] = iColumn - len(lTokens[iIndex - 1].get_value())
                            else:
                                dAnalysis[iLine]['left_column'] = iColumn
@@ -108,7 +108,7 @@ class align_tokens_in_region_between_tokens(rule.Rule):
 
                    dAnalysis = {}
 
-               if isinstance(oToken, parser.carriage_return):
+               if oToken.category & parser.iCarriageReturn:
                    iLine += 1
                    iColumn = 0
                    bTokenFound = False
@@ -158,7 +158,7 @@ class align_tokens_in_region_between_tokens(rule.Rule):
         dAction = oViolation.get_action()
         iTokenIndex = dAction['token_index']
 
-        if isinstance(lTokens[iTokenIndex - 1], parser.whitespace):
+        if lTokens[iTokenIndex - 1].category & parser.iWhitespace:
             iLen = len(lTokens[iTokenIndex - 1].get_value())
             lTokens[iTokenIndex - 1].set_value(' '*(iLen + dAction['adjust']))
         else:
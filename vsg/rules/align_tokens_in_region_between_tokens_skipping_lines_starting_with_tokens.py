@@ -83,7 +83,7 @@ class align_tokens_in_region_between_tokens_skipping_lines_starting_with_tokens(
                            dAnalysis[iLine]['token_column'] = iColumn
                            dAnalysis[iLine]['token_index'] = iToken
                            dAnalysis[iLine]['line_number'] = iLine
-                           if isinstance(lTokens[iIndex -1], parser.whitespace):
+                           if lTokens[iIndex -1].category & parser.iWhitespace:
                                dAnalysis[iLine]['left_column'] = iColumn - len(lTokens[iIndex - 1].get_value())
                            else:
                                dAnalysis[iLine]['left_column'] = iColumn
@@ -115,12 +115,12 @@ class align_tokens_in_region_between_tokens_skipping_lines_starting_with_tokens(
 
                    dAnalysis = {}
 
-               if isinstance(oToken, parser.comment):
+               if oToken.category & parser.iComment:
                    iLeftColumn -= lTokens[iIndex].length()
-                   if isinstance(lTokens[iIndex - 1], parser.whitespace):
+                   if lTokens[iIndex - 1].category & parser.iWhitespace:
                        iLeftColumn -= lTokens[iIndex - 1].length()
 
-               if isinstance(oToken, parser.carriage_return):
+               if oToken.category & parser.iCarriageReturn:
 
                    iMaxColumn = max(iMaxColumn, iLeftColumn)
                    iLeftColumn = 0
@@ -190,7 +190,7 @@ class align_tokens_in_region_between_tokens_skipping_lines_starting_with_tokens(
         dAction = oViolation.get_action()
         iTokenIndex = dAction['token_index']
 
-        if isinstance(lTokens[iTokenIndex - 1], parser.whitespace):
+        if lTokens[iTokenIndex - 1].category & parser.iWhitespace:
             iLen = len(lTokens[iTokenIndex - 1].get_value())
             lTokens[iTokenIndex - 1].set_value(' '*(iLen + dAction['adjust']))
         else:
@@ -88,7 +88,7 @@ class align_tokens_in_region_between_tokens_when_between_tokens_unless_between_t
                            dAnalysis[iLine]['token_index'] = iToken
                            dAnalysis[iLine]['line_number'] = iLine
                            dAnalysis[iLine]['token_value'] = oToken.get_value()
-                           if isinstance(lTokens[iIndex -1], parser.whitespace):
+                           if lTokens[iIndex -1].category & parser.iWhitespace:
                                dAnalysis[iLine]['left_column'] = iColumn - len(lTokens[iIndex - 1].get_value())
                            else:
                                dAnalysis[iLine]['left_column'] = iColumn
@@ -96,7 +96,7 @@ class align_tokens_in_region_between_tokens_when_between_tokens_unless_between_t
 
                    iColumn += len(oToken.get_value())
 
-               if isinstance(oToken, parser.carriage_return):
+               if oToken.category & parser.iCarriageReturn:
                    iLine += 1
                    iColumn = 0
                    bTokenFound = False
@@ -177,7 +177,7 @@ class align_tokens_in_region_between_tokens_when_between_tokens_unless_between_t
         dAction = oViolation.get_action()
         iTokenIndex = dAction['token_index']
 
-        if isinstance(lTokens[iTokenIndex - 1], parser.whitespace):
+        if lTokens[iTokenIndex - 1].category & parser.iWhitespace:
             iLen = len(lTokens[iTokenIndex - 1].get_value())
             lTokens[iTokenIndex - 1].set_value(' '*(iLen + dAction['adjust']))
         else:
@@ -219,7 +219,7 @@ def check_for_exclusions(oToken, bSkip, oEndSkipToken, lUnless):
 
 def check_for_if_keywords(iToken, lTokens):
     iMyToken = iToken
-    if isinstance(lTokens[iToken], parser.whitespace):
+    if lTokens[iToken].category & parser.iWhitespace:
         iMyToken += 1
 
     if isinstance(lTokens[iMyToken], token.if_statement.if_label):
@@ -242,7 +242,7 @@ def check_for_if_keywords(iToken, lTokens):
 
 def check_for_case_keywords(iToken, lTokens):
     iMyToken = iToken
-    if isinstance(lTokens[iToken], parser.whitespace):
+    if lTokens[iToken].category & parser.iWhitespace:
         iMyToken += 1
 
     if isinstance(lTokens[iMyToken], token.case_statement.case_label):
@@ -63,7 +63,7 @@ def _analyze_require_blank_line(self, lToi, lAllowTokens):
             if _is_allowed_token(lAllowTokens, lTokens):
                 continue
             if len(lTokens) == 1:
-                if isinstance(lTokens[0], parser.blank_line):
+                if lTokens[0].category & parser.iBlankLine:
                     continue
             sSolution = 'Insert blank line below'
             oViolation = violation.New(oToi.get_line_number() - 1, oToi, sSolution)
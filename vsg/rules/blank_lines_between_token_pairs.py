@@ -44,7 +44,7 @@ class blank_lines_between_token_pairs(rule.Rule):
             for iToken, oToken in enumerate(lTokens):
                 iLine = utils.increment_line_number(iLine, oToken)
 
-                if isinstance(oToken, parser.blank_line):
+                if oToken.category & parser.iBlankLine:
                     oNewToi = oToi.extract_tokens(iToken, iToken + 1)
                     oViolation = violation.New(iLine, oNewToi, self.solution)
                     self.add_violation(oViolation)
@@ -48,7 +48,7 @@ class move_token_next_to_another_token_if_it_exists_between_tokens(rule.Rule):
                     iStartIndex = iToken
                 if isinstance(oToken, self.token_to_move):
                     iMoveIndex = iToken
-                    if not (iStartIndex + 2 == iMoveIndex and isinstance(lTokens[iStartIndex + 1], parser.whitespace)):
+                    if not (iStartIndex + 2 == iMoveIndex and lTokens[iStartIndex + 1].category & parser.iWhitespace):
                         oViolation = violation.New(oToi.get_line_number(), oToi, self.solution)
                         dAction = {}
                         dAction['insertIndex'] = iStartIndex + 1
@@ -73,7 +73,7 @@ class move_token_sequences_left_of_token(rule.Rule):
         lTokens = oViolation.get_tokens()
         dAction = oViolation.get_action()
         bInsertBlankLine = False
-        if isinstance(lTokens[0], parser.whitespace):
+        if lTokens[0].category & parser.iWhitespace:
             lTokens = lTokens[1:]
             bInsertBlankLine = True
         lMoveTokens = lTokens[0:dAction['num_tokens']]
@@ -67,14 +67,14 @@ class multiline_alignment_between_tokens(rule.Rule):
 
                 iLine = utils.increment_line_number(iLine, oToken)
 
-                if isinstance(oToken, parser.blank_line):
+                if oToken.category & parser.iBlankLine:
                     continue
 
                 if bSkipCommentLine:
-                   if not isinstance(oToken, parser.carriage_return):
+                   if not oToken.category & parser.iCarriageReturn:
                        continue
 
-                if isinstance(oToken, parser.carriage_return):
+                if oToken.category & parser.iCarriageReturn:
                     iColumn = 0
                     bSkipCommentLine = rules_utils.does_line_start_with_comment(lTokens[iToken + 1:iToken + 3])
                     if bSkipCommentLine:
@@ -189,14 +189,14 @@ def is_token_before_carriage_return(tToken, lTokens):
     for oToken in lTokens:
         if isinstance(oToken, tToken):
             return True
-        if isinstance(oToken, parser.carriage_return):
+        if oToken.category & parser.iCarriageReturn:
             return False
     return False
 
 
 def _set_column_adjustment(iToken, lTokens):
     iReturn = 0
-    if isinstance(lTokens[iToken + 1], parser.whitespace):
+    if lTokens[iToken + 1].category & parser.iWhitespace:
         if isinstance(lTokens[iToken + 2], parser.close_parenthesis):
             iReturn = -1
     else:
@@ -207,7 +207,7 @@ def _set_column_adjustment(iToken, lTokens):
 
 def _set_indent(iToken, lTokens):
     iReturn = 0
-    if isinstance(lTokens[iToken + 1], parser.whitespace):
+    if lTokens[iToken + 1].category & parser.iWhitespace:
         iReturn = len(lTokens[iToken + 1].get_value())
     else:
         iReturn = 0
@@ -44,8 +44,8 @@ class n_spaces_after_tokens(rule.Rule):
             dAction = {}
 
             oRight = lTokens[-1]
-            if not isinstance(oRight, parser.carriage_return):
-                if isinstance(oRight, parser.whitespace):
+            if not oRight.category & parser.iCarriageReturn:
+                if oRight.category & parser.iWhitespace:
                     if self.bNIsMinimum:
                         if self.iSpaces > len(oRight.get_value()):
                             dAction['right'] = {}
@@ -42,7 +42,7 @@ class n_spaces_before_and_after_tokens(rule.Rule):
             iLine, lTokens = utils.get_toi_parameters(oToi)
 
             fStartLine = False
-            if isinstance(lTokens[0], parser.carriage_return) and isinstance(lTokens[1], parser.whitespace):
+            if lTokens[0].category & parser.iCarriageReturn and lTokens[1].category & parser.iWhitespace:
                 fStartLine = True
 
             myToi = oToi.extract_tokens(1, 3)
@@ -97,8 +97,8 @@ def create_solution_text(dAction, iNumSpaces, lTokens):
 def check_spaces_on_left_side(lTokens, fStartLine, bNIsMinimum, dAction, iSpaces):
     if not fStartLine:
         oLeft = lTokens[0]
-        if not isinstance(oLeft, parser.carriage_return):
-            if isinstance(oLeft, parser.whitespace):
+        if not oLeft.category & parser.iCarriageReturn:
+            if oLeft.category & parser.iWhitespace:
                 if bNIsMinimum:
                     if iSpaces > len(oLeft.get_value()):
                         dAction['left'] = {}
@@ -113,8 +113,8 @@ def check_spaces_on_left_side(lTokens, fStartLine, bNIsMinimum, dAction, iSpaces
 
 def check_spaces_on_right_side(lTokens, bNIsMinimum, dAction, iSpaces):
     oRight = lTokens[-1]
-    if not isinstance(oRight, parser.carriage_return):
-        if isinstance(oRight, parser.whitespace):
+    if not oRight.category & parser.iCarriageReturn:
+        if oRight.category & parser.iWhitespace:
             if bNIsMinimum:
                 if iSpaces > len(oRight.get_value()):
                     dAction['right'] = {}
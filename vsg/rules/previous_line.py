@@ -111,7 +111,7 @@ def _analyze_require_blank_line(self, lToi, lAllowTokens):
             if _is_allowed_token(lAllowTokens, lTokens):
                 continue
             if len(lTokens) == 1:
-                if isinstance(lTokens[0], parser.blank_line):
+                if lTokens[0].category & parser.iBlankLine:
                     continue
             oViolation = violation.New(oToi.get_line_number(), oToi, self.solution)
             dAction = {}
@@ -126,10 +126,10 @@ def _analyze_no_code(self, lToi, lAllowTokens):
             if _is_allowed_token(lAllowTokens, lTokens):
                 continue
             if len(lTokens) == 1:
-                if isinstance(lTokens[0], parser.blank_line) or isinstance(lTokens[0], parser.comment):
+                if lTokens[0].category & (parser.iBlankLine | parser.iComment):
                     continue
             elif len(lTokens) == 2:
-                if isinstance(lTokens[0], parser.whitespace) and isinstance(lTokens[1], parser.comment):
+                if lTokens[0].category & parser.iWhitespace and lTokens[1].category & parser.iComment:
                     continue
             oViolation = violation.New(oToi.get_line_number(), oToi, self.solution)
             dAction = {}
@@ -157,10 +157,10 @@ def _analyze_require_comment(self, lToi, lAllowTokens):
             if _is_allowed_token(lAllowTokens, lTokens):
                 continue
             if len(lTokens) == 1:
-                if isinstance(lTokens[0], parser.blank_line):
+                if lTokens[0].category & parser.iBlankLine:
                     continue
             elif len(lTokens) == 2:
-                if isinstance(lTokens[0], parser.whitespace) and isinstance(lTokens[1], parser.comment) and self.allow_comment:
+                if lTokens[0].category & parser.iWhitespace and lTokens[1].category & parser.iComment and self.allow_comment:
                     continue
             oViolation = violation.New(oToi.get_line_number(), oToi, self.solution)
             dAction = {}
@@ -185,9 +185,9 @@ def _is_allowed_token(lAllowTokens, lTokens):
 
 def _comment_starts_line(lTokens):
     if len(lTokens) == 1:
-      if isinstance(lTokens[0], parser.comment):
+      if lTokens[0].category & parser.iComment:
           return True
     elif len(lTokens) == 2:
-      if isinstance(lTokens[0], parser.whitespace) and isinstance(lTokens[1], parser.comment):
+      if lTokens[0].category & parser.iWhitespace and lTokens[1].category & parser.iComment:
           return True
     return False
@@ -39,7 +39,7 @@ class remove_blank_lines_above_line_starting_with_token(rule.Rule):
             iLine = oToi.get_line_number()
 
             for iToken, oToken in enumerate(lTokens):
-               if isinstance(oToken, parser.carriage_return):
+               if oToken.category & parser.iCarriageReturn:
                    iLine += 1
                    for oSearchToken in self.lTokens:
                        if utils.are_next_consecutive_token_types([parser.whitespace, oSearchToken], iToken + 1, lTokens) or \
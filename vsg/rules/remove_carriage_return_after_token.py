@@ -43,7 +43,7 @@ class remove_carriage_return_after_token(rule.Rule):
             lTokens = oToi.get_tokens()
             for iToken, oToken in enumerate(lTokens[:len(lTokens)]):
                 if iToken < 3:
-                    if isinstance(oToken, parser.carriage_return):
+                    if oToken.category & parser.iCarriageReturn:
                         oViolation = violation.New(oToi.get_line_number(), oToi, self.solution)
                         self.add_violation(oViolation)
                         break
@@ -54,7 +54,7 @@ class remove_carriage_return_after_token(rule.Rule):
         lTokens = utils.remove_carriage_returns_from_token_list(lTokens)
         lTokens = utils.remove_consecutive_whitespace_tokens(lTokens)
         if self.bInsertSpace:
-            if not isinstance(lTokens[1], parser.whitespace):
+            if not lTokens[1].category & parser.iWhitespace:
                 rules_utils.insert_whitespace(lTokens, 1)
 
         oViolation.set_tokens(lTokens)
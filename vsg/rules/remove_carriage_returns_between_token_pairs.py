@@ -46,7 +46,7 @@ class remove_carriage_returns_between_token_pairs(rule.Rule):
         for oToi in lToi:
             lTokens = oToi.get_tokens()
             for oToken in lTokens:
-                if isinstance(oToken, parser.carriage_return):
+                if oToken.category & parser.iCarriageReturn:
                     oViolation = violation.New(oToi.get_line_number(), oToi, self.solution)
                     self.add_violation(oViolation)
                     break
@@ -57,7 +57,7 @@ class remove_carriage_returns_between_token_pairs(rule.Rule):
         lTokens = utils.remove_carriage_returns_from_token_list(lTokens)
         lTokens = utils.remove_consecutive_whitespace_tokens(lTokens)
         if self.bInsertSpace:
-            if not isinstance(lTokens[1], parser.whitespace):
+            if not lTokens[1].category & parser.iWhitespace:
                 rules_utils.insert_whitespace(lTokens, 1)
 
         oViolation.set_tokens(lTokens)
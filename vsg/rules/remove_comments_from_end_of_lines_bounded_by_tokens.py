@@ -39,15 +39,15 @@ class remove_comments_from_end_of_lines_bounded_by_tokens(rule.Rule):
             lTokens = oToi.get_tokens()
             iLine = oToi.get_line_number()
             for iToken, oToken in enumerate(lTokens):
-                if isinstance(oToken, parser.carriage_return):
+                if oToken.category & parser.iCarriageReturn:
                     iLine += 1
-                if isinstance(oToken, parser.comment):
-                    if isinstance(lTokens[iToken + 1], parser.carriage_return):
-                        if isinstance(lTokens[iToken - 1], parser.carriage_return) or \
-                           isinstance(lTokens[iToken - 2], parser.carriage_return):
+                if oToken.category & parser.iComment:
+                    if lTokens[iToken + 1].category & parser.iCarriageReturn:
+                        if lTokens[iToken - 1].category & parser.iCarriageReturn or \
+                           lTokens[iToken - 2].category & parser.iCarriageReturn:
                             continue
                         else:
-                            if isinstance(lTokens[iToken - 1], parser.whitespace):
+                            if lTokens[iToken - 1].category & parser.iWhitespace:
                                 oNewToi = oToi.extract_tokens(iToken - 1, iToken)
                             else:
                                 oNewToi = oToi.extract_tokens(iToken, iToken)
@@ -41,7 +41,7 @@ class remove_excessive_blank_lines_above_line_starting_with_token(rule.Rule):
             iCount = 0
             iLine = 0
             for oToken in lTokens:
-                if isinstance(oToken, parser.blank_line):
+                if oToken.category & parser.iBlankLine:
                     iCount += 1
                 iLine = utils.increment_line_number(iLine, oToken)
             bOverride = check_if_override_exists(oFile, oToi.get_line_number() - iLine, self.lOverrides)
@@ -42,7 +42,7 @@ class remove_lines_starting_with_token_between_token_pairs(rule.Rule):
             lTokens = oToi.get_tokens()
             iLine = oToi.get_line_number()
             for iToken, oToken in enumerate(lTokens):
-                if isinstance(oToken, parser.carriage_return):
+                if oToken.category & parser.iCarriageReturn:
                     iLine += 1
                     if utils.are_next_consecutive_token_types([parser.whitespace, self.oRemoveToken], iToken + 1, lTokens):
                         oSubToi = oToi.extract_tokens(iToken, iToken + 2)
@@ -37,7 +37,7 @@ class remove_token_and_whitespace_before_it(rule.Rule):
 
     def _fix_violation(self, oViolation):
         lTokens = oViolation.get_tokens()
-        if isinstance(lTokens[0], parser.whitespace):
+        if lTokens[0].category & parser.iWhitespace:
             oViolation.set_tokens([])
         else:
             oViolation.set_tokens(lTokens[1])
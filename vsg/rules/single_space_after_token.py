@@ -35,9 +35,9 @@ class single_space_after_token(rule.Rule):
     def _analyze(self, lToi):
         for oToi in lToi:
             lTokens = oToi.get_tokens()
-            if isinstance(lTokens[1], parser.carriage_return):
+            if lTokens[1].category & parser.iCarriageReturn:
                 continue
-            if not isinstance(lTokens[1], parser.whitespace):
+            if not lTokens[1].category & parser.iWhitespace:
                 sSolution = 'Ensure a single space after ' + lTokens[0].get_value()
                 oViolation = violation.New(oToi.get_line_number(), oToi, sSolution)
                 oViolation.set_action('insert')
@@ -35,9 +35,9 @@ class single_space_before_token(rule.Rule):
     def _analyze(self, lToi):
         for oToi in lToi:
             lTokens = oToi.get_tokens()
-            if isinstance(lTokens[0], parser.carriage_return):
+            if lTokens[0].category & parser.iCarriageReturn:
                 continue
-            if not isinstance(lTokens[0], parser.whitespace):
+            if not lTokens[0].category & parser.iWhitespace:
                 sSolution = 'Ensure a single space before ' + lTokens[1].get_value()
                 oViolation = violation.New(oToi.get_line_number(), oToi, sSolution)
                 oViolation.set_action('insert')
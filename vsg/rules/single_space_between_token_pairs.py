@@ -57,7 +57,7 @@ class single_space_between_token_pairs(rule.Rule):
 
     def _fix_violation(self, oViolation):
         lTokens = oViolation.get_tokens()
-        if isinstance(lTokens[1], parser.whitespace):
+        if lTokens[1].category & parser.iWhitespace:
             lTokens[1].set_value(' ')
         else:
             rules_utils.insert_whitespace(lTokens, 1)
@@ -50,7 +50,7 @@ class split_line_at_token_if_on_same_line_as_token_if_token_pair_are_not_on_the_
             lTokens = oToi.get_tokens()
             iLine = oToi.get_line_number()
             for iToken, oToken in enumerate(lTokens):
-                if isinstance(oToken, parser.carriage_return):
+                if oToken.category & parser.iCarriageReturn:
                     iLine += 1
                 if isinstance(oToken, self.oSameLineToken):
                     if utils.are_next_consecutive_token_types([parser.whitespace, self.oToken], iToken + 1, lTokens) or \
@@ -74,7 +74,7 @@ def extract_multi_line_statements(lToi):
     for oToi in lToi:
         lTokens = oToi.get_tokens()
         for oToken in lTokens:
-            if isinstance(oToken, parser.carriage_return):
+            if oToken.category & parser.iCarriageReturn:
                 lReturn.append(oToi)
                 break
     return lReturn
@@ -44,7 +44,7 @@ class split_line_at_token_when_between_tokens(rule.Rule):
     def _analyze(self, lToi):
         for oToi in lToi:
             lTokens = oToi.get_tokens()
-            if isinstance(lTokens[0], parser.carriage_return) or isinstance(lTokens[1], parser.carriage_return):
+            if lTokens[0].category & parser.iCarriageReturn or lTokens[1].category & parser.iCarriageReturn:
                 continue
             sSolution = self.solution
             oViolation = violation.New(oToi.get_line_number(), oToi, sSolution)
@@ -52,7 +52,7 @@ class split_line_at_token_when_between_tokens(rule.Rule):
 
     def _fix_violation(self, oViolation):
         lTokens = oViolation.get_tokens()
-        if isinstance(lTokens[1], parser.whitespace):
+        if lTokens[1].category & parser.iWhitespace:
             rules_utils.insert_carriage_return(lTokens, -2)
         else:
             rules_utils.insert_carriage_return(lTokens, -1)
@@ -59,7 +59,7 @@ class token_case_formal_part_of_association_element_in_map_between_tokens(rule.R
                 if isinstance(oToken, self.oMapEnd):
                     bMapFound = False
                     break
-                if isinstance(oToken, parser.carriage_return):
+                if oToken.category & parser.iCarriageReturn:
                    iLine += 1
 
                 if isinstance(oToken, token.association_element.formal_part) and not bFormalFound and bMapFound:
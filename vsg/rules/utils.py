@@ -9,7 +9,7 @@ def add_optional_item(lTokens, oViolation, oInsertToken):
 
 
 def remove_optional_item(lTokens, oViolation, oInsertToken):
-    if isinstance(lTokens[0], parser.whitespace):
+    if lTokens[0].category & parser.iWhitespace:
         oViolation.set_tokens([])
     else:
         oViolation.set_tokens([lTokens[0]])
@@ -18,7 +18,7 @@ def remove_optional_item(lTokens, oViolation, oInsertToken):
 def is_single_line(oToi):
     lTokens = oToi.get_tokens()
     for oToken in lTokens:
-        if isinstance(oToken, parser.carriage_return):
+        if oToken.category & parser.iCarriageReturn:
             return False
     return True
 
@@ -26,7 +26,7 @@ def is_single_line(oToi):
 def number_of_carriage_returns(lTokens):
     iReturn = 0
     for oToken in lTokens:
-        if isinstance(oToken, parser.carriage_return):
+        if oToken.category & parser.iCarriageReturn:
             iReturn += 1
     return iReturn
 
@@ -39,9 +39,9 @@ def print_debug(lTokens):
 
 
 def does_line_start_with_comment(lTokens):
-    if isinstance(lTokens[0], parser.comment):
+    if lTokens[0].category & parser.iComment:
         return True
-    if isinstance(lTokens[0], parser.whitespace) and isinstance(lTokens[1], parser.comment):
+    if lTokens[0].category & parser.iWhitespace and lTokens[1].category & parser.iComment:
         return True
     return False
 
@@ -101,7 +101,7 @@ def get_index_of_token_in_list(oToken, lTokens):
 
 
 def get_indent_of_line(lTokens):
-    if isinstance(lTokens[0], parser.whitespace):
+    if lTokens[0].category & parser.iWhitespace:
         return lTokens[1].get_indent()
     else:
         return lTokens[0].get_indent()
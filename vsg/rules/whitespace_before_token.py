@@ -38,10 +38,10 @@ class whitespace_before_token(rule.Rule):
         for oToi in lToi:
             lTokens = oToi.get_tokens()
 
-            if isinstance(lTokens[0], parser.whitespace):
+            if lTokens[0].category & parser.iWhitespace:
                 continue
 
-            if isinstance(lTokens[0], parser.carriage_return):
+            if lTokens[0].category & parser.iCarriageReturn:
                 continue
 
             oViolation = violation.New(oToi.get_line_number(), oToi, self.solution)
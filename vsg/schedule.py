@@ -0,0 +1,126 @@
+
+import os
+import sys
+
+iBytesPerJob = 65536
+
+
+def get_file_size(sFileName):
+    '''
+    Returns the size of a file in bytes.
+
+    Parameters:
+
+      sFileName: (string)
+
+    Returns: (integer) zero if the file can not be accessed
+    '''
+    try:
+        return os.path.getsize(sFileName)
+    except OSError:
+        return 0
+
+
+def get_cpu_count():
+    '''
+    Returns the number of cpu cores this process is allowed to run on.
+
+    Returns: (integer)
+    '''
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_number_of_jobs(jobs, lFileNames):
+    '''
+    Returns the number of processes to analyze files with.
+
+    When jobs is auto, every process is given at least iBytesPerJob bytes of files to analyze.
+    Below that the cost of starting a process is larger than the time it saves, so small runs use a single process.
+
+    Parameters:
+
+      jobs: (integer or string) the value of the --jobs option
+
+      lFileNames: (list of strings)
+
+    Returns: (integer)
+    '''
+    if jobs != 'auto':
+        return jobs
+
+    iTotalSize = 0
+    for sFileName in lFileNames:
+        iTotalSize += get_file_size(sFileName)
+
+    iJobs = min(get_cpu_count(), len(lFileNames), iTotalSize // iBytesPerJob)
+    if sys.platform == "win32":
+        # Work around https://bugs.python.org/issue26903
+        iJobs = min(iJobs, 60)
+    return max(1, iJobs)
+
+
+def create_batches(lFileNames, iJobs, iBatchesPerJob=8):
+    '''
+    Groups files into batches which are handed to the workers of a multiprocessing.Pool.
+
+    The files are ordered largest first so the longest running files start immediately and cannot be left until the end.
+    Small files are grouped together until a batch holds roughly 1/(iJobs * iBatchesPerJob) of the total size, which keeps the overhead per task low.
+    Files larger than that are placed in a batch of their own.
+
+    Parameters:
+
+      lFileNames: (list of strings)
+
+      iJobs: (integer)
+
+      iBatchesPerJob: (integer)
+
+    Returns: (list of lists of (integer, string) tuples)
+      The integer is the index of the file in lFileNames.
+    '''
+    lSizes = []
+    for sFileName in lFileNames:
+        lSizes.append(get_file_size(sFileName))
+
+    iTargetSize = max(1, sum(lSizes) // max(1, iJobs * iBatchesPerJob))
+
+    lIndexes = sorted(range(0, len(lFileNames)), key=lambda iIndex: lSizes[iIndex], reverse=True)
+
+    lReturn = []
+    lBatch = []
+    iBatchSize = 0
+    for iIndex in lIndexes:
+        lBatch.append((iIndex, lFileNames[iIndex]))
+        iBatchSize += lSizes[iIndex]
+        if iBatchSize >= iTargetSize:
+            lReturn.append(lBatch)
+            lBatch = []
+            iBatchSize = 0
+    if len(lBatch) > 0:
+        lReturn.append(lBatch)
+
+    return lReturn
+
+
+def collect_in_order(iterResults):
+    '''
+    Yields results in increasing index order while they arrive in any order.
+    Results are yielded as soon as all results with a lower index have been yielded.
+
+    Parameters:
+
+      iterResults: (iterable of lists of (integer, result) tuples)
+
+    Returns: (generator of results)
+    '''
+    dPending = {}
+    iNext = 0
+    for lResults in iterResults:
+        for iIndex, tResult in lResults:
+            dPending[iIndex] = tResult
+        while iNext in dPending:
+            yield dPending.pop(iNext)
+            iNext += 1
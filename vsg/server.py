@@ -0,0 +1,197 @@
+
+import copy
+import errno
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+
+from . import apply_rules
+from . import vhdlFile
+
+from .vhdlFile import reader
+
+
+class request_handler(socketserver.StreamRequestHandler):
+    '''
+    Handles a connection from a client.
+
+    Every line received is a JSON encoded request with the following keys:
+
+      filename: (string) name of the file to analyze, relative to cwd
+      cwd: (string) (optional) directory the client was started in
+      content: (string) (optional) text to analyze instead of reading the file
+      output_format: (string) (optional) overrides the output format the server was started with
+
+    Every request is answered with a single line containing a JSON encoded dictionary with the following keys:
+
+      status: (integer) 1 if errors were found, 0 otherwise
+      stdout: (string) output which would have been printed to stdout
+      stderr: (string) output which would have been printed to stderr
+    '''
+
+    def handle(self):
+        for bLine in self.rfile:
+            try:
+                dRequest = json.loads(bLine.decode('utf-8'))
+                dResponse = self.server.analyze(dRequest)
+            except (ValueError, KeyError, TypeError) as e:
+                dResponse = create_response(1, None, 'ERROR: invalid request: ' + str(e))
+            self.wfile.write(json.dumps(dResponse).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class server(socketserver.UnixStreamServer):
+    '''
+    Keeps the rules and configuration loaded and analyzes files sent by clients over a Unix domain socket.
+    Requests are handled one at a time.
+
+    Parameters:
+
+      sSocketPath: (string)
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+    '''
+
+    def __init__(self, sSocketPath, commandLineArguments, oConfig):
+        # The socket is only removed on close once this server has bound it
+        self.sSocketPath = None
+        remove_stale_socket(sSocketPath)
+        socketserver.UnixStreamServer.__init__(self, sSocketPath, request_handler)
+        self.sSocketPath = sSocketPath
+        self.commandLineArguments = copy.copy(commandLineArguments)
+        self.commandLineArguments.fix = False
+        self.commandLineArguments.junit = None
+        self.commandLineArguments.json = None
+        self.oConfig = oConfig
+        # Load the rules before the first request arrives
+        oRules = apply_rules.create_rule_list(vhdlFile.vhdlFile(['']), oConfig, commandLineArguments.local_rules, None)
+        oRules.load_enabled_rules()
+
+    def analyze(self, dRequest):
+        '''
+        Analyzes the file described by a request.
+
+        Parameters:
+
+          dRequest: (dictionary)
+
+        Returns: (dictionary)
+        '''
+        commandLineArguments = self.commandLineArguments
+        if dRequest.get('output_format') is not None:
+            commandLineArguments = copy.copy(self.commandLineArguments)
+            commandLineArguments.output_format = dRequest['output_format']
+
+        sFileName = dRequest['filename']
+        lFileContent = None
+        if dRequest.get('content') is not None:
+            lFileContent = list(io.StringIO(dRequest['content'], newline=None))
+
+        sReturnPath = os.getcwd()
+        try:
+            if dRequest.get('cwd') is not None:
+                os.chdir(dRequest['cwd'])
+            fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = apply_rules.apply_rules(commandLineArguments, self.oConfig, (0, sFileName), lFileContent)
+        except OSError as e:
+            return create_response(1, None, f'ERROR: encountered {e.__class__.__name__} while analyzing {sFileName}')
+        finally:
+            os.chdir(sReturnPath)
+
+        return create_response(fStatus, sOutputStd, sOutputErr)
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if self.sSocketPath is None:
+            return
+        try:
+            os.remove(self.sSocketPath)
+        except OSError:
+            pass
+
+
+def create_response(fStatus, sOutputStd, sOutputErr):
+    dReturn = {}
+    dReturn['status'] = int(bool(fStatus))
+    dReturn['stdout'] = sOutputStd
+    dReturn['stderr'] = sOutputErr
+    return dReturn
+
+
+def remove_stale_socket(sSocketPath):
+    '''
+    Removes a socket left behind by a server which did not shut down cleanly.
+    A socket is only stale if connecting to it is refused, so the socket of a running server is left alone.
+    Anything other than a socket at the path is left alone.
+
+    Parameters:
+
+      sSocketPath: (string)
+
+    Returns: Nothing
+    '''
+    try:
+        if not stat.S_ISSOCK(os.stat(sSocketPath).st_mode):
+            return
+    except OSError:
+        return
+    oSocket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        oSocket.connect(sSocketPath)
+    except ConnectionRefusedError:
+        try:
+            os.remove(sSocketPath)
+        except OSError:
+            pass
+    except OSError:
+        pass
+    finally:
+        oSocket.close()
+
+
+def terminate(iSignal, oFrame):
+    raise KeyboardInterrupt
+
+
+def serve(sSocketPath, commandLineArguments, oConfig):
+    '''
+    Runs the server until it is interrupted or terminated.
+
+    Parameters:
+
+      sSocketPath: (string)
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+    Returns: Nothing
+    '''
+    if not hasattr(socket, 'AF_UNIX'):
+        print('ERROR: --server requires Unix domain socket support, which is not available on this platform.')
+        sys.exit(1)
+
+    signal.signal(signal.SIGTERM, terminate)
+    reader.disable_memory_map()
+
+    try:
+        oServer = server(sSocketPath, commandLineArguments, oConfig)
+    except OSError as e:
+        if e.errno != errno.EADDRINUSE:
+            raise
+        print('ERROR: another vsg server is listening on ' + sSocketPath)
+        sys.exit(1)
+
+    with oServer:
+        print('INFO: vsg server listening on ' + sSocketPath)
+        sys.stdout.flush()
+        try:
+            oServer.serve_forever()
+        except KeyboardInterrupt:
+            pass
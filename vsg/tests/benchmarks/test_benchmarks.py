@@ -0,0 +1,79 @@
+import sys
+import unittest
+from unittest import mock
+
+from vsg import config
+from vsg import rule_manifest
+from vsg import rule_registry
+from vsg import severity
+
+from vsg.benchmarks import __main__ as benchmarks_main
+from vsg.benchmarks import generator
+from vsg.benchmarks import stages
+
+from vsg import vhdlFile
+
+
+def create_config():
+    oConfig = config.config()
+    oConfig.dConfig = {'debug': False}
+    oConfig.dIndent = config.read_indent_configuration(oConfig.dConfig)
+    oConfig.severity_list = severity.create_list(oConfig.dConfig)
+    return oConfig
+
+
+class testBenchmarks(unittest.TestCase):
+
+    def test_create_design_line_count(self):
+        lLines = generator.create_design(300)
+        self.assertGreaterEqual(len(lLines), 300)
+        self.assertTrue(all(sLine.endswith('\n') for sLine in lLines))
+
+    def test_create_design_scales_with_options(self):
+        lSmall = generator.create_entity(1, 2, 1, 1, 1, 1, False)
+        lLarge = generator.create_entity(1, 8, 3, 4, 2, 2, False)
+        self.assertGreater(len(lLarge), len(lSmall))
+
+    def test_stages_match_vhdlfile(self):
+        lLines = generator.create_design(150)
+        dState = {}
+        for sStage, fStage in stages.create_stages(lLines, create_config(), dState)[0:6]:
+            fStage()
+
+        oFile = vhdlFile.vhdlFile(lLines)
+        lExpected = [(type(oToken), oToken.get_value()) for oToken in oFile.lAllObjects]
+        lActual = [(type(oToken), oToken.get_value()) for oToken in dState['lAllObjects']]
+        self.assertEqual(lExpected, lActual)
+        self.assertEqual(oFile.get_line_count(), dState['oRules'].oVhdlFile.get_line_count())
+
+    def test_run_stages(self):
+        lLines = generator.create_design(100)
+        lActual = stages.run_stages(lLines, create_config(), bMemory=False)
+        self.assertEqual(20, len(lActual))
+        self.assertEqual('lexer.create_objects', lActual[0][0])
+        self.assertEqual('check_rules phase 1', lActual[6][0])
+        self.assertEqual('fix phase 7', lActual[19][0])
+        for sStage, fSeconds, iPeak in lActual:
+            self.assertGreaterEqual(fSeconds, 0.0)
+            self.assertIsNone(iPeak)
+
+    def test_load_rules(self):
+        with mock.patch('vsg.rule_registry.create_rule', wraps=rule_registry.create_rule) as mock_create_rule:
+            stages.load_rules(create_config())
+        self.assertEqual(len(rule_manifest.lRules), mock_create_rule.call_count)
+
+    def test_run_stages_with_memory(self):
+        lActual = stages.run_stages(generator.create_design(50), create_config())
+        for sStage, fSeconds, iPeak in lActual:
+            self.assertGreater(iPeak, 0)
+
+    @mock.patch('sys.stderr')
+    def test_invalid_arguments(self, mock_stderr):
+        for lArguments in [['--ports', '0'], ['--lines', '1000', '0'], ['--depth', '-1']]:
+            with mock.patch.object(sys, 'argv', ['benchmarks'] + lArguments):
+                with self.assertRaises(SystemExit):
+                    benchmarks_main.parse_command_line_arguments()
+        with mock.patch.object(sys, 'argv', ['benchmarks', '--ports', '1', '--processes', '0']):
+            commandLineArguments = benchmarks_main.parse_command_line_arguments()
+        self.assertEqual(1, commandLineArguments.ports)
+        self.assertEqual(0, commandLineArguments.processes)
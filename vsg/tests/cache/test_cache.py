@@ -0,0 +1,130 @@
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+import zlib
+from unittest import mock
+
+from vsg import apply_rules
+from vsg import cache
+from vsg import cmd_line_args
+from vsg import config
+from vsg import parser
+
+from vsg.vhdlFile import token_store
+
+from vsg.tests import utils
+
+dIndentMap = utils.read_indent_file()
+
+sFileName = 'vsg/tests/styles/code_examples/spi_master.vhd'
+
+
+class testCache(unittest.TestCase):
+
+    def setUp(self):
+        self.sCacheDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.sCacheDirectory)
+
+    def test_create_file_digest(self):
+        self.assertEqual(cache.create_file_digest(sFileName), cache.create_file_digest(sFileName))
+        self.assertNotEqual(cache.create_file_digest(sFileName), cache.create_file_digest('vsg/tests/vsg/entity1.vhd'))
+        self.assertIsNone(cache.create_file_digest('no_file.vhd'))
+
+    def test_parse_key_depends_on_indent_configuration(self):
+        sDigest = cache.create_file_digest(sFileName)
+        dIndent = {'indent': {'tokens': {}}}
+        self.assertEqual(cache.create_parse_key(sDigest, dIndentMap), cache.create_parse_key(sDigest, dIndentMap))
+        self.assertNotEqual(cache.create_parse_key(sDigest, dIndentMap), cache.create_parse_key(sDigest, dIndent))
+
+    def test_read_missing_entry(self):
+        self.assertIsNone(cache.read_parse_cache(self.sCacheDirectory, 'missing'))
+
+    def test_read_corrupted_entry(self):
+        os.makedirs(os.path.join(self.sCacheDirectory, 'parse'))
+        with open(os.path.join(self.sCacheDirectory, 'parse', 'corrupted'), 'wb') as oFile:
+            oFile.write(b'not a cache entry')
+        self.assertIsNone(cache.read_parse_cache(self.sCacheDirectory, 'corrupted'))
+
+    def test_read_entry_in_previous_format(self):
+        os.makedirs(os.path.join(self.sCacheDirectory, 'parse'))
+        with open(os.path.join(self.sCacheDirectory, 'parse', 'list'), 'wb') as oFile:
+            oFile.write(zlib.compress(pickle.dumps([parser.item('a')])))
+        self.assertIsNone(cache.read_parse_cache(self.sCacheDirectory, 'list'))
+
+    def test_pickled_entry_is_not_unpickled(self):
+        os.makedirs(os.path.join(self.sCacheDirectory, 'parse'))
+        with open(os.path.join(self.sCacheDirectory, 'parse', 'pickle'), 'wb') as oFile:
+            oFile.write(zlib.compress(pickle.dumps(token_store.create([parser.item('a')]))))
+        with mock.patch('pickle.loads') as mock_loads:
+            self.assertIsNone(cache.read_parse_cache(self.sCacheDirectory, 'pickle'))
+        mock_loads.assert_not_called()
+
+    def test_key_includes_vsg_sources(self):
+        sKey = cache.create_key('parse')
+        self.assertEqual(sKey, cache.create_key('parse'))
+        with mock.patch('vsg.cache.sSourceDigest', 'modified'):
+            self.assertNotEqual(sKey, cache.create_key('parse'))
+
+    def test_create_vhdlfile_from_cache(self):
+        oExpected = apply_rules.create_vhdlfile(sFileName, dIndentMap)
+
+        oFirst = apply_rules.create_vhdlfile(sFileName, dIndentMap, self.sCacheDirectory)
+        self.assertEqual(1, len(os.listdir(os.path.join(self.sCacheDirectory, 'parse'))))
+
+        oSecond = apply_rules.create_vhdlfile(sFileName, dIndentMap, self.sCacheDirectory)
+
+        for oFile in [oFirst, oSecond]:
+            self.assertEqual(oExpected.get_lines(), oFile.get_lines())
+            self.assertEqual(oExpected.oTokenMap.dMap, oFile.oTokenMap.dMap)
+            self.assertEqual([type(oToken) for oToken in oExpected.lAllObjects], [type(oToken) for oToken in oFile.lAllObjects])
+            self.assertEqual([oToken.get_indent() for oToken in oExpected.lAllObjects], [oToken.get_indent() for oToken in oFile.lAllObjects])
+            self.assertEqual(sFileName, oFile.lAllObjects[0].get_filename())
+            self.assertEqual(dIndentMap, oFile.get_indent_map())
+
+    def test_missing_file_is_not_cached(self):
+        oFile = apply_rules.create_vhdlfile('no_file.vhd', dIndentMap, self.sCacheDirectory)
+        self.assertIsNotNone(oFile.eError)
+        self.assertFalse(os.path.isdir(os.path.join(self.sCacheDirectory, 'parse')))
+
+
+class testResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.sCacheDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.sCacheDirectory)
+
+    def run_apply_rules(self, lArguments):
+        sys.argv = ['vsg', '-f', sFileName, '--junit', 'junit.xml', '--json', 'results.json']
+        sys.argv.extend(lArguments)
+        commandLineArguments = cmd_line_args.parse_command_line_arguments()
+        oConfig = config.New(commandLineArguments)
+        fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = apply_rules.apply_rules(commandLineArguments, oConfig, (0, sFileName))
+        return fStatus, testCase.build_junit(), dJsonEntry, sOutputStd, sOutputErr
+
+    def test_replay_matches_analysis(self):
+        for sOutputFormat in ['vsg', 'syntastic', 'summary']:
+            tExpected = self.run_apply_rules(['-of', sOutputFormat])
+            tFirst = self.run_apply_rules(['-of', sOutputFormat, '--cache_dir', self.sCacheDirectory])
+            with mock.patch('vsg.apply_rules.create_rule_list') as mock_create_rule_list:
+                tSecond = self.run_apply_rules(['-of', sOutputFormat, '--cache_dir', self.sCacheDirectory])
+                mock_create_rule_list.assert_not_called()
+            self.assertEqual(tExpected, tFirst)
+            self.assertEqual(tExpected, tSecond)
+
+    def test_configuration_changes_key(self):
+        self.run_apply_rules(['--cache_dir', self.sCacheDirectory])
+        self.run_apply_rules(['--cache_dir', self.sCacheDirectory, '--all_phases'])
+        self.run_apply_rules(['--cache_dir', self.sCacheDirectory, '--style', 'jcl'])
+        self.assertEqual(3, len(os.listdir(os.path.join(self.sCacheDirectory, 'result'))))
+
+    def test_results_are_not_cached_when_debugging(self):
+        with mock.patch('sys.stdout'):
+            self.run_apply_rules(['--cache_dir', self.sCacheDirectory, '--debug'])
+        self.assertFalse(os.path.isdir(os.path.join(self.sCacheDirectory, 'result')))
@@ -0,0 +1,168 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from vsg import apply_rules
+from vsg import changed_lines
+from vsg import cmd_line_args
+from vsg import config
+from vsg import parser
+from vsg import vhdlFile
+
+sFileName = 'vsg/tests/vsg/entity1.vhd'
+
+lDiff = '''diff --git a/src/a.vhd b/src/a.vhd
+index 1111111..2222222 100644
+--- a/src/a.vhd
++++ b/src/a.vhd
+@@ -3 +3 @@ entity a is
+-  port (
++  port(
+@@ -10,0 +11,3 @@ architecture rtl of a is
++  signal s1 : std_logic;
++  signal s2 : std_logic;
++  signal s3 : std_logic;
+@@ -20,2 +23,0 @@ begin
+-  s1 <= '0';
+-  s2 <= '0';
+diff --git a/src/b.vhd b/src/b.vhd
+index 1111111..2222222 100644
+--- a/src/b.vhd
++++ b/src/b.vhd
+@@ -5 +4,0 @@ entity b is
+-  generic (
+diff --git a/src/c.vhd b/src/c.vhd
+deleted file mode 100644
+--- a/src/c.vhd
++++ /dev/null
+@@ -1,2 +0,0 @@
+-entity c is
+-end entity c;
+'''.splitlines()
+
+lCode = '''library ieee;
+entity a is
+end entity a;
+architecture rtl of a is
+begin
+  process begin
+        x<=1;
+  end process;
+end architecture rtl;
+'''.splitlines()
+
+
+class testChangedLines(unittest.TestCase):
+
+    def test_parse_diff(self):
+        dActual = changed_lines.parse_diff(lDiff)
+        self.assertEqual({'src/a.vhd': [(3, 3), (11, 13)]}, dActual)
+
+    def test_is_line_in_ranges(self):
+        lRanges = [(3, 3), (11, 13)]
+        for iLine in [1, 2, 4, 10, 14, 100]:
+            self.assertFalse(changed_lines.is_line_in_ranges(iLine, lRanges), iLine)
+        for iLine in [3, 11, 12, 13]:
+            self.assertTrue(changed_lines.is_line_in_ranges(iLine, lRanges), iLine)
+        self.assertFalse(changed_lines.is_line_in_ranges(1, []))
+
+    def test_filter_file_names(self):
+        dChangedLines = {os.path.realpath(sFileName): [(7, 7)], os.path.realpath('b.vhd'): []}
+        self.assertEqual([sFileName], changed_lines.filter_file_names([sFileName, 'b.vhd', 'c.vhd'], dChangedLines))
+
+    def test_get_line_ranges(self):
+        self.assertIsNone(changed_lines.get_line_ranges(None, sFileName))
+        self.assertEqual([], changed_lines.get_line_ranges({}, sFileName))
+
+    def test_line_ranges_follow_inserted_lines(self):
+        oFile = vhdlFile.vhdlFile(lCode)
+        oFile.set_line_ranges([(2, 2), (7, sys.maxsize)])
+        self.assertEqual([(2, 2), (7, sys.maxsize)], oFile.get_line_ranges())
+
+        iIndex = [type(oToken) for oToken in oFile.lAllObjects].index(parser.carriage_return)
+        oFile.lAllObjects.insert(iIndex, parser.carriage_return())
+        oFile.fix_blank_lines()
+        self.assertEqual([(3, 3), (8, sys.maxsize)], oFile.get_line_ranges())
+
+
+class testApplyRules(unittest.TestCase):
+
+    def setUp(self):
+        sys.argv = ['vsg', '-f', sFileName, '-of', 'syntastic']
+        self.commandLineArguments = cmd_line_args.parse_command_line_arguments()
+        self.oConfig = config.New(self.commandLineArguments)
+
+    def test_violations_outside_ranges_are_dropped(self):
+        self.oConfig.dChangedLines = {os.path.realpath(sFileName): [(1, 6), (8, 20)]}
+        fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = apply_rules.apply_rules(self.commandLineArguments, self.oConfig, (0, sFileName))
+        self.assertFalse(fStatus)
+        self.assertEqual('', sOutputStd)
+
+    def test_violations_inside_ranges_are_reported(self):
+        self.oConfig.dChangedLines = {os.path.realpath(sFileName): [(7, 7)]}
+        fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = apply_rules.apply_rules(self.commandLineArguments, self.oConfig, (0, sFileName))
+        self.assertTrue(fStatus)
+        self.assertEqual('ERROR: vsg/tests/vsg/entity1.vhd(7)port_007 -- Change the number of spaces after the *in* keyword to four spaces.', sOutputStd)
+
+        self.oConfig.dChangedLines = None
+        tActual = apply_rules.apply_rules(self.commandLineArguments, self.oConfig, (0, sFileName))
+        self.assertEqual(sOutputStd, tActual[3])
+
+    def test_fixes_follow_inserted_lines(self):
+        sDirectory = tempfile.mkdtemp()
+        sTempFileName = os.path.join(sDirectory, 'a.vhd')
+        with open(sTempFileName, 'w') as oFile:
+            oFile.write('\n'.join(lCode) + '\n')
+        sys.argv = ['vsg', '-f', sTempFileName, '--fix', '-of', 'syntastic']
+        commandLineArguments = cmd_line_args.parse_command_line_arguments()
+        oConfig = config.New(commandLineArguments)
+        oConfig.dChangedLines = {os.path.realpath(sTempFileName): [(6, 7)]}
+        apply_rules.apply_rules(commandLineArguments, oConfig, (0, sTempFileName))
+        with open(sTempFileName) as oFile:
+            lActual = oFile.read().splitlines()
+        shutil.rmtree(sDirectory)
+        self.assertIn('    x <= 1;', lActual)
+
+
+@unittest.skipIf(shutil.which('git') is None, 'requires git')
+class testGit(unittest.TestCase):
+
+    def setUp(self):
+        self.sReturnPath = os.getcwd()
+        self.sDirectory = tempfile.mkdtemp()
+        os.chdir(self.sDirectory)
+        self.git('init', '-q')
+        with open('a.vhd', 'w') as oFile:
+            oFile.write('line 1\nline 2\nline 3\n')
+        with open('b.vhd', 'w') as oFile:
+            oFile.write('line 1\nline 2\n')
+        self.git('add', 'a.vhd', 'b.vhd')
+        self.git('-c', 'user.name=vsg', '-c', 'user.email=vsg@example.com', 'commit', '-q', '-m', 'initial')
+
+    def tearDown(self):
+        os.chdir(self.sReturnPath)
+        shutil.rmtree(self.sDirectory)
+
+    def git(self, *lArguments):
+        subprocess.run(['git'] + list(lArguments), check=True)
+
+    def test_get_changed_lines(self):
+        with open('a.vhd', 'w') as oFile:
+            oFile.write('line 1\nline two\nline 3\nline 4\n')
+        with open('b.vhd', 'w') as oFile:
+            oFile.write('line 1\n')
+        with open('c.vhd', 'w') as oFile:
+            oFile.write('line 1\n')
+
+        dActual = changed_lines.get_changed_lines('HEAD')
+
+        dExpected = {}
+        dExpected[os.path.realpath('a.vhd')] = [(2, 2), (4, 4)]
+        dExpected[os.path.realpath('c.vhd')] = [(1, sys.maxsize)]
+        self.assertEqual(dExpected, dActual)
+
+    def test_invalid_revision(self):
+        self.assertRaises(OSError, changed_lines.get_changed_lines, 'no_such_revision')
@@ -0,0 +1,105 @@
+import os
+
+import unittest
+
+from vsg import parser
+from vsg import rule_list
+from vsg import severity
+from vsg import violation
+from vsg import vhdlFile
+
+from vsg.rules import entity
+from vsg.vhdlFile import code_tags
+from vsg.vhdlFile.extract import tokens
+
+
+lFile, eError = vhdlFile.utils.read_vhdlfile(os.path.join(os.path.dirname(__file__), 'code_tag_test_input.vhd'))
+oFile = vhdlFile.vhdlFile(lFile)
+
+lNextLineFile, eError = vhdlFile.utils.read_vhdlfile(os.path.join(os.path.dirname(__file__), 'next_line_code_tag_test_input.vhd'))
+oNextLineFile = vhdlFile.vhdlFile(lNextLineFile)
+
+lCodeTags = ['entity_019', 'port_007', 'library_008', 'process_001', 'all']
+
+
+def create_token(lCodeTags):
+    oReturn = parser.item('a')
+    oReturn.set_code_tags(lCodeTags)
+    return oReturn
+
+
+class testCodeTagRegions(unittest.TestCase):
+
+    def test_regions_match_tokens(self):
+        for oVhdlFile in [oFile, oNextLineFile]:
+            lTokens = oVhdlFile.lAllObjects
+            oRegions = code_tags.create_regions(lTokens)
+            for sCodeTag in lCodeTags:
+                lExpected = [oToken.has_code_tag(sCodeTag) for oToken in lTokens]
+                for iIndex in range(len(lTokens)):
+                    self.assertEqual(lExpected[iIndex], oRegions.has_code_tag(sCodeTag, iIndex, iIndex))
+                for iStart in range(0, len(lTokens), 7):
+                    iEnd = min(iStart + 11, len(lTokens) - 1)
+                    self.assertEqual(any(lExpected[iStart:iEnd + 1]), oRegions.has_code_tag(sCodeTag, iStart, iEnd))
+
+    def test_adjacent_regions(self):
+        lTokens = []
+        lTokens.append(create_token([]))
+        lTokens.append(create_token(['entity_019']))
+        lTokens.append(create_token(['all']))
+        lTokens.append(create_token(['entity_019', 'port_007']))
+        lTokens.append(create_token([]))
+        oRegions = code_tags.create_regions(lTokens)
+        self.assertEqual({'entity_019': [1, 3], 'port_007': [3], None: [2]}, oRegions.dStarts)
+        self.assertEqual({'entity_019': [1, 3], 'port_007': [3], None: [2]}, oRegions.dEnds)
+        self.assertTrue(oRegions.has_code_tag('port_007', 0, 2))
+        self.assertFalse(oRegions.has_code_tag('port_007', 0, 1))
+        self.assertFalse(oRegions.has_code_tag('entity_019', 2, 1))
+
+    def test_violation_uses_regions_only_for_tokens_in_the_file(self):
+        lTokens = [create_token([]), create_token(['entity_019']), create_token([])]
+        oRegions = code_tags.create_regions(lTokens)
+
+        oViolation = violation.New(1, tokens.New(1, 1, lTokens[1:2]), '')
+        self.assertTrue(oViolation.has_code_tag('entity_019', oRegions))
+
+        oViolation = violation.New(1, tokens.New(0, 1, lTokens[1:2]), '')
+        self.assertTrue(oViolation.has_code_tag('entity_019', oRegions))
+
+        oViolation = violation.New(1, tokens.New(1, 1, [create_token([])]), '')
+        self.assertFalse(oViolation.has_code_tag('entity_019', oRegions))
+
+        oViolation = violation.New(1, tokens.New(1, 1, []), '')
+        self.assertFalse(oViolation.has_code_tag('entity_019', oRegions))
+
+        oViolation = violation.New(1, tokens.New(0, 2, [lTokens[0], lTokens[2]]), '')
+        self.assertFalse(oRegions.are_tokens_at_index(oViolation.get_tokens(), 0))
+        self.assertFalse(oViolation.has_code_tag('entity_019', oRegions))
+
+    def test_regions_are_not_used_after_the_file_changes(self):
+        oTestFile = vhdlFile.vhdlFile(lFile)
+        oRegions = oTestFile.get_code_tag_regions()
+        lTokens = oTestFile.lAllObjects[0:3]
+        self.assertTrue(oRegions.are_tokens_at_index(lTokens, 0))
+        oTestFile.fix_blank_lines()
+        self.assertFalse(oRegions.is_current())
+        self.assertFalse(oRegions.are_tokens_at_index(lTokens, 0))
+        self.assertTrue(oTestFile.get_code_tag_regions().are_tokens_at_index(lTokens, 0))
+
+    def test_regions_are_created_again_after_update(self):
+        oTestFile = vhdlFile.vhdlFile(lFile)
+        oRegions = oTestFile.get_code_tag_regions()
+        self.assertIs(oRegions, oTestFile.get_code_tag_regions())
+        oRule = entity.rule_019()
+        oRule.fix(oTestFile)
+        oTestFile.fix_blank_lines()
+        self.assertIsNot(oRegions, oTestFile.get_code_tag_regions())
+
+    def test_violations_without_tokens_are_reported_in_suppressed_file(self):
+        lLines = ['-- vsg_off\n']
+        lLines.extend(['\n'] * 2000)
+        oTestFile = vhdlFile.vhdlFile(lLines)
+        oRules = rule_list.rule_list(oTestFile, severity.create_list({}))
+        oRules.check_rules()
+        lViolations = [oRule.violations for oRule in oRules.rules if oRule.unique_id == 'length_002'][0]
+        self.assertEqual([2000], [oViolation.get_line_number() for oViolation in lViolations])
@@ -0,0 +1,104 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from vsg import apply_rules
+from vsg import cmd_line_args
+from vsg import config
+from vsg import profiler
+
+sFileName = 'vsg/tests/vsg/entity1.vhd'
+
+
+class testProfile(unittest.TestCase):
+
+    def setUp(self):
+        profiler.enable()
+
+    def tearDown(self):
+        profiler.bEnabled = False
+        profiler.dStages.clear()
+
+    def test_timer_disabled(self):
+        profiler.bEnabled = False
+        with profiler.timer('stage'):
+            pass
+        self.assertEqual({}, profiler.dStages)
+
+    def test_disabled_timer_does_not_build_the_name(self):
+        profiler.bEnabled = False
+        oDetail = mock.Mock()
+        oDetail.__str__ = mock.Mock(side_effect=AssertionError)
+        with profiler.timer('stage', oDetail):
+            pass
+        self.assertIs(profiler.oDisabledTimer, profiler.timer('stage', oDetail))
+        self.assertEqual({}, profiler.dStages)
+
+    def test_timer_details(self):
+        with profiler.timer('phase', 1, 'subphase', 2):
+            pass
+        self.assertEqual(['phase 1 subphase 2'], list(profiler.dStages))
+
+    def test_timer(self):
+        with profiler.timer('stage'):
+            pass
+        with profiler.timer('stage', iCalls=3):
+            pass
+        self.assertEqual(4, profiler.dStages['stage'][0])
+        self.assertTrue(profiler.dStages['stage'][1] >= 0.0)
+
+    def test_collect_and_merge(self):
+        profiler.record('a', 1.0)
+        dStages = profiler.collect()
+        self.assertEqual({'a': [1, 1.0]}, dStages)
+        self.assertEqual({}, profiler.dStages)
+
+        profiler.record('a', 0.5, 2)
+        profiler.merge(dStages)
+        profiler.merge({'b': [3, 4.0]})
+        self.assertEqual({'a': [3, 1.5], 'b': [3, 4.0]}, profiler.dStages)
+
+    def test_collect_from_workers(self):
+        lBatches = []
+        lBatches.append(([(1, 'b')], {'a': [1, 1.0]}))
+        lBatches.append(([(0, 'a')], {'a': [2, 2.0]}))
+        self.assertEqual([[(1, 'b')], [(0, 'a')]], list(profiler.collect_from_workers(lBatches)))
+        self.assertEqual({'a': [3, 3.0]}, profiler.dStages)
+
+    def test_get_sorted_stages(self):
+        profiler.record('a', 1.0)
+        profiler.record('b', 2.0, 4)
+        profiler.record('c', 1.0)
+        self.assertEqual([('b', 4, 2.0), ('a', 1, 1.0), ('c', 1, 1.0)], profiler.get_sorted_stages())
+
+    @mock.patch('sys.stderr')
+    def test_apply_rules(self, mock_stderr):
+        sys.argv = ['vsg', '-f', sFileName, '--fix']
+        commandLineArguments = cmd_line_args.parse_command_line_arguments()
+        oConfig = config.New(commandLineArguments)
+        oVhdlFile = apply_rules.create_vhdlfile(sFileName, oConfig.dIndent)
+        oRules = apply_rules.create_rule_list(oVhdlFile, oConfig, None, sFileName)
+        oRules.fix()
+        oRules.check_rules()
+
+        for sStage in ['open_file', 'lexer.create_objects', 'vhdlFile._processFile', 'vhdlFile.set_indent_map', 'token_map.process_tokens', 'vhdlFile.update',
+                       'rule_list.fix phase 1 subphase 0', 'rule_list.check_rules phase 7 subphase 1',
+                       'rule.analyze port_007', 'rule._fix_violation port_007']:
+            self.assertIn(sStage, profiler.dStages)
+        self.assertEqual(1, profiler.dStages['rule._fix_violation port_007'][0])
+        self.assertEqual(2, profiler.dStages['rule.analyze port_007'][0])
+
+        sDirectory = tempfile.mkdtemp()
+        try:
+            sProfileName = os.path.join(sDirectory, 'profile.json')
+            profiler.write(sProfileName)
+            with open(sProfileName) as oFile:
+                dProfile = json.load(oFile)
+        finally:
+            shutil.rmtree(sDirectory)
+        self.assertEqual(2, dProfile['rule.analyze port_007']['calls'])
+        self.assertEqual(list(dProfile.keys())[0], profiler.get_sorted_stages()[0][0])
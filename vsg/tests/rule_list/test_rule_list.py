@@ -1,6 +1,7 @@
 import unittest
 import json
 
+from vsg import config
 from vsg import vhdlFile
 from vsg import rule_list
 from vsg import severity
@@ -37,3 +38,57 @@ class testVsg(unittest.TestCase):
         with open('vsg/tests/rule_list/extract_violation_dictionary_w_all_phases_enabled.json') as jsonFile:
             dExpected = json.load(jsonFile)
         self.assertEqual(dExpected, oRules.extract_violation_dictionary())
+
+
+class testFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.oConfig = config.config()
+        self.oConfig.dConfig = {'rule': {'entity_001': {'disable': True}}}
+        self.oConfig.severity_list = oSeverityList
+        self.oFileConfig = config.config()
+        self.oFileConfig.dConfig = {'rule': {'entity_001': {'disable': False}, 'entity_002': {'disable': True}}}
+        lFile = []
+        utils.read_file('vsg/tests/styles/code_examples/spi_master.vhd', lFile)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+        self.oFile.set_indent_map(dIndentMap)
+
+    def get_rule(self, oRules, sUniqueId):
+        for oRule in oRules.rules:
+            if oRule.unique_id == sUniqueId:
+                return oRule
+
+    def test_rules_are_reused(self):
+        oFactory = rule_list.factory(self.oConfig)
+        oFirst = oFactory.create(self.oFile)
+        oFirst.check_rules()
+        oSecond = oFactory.create(self.oFile)
+        self.assertIs(oFirst.rules[0], oSecond.rules[0])
+        self.assertEqual(0, oSecond.get_number_of_rules_ran())
+        self.assertEqual([], oSecond.extract_violation_dictionary()['violations'])
+        self.assertTrue(self.get_rule(oSecond, 'entity_001').disable)
+
+    def test_file_configuration_does_not_change_shared_rules(self):
+        oFactory = rule_list.factory(self.oConfig)
+        oRules = oFactory.create(self.oFile, self.oFileConfig)
+        self.assertFalse(self.get_rule(oRules, 'entity_001').disable)
+        self.assertTrue(self.get_rule(oRules, 'entity_002').disable)
+        oRules = oFactory.create(self.oFile)
+        self.assertTrue(self.get_rule(oRules, 'entity_001').disable)
+        self.assertFalse(self.get_rule(oRules, 'entity_002').disable)
+
+    def test_results_match_new_rule_list(self):
+        oExpected = rule_list.rule_list(self.oFile, oSeverityList)
+        oExpected.configure(self.oConfig)
+        oExpected.check_rules(True)
+        oFactory = rule_list.factory(self.oConfig)
+        for i in range(0, 2):
+            oRules = oFactory.create(self.oFile)
+            oRules.check_rules(True)
+            self.assertEqual(oExpected.extract_violation_dictionary(), oRules.extract_violation_dictionary())
+
+    def test_is_compatible(self):
+        oFactory = rule_list.factory(self.oConfig)
+        self.assertTrue(oFactory.is_compatible(self.oConfig))
+        self.assertFalse(oFactory.is_compatible(self.oConfig, 'local_rules'))
+        self.assertFalse(oFactory.is_compatible(self.oFileConfig))
@@ -0,0 +1,122 @@
+import copy
+import unittest
+
+from vsg import config
+from vsg import rule_list
+from vsg import rule_manifest
+from vsg import rule_registry
+from vsg import severity
+from vsg import vhdlFile
+
+from vsg.rules import entity
+
+oSeverityList = severity.create_list({})
+
+
+def create_config(dConfig):
+    oConfig = config.config()
+    oConfig.dConfig = dConfig
+    oConfig.severity_list = oSeverityList
+    return oConfig
+
+
+def get_entry(sUniqueId):
+    for dEntry in rule_manifest.lRules:
+        if dEntry['name'] + '_' + dEntry['identifier'] == sUniqueId:
+            return dEntry
+
+
+class testRuleRegistry(unittest.TestCase):
+
+    def test_manifest_is_current(self):
+        self.maxDiff = None
+        self.assertEqual(rule_registry.create_manifest(), rule_manifest.lRules, 'Update the manifest with: python -m vsg.rule_registry')
+
+    def test_proxy_is_not_loaded_by_attributes_in_manifest(self):
+        oProxy = rule_registry.rule_proxy(get_entry('entity_001'))
+        self.assertEqual('entity_001', oProxy.unique_id)
+        self.assertEqual(1, oProxy.subphase)
+        self.assertFalse(oProxy.disable)
+        self.assertFalse(oProxy.has_violations())
+        self.assertEqual([], oProxy.violations)
+        oProxy.clear_violations()
+        oProxy.set_line_ranges([(1, 2)])
+        self.assertFalse(oProxy.is_loaded())
+
+    def test_proxy_configuration(self):
+        oConfig = create_config({'rule': {'global': {'phase': 3}, 'entity_001': {'disable': True, 'indentSize': 4, 'severity': 'Warning'}}})
+        oProxy = rule_registry.rule_proxy(get_entry('entity_001'))
+        self.assertEqual([], oProxy.configure(oConfig))
+        oProxy.set_debug()
+        oProxy.set_line_ranges([(1, 2)])
+        self.assertTrue(oProxy.disable)
+        self.assertEqual(3, oProxy.phase)
+        self.assertFalse(oProxy.is_loaded())
+
+        oExpected = entity.rule_001()
+        oExpected.configure(oConfig)
+        oExpected.set_debug()
+        self.assertEqual(oExpected.get_configuration(), oProxy.get_configuration())
+        self.assertTrue(oProxy.is_loaded())
+        self.assertTrue(oProxy.debug)
+        self.assertEqual([(1, 2)], oProxy.oRule.lLineRanges)
+
+    def test_proxy_forwards_attributes_once_loaded(self):
+        oProxy = rule_registry.rule_proxy(get_entry('entity_001'))
+        oProxy.disable = True
+        self.assertTrue(oProxy.is_loaded())
+        self.assertTrue(oProxy.disable)
+        self.assertTrue(oProxy.oRule.disable)
+
+    def test_copied_proxy_is_independent(self):
+        oProxy = rule_registry.rule_proxy(get_entry('entity_001'))
+        oProxy.configure(create_config({'rule': {'entity_001': {'disable': True}}}))
+        oCopy = copy.copy(oProxy)
+        oCopy.configure(create_config({'rule': {'entity_001': {'disable': False}}}))
+        self.assertTrue(oProxy.disable)
+        self.assertFalse(oCopy.disable)
+        self.assertEqual(1, len(oProxy.lConfigs))
+        self.assertEqual(2, len(oCopy.lConfigs))
+
+    def test_configured_depricated_rule_is_loaded(self):
+        dEntry = None
+        for dEntry in rule_manifest.lRules:
+            if dEntry['depricated']:
+                break
+        sUniqueId = dEntry['name'] + '_' + dEntry['identifier']
+        oProxy = rule_registry.rule_proxy(dEntry)
+        lActual = oProxy.configure(create_config({'rule': {sUniqueId: {'disable': False}}}))
+        self.assertTrue(oProxy.is_loaded())
+        self.assertEqual('ERROR [config-001] Rule ' + sUniqueId + ' has been depricated.', lActual[0])
+
+
+class testRuleList(unittest.TestCase):
+
+    def setUp(self):
+        self.oRules = rule_list.rule_list(vhdlFile.vhdlFile(['']), oSeverityList)
+        self.oRules.configure(create_config({'rule': {'entity_002': {'disable': True}}}))
+
+    def get_loaded_rules(self):
+        return [oRule.unique_id for oRule in self.oRules.rules if oRule.is_loaded()]
+
+    def test_rules_are_loaded_from_manifest(self):
+        self.assertEqual(len(rule_manifest.lRules), len(self.oRules.rules))
+        self.assertEqual([], self.get_loaded_rules())
+
+    def test_get_rule_loads_only_one_rule(self):
+        oRule = self.oRules.get_rule('entity_001')
+        self.assertEqual('entity_001', oRule.unique_id)
+        self.assertIsNone(self.oRules.get_rule('entity_999'))
+        self.assertEqual('Error', oRule.get_configuration()['severity'])
+        self.assertEqual(['entity_001'], self.get_loaded_rules())
+
+    def test_load_enabled_rules(self):
+        self.oRules.load_enabled_rules()
+        lExpected = [oRule.unique_id for oRule in self.oRules.rules if not oRule.disable]
+        self.assertEqual(lExpected, self.get_loaded_rules())
+        self.assertNotIn('entity_002', lExpected)
+
+    def test_check_rules_loads_only_enabled_rules(self):
+        self.oRules.check_rules(bAllPhases=True)
+        for oRule in self.oRules.rules:
+            self.assertEqual(not oRule.disable, oRule.is_loaded(), oRule.unique_id)
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from vsg import schedule
+
+
+class testSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.sDirectory = tempfile.mkdtemp()
+        self.lFileNames = []
+        for iSize in [10, 1000, 10, 10, 500, 10]:
+            sFileName = os.path.join(self.sDirectory, str(len(self.lFileNames)) + '.vhd')
+            with open(sFileName, 'w') as oFile:
+                oFile.write('-' * iSize)
+            self.lFileNames.append(sFileName)
+
+    def tearDown(self):
+        shutil.rmtree(self.sDirectory)
+
+    def test_get_file_size(self):
+        self.assertEqual(1000, schedule.get_file_size(self.lFileNames[1]))
+        self.assertEqual(0, schedule.get_file_size('no_file.vhd'))
+
+    def test_create_batches_largest_first(self):
+        lBatches = schedule.create_batches(self.lFileNames, 2, 4)
+
+        lExpected = []
+        lExpected.append([(1, self.lFileNames[1])])
+        lExpected.append([(4, self.lFileNames[4])])
+        lExpected.append([(0, self.lFileNames[0]), (2, self.lFileNames[2]), (3, self.lFileNames[3]), (5, self.lFileNames[5])])
+
+        self.assertEqual(lExpected, lBatches)
+
+    def test_create_batches_covers_every_file(self):
+        lIndexes = []
+        for lBatch in schedule.create_batches(self.lFileNames + ['no_file.vhd'], 8):
+            for iIndex, sFileName in lBatch:
+                lIndexes.append(iIndex)
+        self.assertEqual(list(range(0, 7)), sorted(lIndexes))
+
+    def test_create_batches_without_files(self):
+        self.assertEqual([], schedule.create_batches([], 4))
+
+    def test_collect_in_order(self):
+        lResults = []
+        lResults.append([(2, 'c'), (0, 'a')])
+        lResults.append([(3, 'd')])
+        lResults.append([(1, 'b')])
+        self.assertEqual(['a', 'b', 'c', 'd'], list(schedule.collect_in_order(lResults)))
+
+    def test_get_number_of_jobs_given(self):
+        self.assertEqual(3, schedule.get_number_of_jobs(3, self.lFileNames))
+
+    @mock.patch('vsg.schedule.get_cpu_count', return_value=4)
+    def test_get_number_of_jobs_auto(self, mock_get_cpu_count):
+        with mock.patch('vsg.schedule.iBytesPerJob', 1000):
+            self.assertEqual(1, schedule.get_number_of_jobs('auto', self.lFileNames))
+        with mock.patch('vsg.schedule.iBytesPerJob', 500):
+            self.assertEqual(3, schedule.get_number_of_jobs('auto', self.lFileNames))
+        with mock.patch('vsg.schedule.iBytesPerJob', 10):
+            self.assertEqual(4, schedule.get_number_of_jobs('auto', self.lFileNames))
+            self.assertEqual(2, schedule.get_number_of_jobs('auto', self.lFileNames[0:2]))
+        self.assertEqual(1, schedule.get_number_of_jobs('auto', []))
@@ -0,0 +1,90 @@
+import unittest
+
+from vsg import parser
+
+from vsg.token import entity_declaration
+from vsg.token import pragma
+
+from vsg.vhdlFile import utils
+
+from vsg.vhdlFile.indent import set_token_indent
+
+lCategories = []
+lCategories.append((parser.whitespace, parser.iWhitespace))
+lCategories.append((parser.carriage_return, parser.iCarriageReturn))
+lCategories.append((parser.comment, parser.iComment))
+lCategories.append((parser.blank_line, parser.iBlankLine))
+lCategories.append((parser.preprocessor, parser.iPreprocessor))
+lCategories.append((parser.keyword, parser.iKeyword))
+
+
+class testTokenCategory(unittest.TestCase):
+
+    def test_category_matches_isinstance(self):
+        for oClass in parser.lTokenTypes:
+            for oCategoryClass, iCategory in lCategories:
+                self.assertEqual(issubclass(oClass, oCategoryClass), bool(oClass.category & iCategory), oClass)
+
+    def test_category_is_inherited(self):
+        self.assertEqual(parser.iKeyword, entity_declaration.entity_keyword.category)
+        self.assertEqual(0, entity_declaration.identifier.category)
+        self.assertEqual(0, parser.item.category)
+
+    def test_subclass_category(self):
+
+        class new_comment(parser.comment):
+            category_flag = parser.iKeyword
+
+        self.assertEqual(parser.iComment | parser.iKeyword, new_comment.category)
+        self.assertEqual(parser.iComment, parser.comment.category)
+
+    def test_whitespace_helpers(self):
+        lTokens = []
+        lTokens.append(parser.item('a'))
+        lTokens.append(parser.whitespace(' '))
+        lTokens.append(parser.comment('-- b'))
+        lTokens.append(parser.carriage_return())
+        lTokens.append(parser.blank_line())
+        lTokens.append(parser.carriage_return())
+        lTokens.append(parser.preprocessor('#if c'))
+        lTokens.append(parser.carriage_return())
+        lTokens.append(pragma.ignore('d'))
+        lTokens.append(parser.todo('e'))
+        self.assertEqual([False, True, True, True, True, True, True, True, False, False], [utils.token_is_whitespace_or_comment(oToken) for oToken in lTokens])
+        self.assertEqual([False, True, False, True, True, True, True, True, False, False], [utils.token_is_whitespace(oToken) for oToken in lTokens])
+        self.assertEqual(8, utils.find_next_non_whitespace_token(1, lTokens))
+        self.assertEqual(8, utils.find_previous_non_whitespace_token(8, lTokens))
+        self.assertEqual(1, utils.find_previous_non_whitespace_token(3, [parser.item('f'), parser.item('g'), parser.whitespace(' '), parser.comment('-- h')]))
+        self.assertEqual(0, utils.find_next_token(0, lTokens))
+        self.assertEqual(1, utils.find_next_token(1, lTokens))
+        self.assertTrue(utils.is_item(lTokens, 0))
+        self.assertFalse(utils.is_item(lTokens, 9))
+
+    def test_type_ids_match_isinstance(self):
+        for oClass in parser.lTokenTypes:
+            setExpected = set(oBaseClass.type_id for oBaseClass in parser.lTokenTypes if issubclass(oClass, oBaseClass))
+            self.assertEqual(setExpected, oClass.type_ids, oClass)
+
+    def test_consecutive_token_types(self):
+        lTokens = []
+        lTokens.append(parser.carriage_return())
+        lTokens.append(entity_declaration.entity_keyword('entity'))
+        lTokens.append(parser.whitespace(' '))
+        lTokens.append(parser.comment('-- a'))
+        lTokens.append(entity_declaration.identifier('b'))
+        self.assertTrue(utils.are_next_consecutive_token_types([parser.keyword, parser.whitespace], 1, lTokens))
+        self.assertFalse(utils.are_next_consecutive_token_types([parser.keyword, parser.comment], 1, lTokens))
+        self.assertTrue(utils.are_next_consecutive_token_types_ignoring_whitespace([entity_declaration.entity_keyword, None], 1, lTokens))
+        self.assertFalse(utils.are_next_consecutive_token_types_ignoring_whitespace([parser.keyword, parser.keyword], 1, lTokens))
+        self.assertTrue(utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.keyword, entity_declaration.identifier], 4, lTokens))
+        self.assertFalse(utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.keyword, parser.keyword], 4, lTokens))
+
+    def test_special_indent_actions(self):
+
+        class new_comment(parser.comment):
+            pass
+
+        self.assertEqual('library_end', set_token_indent.get_special_action(entity_declaration.entity_keyword('entity')))
+        self.assertEqual('library_item', set_token_indent.get_special_action(parser.comment('-- a')))
+        self.assertEqual('library_item', set_token_indent.get_special_action(new_comment('-- a')))
+        self.assertIsNone(set_token_indent.get_special_action(entity_declaration.identifier('a')))
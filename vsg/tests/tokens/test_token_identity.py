@@ -0,0 +1,41 @@
+import unittest
+
+from vsg import parser
+from vsg import token_map
+
+from vsg.token import entity_declaration
+
+
+class testTokenIdentity(unittest.TestCase):
+
+    def test_identity_is_set_on_class(self):
+        self.assertEqual('entity_declaration', entity_declaration.entity_keyword.base_token)
+        self.assertEqual('entity_keyword', entity_declaration.entity_keyword.sub_token)
+        self.assertNotIn('base_token', entity_declaration.entity_keyword.__slots__)
+
+    def test_identity_of_instance(self):
+        oToken = entity_declaration.entity_keyword('entity')
+        self.assertEqual(('entity_declaration', 'entity_keyword'), oToken.get_unique_id())
+        self.assertEqual('entity_declaration:entity_keyword', oToken.get_unique_id(':'))
+        self.assertEqual(('parser', 'item'), parser.item('a').get_unique_id())
+
+    def test_identity_matches_docstring(self):
+        for oClass in parser.lTokenTypes:
+            self.assertEqual(parser.extract_unique_id(oClass), (oClass.base_token, oClass.sub_token))
+
+    def test_type_ids_are_unique(self):
+        for iTypeId, oClass in enumerate(parser.lTokenTypes):
+            self.assertEqual(iTypeId, oClass.type_id)
+        self.assertIs(parser.item, parser.lTokenTypes[parser.item.type_id])
+
+    def test_class_without_unique_id(self):
+
+        class no_unique_id(parser.item):
+            pass
+
+        self.assertEqual((None, None), no_unique_id('a').get_unique_id())
+        self.assertEqual((None, None), token_map.extract_unique_id(no_unique_id))
+
+    def test_token_map_uses_class_identity(self):
+        self.assertEqual(('parser', 'whitespace'), token_map.extract_unique_id(parser.whitespace))
+        self.assertEqual(('parser', 'whitespace'), token_map.extract_unique_id(parser.whitespace(' ')))
@@ -665,3 +665,39 @@ class testTokenMethod(unittest.TestCase):
   
         self.assertEqual(lTokens, lActual)
 
+
+    def test_double_quote_in_character_literal(self):
+        self.assertEqual(["'\"'", ' ', '&', ' ', 'x'], tokens.create("'\"' & x"))
+        self.assertEqual(["'", '"\' & "', 'x', '"'], tokens.create("'\"' & \"x\""))
+
+    def test_three_single_quotes(self):
+        self.assertEqual(["''", "'", 'a'], tokens.create("'''a"))
+
+    def test_open_parenthesis_in_single_quotes(self):
+        self.assertEqual(["'", '(', "'"], tokens.create("'('"))
+
+    def test_unterminated_string_literal(self):
+        self.assertEqual(['x', ' ', '"', 'abc', ' '], tokens.create('x "abc '))
+
+    def test_comment_with_trailing_whitespace(self):
+        self.assertEqual(['a', '--', '  '], tokens.create('a--  '))
+        self.assertEqual(['a', ' ', '-- b "c', '   '], tokens.create('a -- b "c   '))
+        self.assertEqual(['---', '\x0c'], tokens.create('---\x0c'))
+
+    def test_create_matches_combine_functions(self):
+        lLines = []
+        lLines.append("a <= b when c = '1' else 'Z'; -- comment")
+        lLines.append("x := y'length ** 2 /= 3 ?/= 4 <<signal .top.sig : std_logic>>;")
+        lLines.append("report \"--not a comment\" & ''' & '\"' & \"\"\"\" ;  ")
+        lLines.append("  assert a >= b and c <= d and e => f and g <> h ?? i ?< j ?> k ?= l;")
+        lLines.append("s <= x\"FF\" & b\"1010\" & o\"7\"; -- trailing ' and \" ")
+        lLines.append("\\extended identifier\\ : std_logic_vector(7 downto 0) := (others => '0');")
+        for sLine in lLines:
+            lExpected = [sChar for sChar in sLine]
+            lExpected = tokens.combine_whitespace(lExpected)
+            lExpected = tokens.combine_two_character_symbols(lExpected)
+            lExpected = tokens.combine_characters_into_words(lExpected)
+            lExpected = tokens.combine_string_literals(lExpected)
+            lExpected = tokens.combine_character_literals(lExpected)
+            lExpected = tokens.combine_comments(lExpected)
+            self.assertEqual(lExpected, tokens.create(sLine), sLine)
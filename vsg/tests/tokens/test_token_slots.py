@@ -0,0 +1,85 @@
+import copy
+import pickle
+import unittest
+
+from vsg import parser
+
+from vsg.token import entity_declaration
+
+
+class testTokenSlots(unittest.TestCase):
+
+    def test_tokens_do_not_have_a_dictionary(self):
+        for oClass in parser.lTokenTypes:
+            self.assertIsInstance(oClass, parser.token_class)
+            self.assertIn('__slots__', vars(oClass), oClass.__name__)
+        oToken = entity_declaration.entity_keyword('entity')
+        self.assertFalse(hasattr(oToken, '__dict__'))
+        with self.assertRaises(AttributeError):
+            oToken.new_attribute = 1
+
+    def test_class_without_slots(self):
+
+        class no_slots(parser.item):
+            pass
+
+        self.assertEqual((), no_slots.__slots__)
+        self.assertFalse(hasattr(no_slots('a'), '__dict__'))
+
+    def test_defaults_are_shared(self):
+        oToken1 = parser.item('a')
+        oToken2 = entity_declaration.entity_keyword('entity')
+        self.assertIs(oToken1.get_context(), oToken2.get_context())
+        self.assertIs(oToken1.code_tags, oToken2.code_tags)
+        self.assertIsNone(oToken1.get_indent())
+        self.assertIsNone(oToken1.get_hierarchy())
+        self.assertIsNone(oToken1.get_filename())
+
+    def test_context(self):
+        oToken1 = parser.item('a')
+        oToken2 = parser.item('b')
+        oToken1.add_context(['x', 'y'])
+        self.assertEqual(('x', 'y'), oToken1.get_context())
+        self.assertEqual((), oToken2.get_context())
+        self.assertEqual('y', oToken1.pop_context())
+        self.assertEqual(('x',), oToken1.get_context())
+        self.assertEqual('x', oToken1.pop_context())
+        with self.assertRaises(IndexError):
+            oToken1.pop_context()
+
+    def test_code_tags_are_interned(self):
+        oToken1 = parser.item('a')
+        oToken2 = parser.item('b')
+        lCodeTags = ['rule_001', 'rule_002']
+        oToken1.set_code_tags(lCodeTags)
+        oToken2.set_code_tags(list(lCodeTags))
+        lCodeTags.append('rule_003')
+        self.assertIs(oToken1.code_tags, oToken2.code_tags)
+        self.assertEqual(('rule_001', 'rule_002'), oToken1.code_tags)
+        self.assertTrue(oToken1.has_code_tag('rule_002'))
+        self.assertFalse(oToken1.has_code_tag('rule_003'))
+
+    def test_all_code_tags(self):
+        oToken = parser.item('a')
+        oToken.set_all_code_tags()
+        self.assertTrue(oToken.has_code_tag('rule_001'))
+        oToken.set_code_tags(['all'])
+        self.assertTrue(oToken.has_code_tag('rule_001'))
+        oToken.set_code_tags(['all', 'rule_002'])
+        self.assertFalse(oToken.has_code_tag('rule_001'))
+        oToken.clear_code_tags()
+        self.assertFalse(oToken.has_code_tag('rule_001'))
+
+    def test_copy_and_pickle(self):
+        oToken = entity_declaration.entity_keyword('entity')
+        oToken.set_indent(2)
+        oToken.set_hierarchy(1)
+        oToken.set_code_tags(['rule_001'])
+        oToken.set_filename('a.vhd')
+        for oCopy in [copy.copy(oToken), copy.deepcopy(oToken), pickle.loads(pickle.dumps(oToken, protocol=pickle.HIGHEST_PROTOCOL))]:
+            self.assertIsInstance(oCopy, entity_declaration.entity_keyword)
+            self.assertEqual('entity', oCopy.get_value())
+            self.assertEqual(2, oCopy.get_indent())
+            self.assertEqual(1, oCopy.get_hierarchy())
+            self.assertEqual(('rule_001',), oCopy.code_tags)
+            self.assertEqual('a.vhd', oCopy.get_filename())
@@ -0,0 +1,77 @@
+
+import unittest
+from unittest import mock
+
+from vsg import parser
+
+from vsg.vhdlFile import first_set
+
+from vsg.vhdlFile.classify import design_unit
+
+
+def create_tokens(sLine):
+    lReturn = []
+    for sValue in sLine.split():
+        lReturn.append(parser.item(sValue))
+        lReturn.append(parser.whitespace(' '))
+    lReturn.append(parser.carriage_return())
+    return lReturn
+
+
+class alternative():
+
+    def __init__(self, sName, lCalls, iReturn=None):
+        self.sName = sName
+        self.lCalls = lCalls
+        self.iReturn = iReturn
+
+    def detect(self, iToken, lObjects):
+        self.lCalls.append(self.sName)
+        if self.iReturn is None:
+            return iToken
+        return self.iReturn
+
+
+class test_first_set(unittest.TestCase):
+
+    def setUp(self):
+        self.lCalls = []
+        self.oTable = first_set.table()
+        self.oTable.add(alternative('process', self.lCalls), ['process'], 4)
+        self.oTable.add(alternative('block', self.lCalls), ['block'], 3)
+        self.oTable.add(alternative('assignment', self.lCalls))
+        self.oTable.add(alternative('null', self.lCalls), ['null'], 3)
+
+    def test_alternatives_are_skipped_without_their_keywords(self):
+        self.assertEqual(0, self.oTable.detect(0, create_tokens('a <= b ;')))
+        self.assertEqual(['assignment'], self.lCalls)
+
+    def test_keywords_after_label(self):
+        self.oTable.detect(0, create_tokens('Label : BLOCK is'))
+        self.assertEqual(['block', 'assignment'], self.lCalls)
+
+    def test_keywords_outside_of_window(self):
+        self.oTable.detect(0, create_tokens('a b c null process'))
+        self.assertEqual(['assignment'], self.lCalls)
+
+    def test_every_alternative_is_tried_at_end_of_file(self):
+        self.oTable.detect(0, [parser.item('a'), parser.item(';')])
+        self.assertEqual(['process', 'block', 'assignment', 'null'], self.lCalls)
+
+    def test_first_match_is_returned(self):
+        oTable = first_set.table()
+        oTable.add(alternative('declaration', self.lCalls, 5), ['function'], 1, alternative('body', self.lCalls, 9))
+        oTable.add(alternative('use', self.lCalls, 7), ['use'])
+        self.assertEqual(9, oTable.detect(0, create_tokens('function f return integer ;')))
+        self.assertEqual(7, oTable.detect(0, create_tokens('use a.b ;')))
+        self.assertEqual(['declaration', 'body', 'use'], self.lCalls)
+
+    def test_design_unit_only_tries_matching_units(self):
+        lTokens = create_tokens('architecture rtl of foo is begin end architecture rtl ;')
+        with mock.patch('vsg.vhdlFile.classify.entity_declaration.detect') as mock_entity:
+            with mock.patch('vsg.vhdlFile.classify.context_clause.detect') as mock_context:
+                iReturn = design_unit.detect(0, lTokens)
+        mock_entity.assert_not_called()
+        mock_context.assert_not_called()
+        self.assertEqual('architecture_keyword', type(lTokens[0]).__name__)
+        self.assertEqual(len(lTokens) - 2, iReturn)
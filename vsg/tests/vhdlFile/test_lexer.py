@@ -0,0 +1,140 @@
+
+import unittest
+
+from vsg import parser
+from vsg import tokens
+
+from vsg.token import pragma as pragma_token
+
+from vsg.vhdlFile import lexer
+
+from vsg.vhdlFile.classify import blank
+from vsg.vhdlFile.classify import comment
+from vsg.vhdlFile.classify import pragma
+from vsg.vhdlFile.classify import preprocessor
+from vsg.vhdlFile.classify import whitespace
+
+lOpenPragmas = ['--vhdl_comp_off']
+lClosePragmas = ['--vhdl_comp_on']
+
+
+def classify_lines(lLines):
+    dVars = {'pragma': False}
+    lReturn = []
+    for sLine in lLines:
+        lTokens = tokens.create(sLine.replace('\t', '  ').rstrip('\n').rstrip('\r'))
+        lObjects = [parser.item(sToken) for sToken in lTokens]
+        blank.classify(lObjects)
+        whitespace.classify(lTokens, lObjects)
+        comment.classify(lTokens, lObjects)
+        preprocessor.classify(lTokens, lObjects)
+        pragma.classify(lTokens, lObjects, lOpenPragmas, lClosePragmas, dVars)
+        lReturn.extend(lObjects)
+        lReturn.append(parser.carriage_return())
+    return lReturn, dVars
+
+
+def create_objects(lLines):
+    dVars = {'pragma': False}
+    return lexer.create_objects(lLines, lOpenPragmas, lClosePragmas, dVars), dVars
+
+
+def summarize(lObjects):
+    return [(type(oObject), oObject.get_value()) for oObject in lObjects]
+
+
+class test_lexer(unittest.TestCase):
+
+    def test_objects_are_classified(self):
+        lLines = ['  a <= b; -- comment  \n', '\n', '\tc <= "x y" & \' \';\r\n', '  #define x\n']
+        lActual, dVars = create_objects(lLines)
+        lExpected = []
+        lExpected.append((parser.whitespace, '  '))
+        lExpected.append((parser.item, 'a'))
+        lExpected.append((parser.whitespace, ' '))
+        lExpected.append((parser.item, '<='))
+        lExpected.append((parser.whitespace, ' '))
+        lExpected.append((parser.item, 'b'))
+        lExpected.append((parser.item, ';'))
+        lExpected.append((parser.whitespace, ' '))
+        lExpected.append((parser.comment, '-- comment'))
+        lExpected.append((parser.whitespace, '  '))
+        lExpected.append((parser.carriage_return, '\n'))
+        lExpected.append((parser.blank_line, ''))
+        lExpected.append((parser.carriage_return, '\n'))
+        lExpected.append((parser.whitespace, '  '))
+        lExpected.append((parser.item, 'c'))
+        lExpected.append((parser.whitespace, ' '))
+        lExpected.append((parser.item, '<='))
+        lExpected.append((parser.whitespace, ' '))
+        lExpected.append((parser.item, '"x y"'))
+        lExpected.append((parser.whitespace, ' '))
+        lExpected.append((parser.item, '&'))
+        lExpected.append((parser.whitespace, ' '))
+        lExpected.append((parser.item, "' '"))
+        lExpected.append((parser.item, ';'))
+        lExpected.append((parser.carriage_return, '\n'))
+        lExpected.append((parser.preprocessor, '  #define x'))
+        lExpected.append((parser.carriage_return, '\n'))
+        self.assertEqual(lExpected, summarize(lActual))
+
+    def test_pragmas(self):
+        lLines = []
+        lLines.append('a <= b; --vhdl_comp_off\n')
+        lLines.append('  c <= d; -- ignored\n')
+        lLines.append('\n')
+        lLines.append('#ifdef\n')
+        lLines.append('--vhdl_comp_on\n')
+        lLines.append('e <= f;\n')
+        lActual, dVars = create_objects(lLines)
+        self.assertFalse(dVars['pragma'])
+        self.assertEqual((parser.comment, '--vhdl_comp_off'), summarize(lActual)[7])
+        self.assertEqual((pragma_token.ignore, '  '), summarize(lActual)[9])
+        self.assertEqual((pragma_token.ignore, '-- ignored'), summarize(lActual)[17])
+        self.assertEqual((parser.blank_line, ''), summarize(lActual)[19])
+        self.assertEqual((pragma_token.ignore, '#ifdef'), summarize(lActual)[21])
+        self.assertEqual((parser.comment, '--vhdl_comp_on'), summarize(lActual)[23])
+
+    def test_preprocessor_lines_in_pragmas(self):
+        lLines = []
+        lLines.append('--vhdl_comp_off\n')
+        lLines.append('  #define x y\n')
+        lLines.append('#if x --vhdl_comp_on\n')
+        lLines.append('#endif\n')
+        lActual, dVars = create_objects(lLines)
+        self.assertFalse(dVars['pragma'])
+        self.assertEqual((pragma_token.ignore, '  #define x y'), summarize(lActual)[2])
+        self.assertEqual((pragma_token.ignore, '#if x --vhdl_comp_on'), summarize(lActual)[4])
+        self.assertEqual((parser.preprocessor, '#endif'), summarize(lActual)[6])
+
+    def test_pragma_state_is_kept_between_calls(self):
+        dVars = {'pragma': False}
+        lexer.create_objects(['--vhdl_comp_off\n'], lOpenPragmas, lClosePragmas, dVars)
+        self.assertTrue(dVars['pragma'])
+        lActual = lexer.create_objects(['a\n'], lOpenPragmas, lClosePragmas, dVars)
+        self.assertEqual((pragma_token.ignore, 'a'), summarize(lActual)[0])
+
+    def test_matches_classify_functions(self):
+        lLines = []
+        lLines.append('library ieee;\n')
+        lLines.append('  use ieee.std_logic_1164.all;  \n')
+        lLines.append('\n')
+        lLines.append('   \n')
+        lLines.append('  #if x -- y\n')
+        lLines.append('--vhdl_comp_off\n')
+        lLines.append('#endif\n')
+        lLines.append("a <= '1'; --vhdl_comp_on\n")
+        lLines.append('--vhdl_comp_on\n')
+        lLines.append(' #else\r\n')
+        lLines.append('\tb <= "--" & c; -- "d" \'e\'\t\n')
+        lLines.append('--vhdl_comp_off  \n')
+        lLines.append('f\n')
+        lLines.append('--vhdl_comp_on')
+        lActual, dActual = create_objects(lLines)
+        lExpected, dExpected = classify_lines(lLines)
+        self.assertEqual(summarize(lExpected), summarize(lActual))
+        self.assertEqual(dExpected, dActual)
+
+    def test_empty_file(self):
+        lActual, dVars = create_objects([])
+        self.assertEqual([], lActual)
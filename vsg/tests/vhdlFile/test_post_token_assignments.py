@@ -0,0 +1,43 @@
+
+import unittest
+
+from vsg import parser
+
+from vsg.token import adding_operator
+from vsg.token import direction
+from vsg.token import logical_operator
+from vsg.token import sign
+from vsg.token import unary_logical_operator
+
+from vsg.vhdlFile.vhdlFile import post_token_assignments
+
+
+def assign(lTokens):
+    post_token_assignments(lTokens)
+    return [type(oToken) for oToken in lTokens]
+
+
+class test_post_token_assignments(unittest.TestCase):
+
+    def test_todo_tokens(self):
+        lTokens = [parser.carriage_return(), parser.todo('DownTo'), parser.todo('('), parser.todo("'0'"), parser.todo('x'), parser.carriage_return()]
+        self.assertEqual([parser.carriage_return, direction.downto, parser.open_parenthesis, parser.character_literal, parser.todo, parser.carriage_return], assign(lTokens))
+        self.assertEqual('DownTo', lTokens[1].get_value())
+
+    def test_unary_operators(self):
+        lTokens = [parser.carriage_return(), parser.assignment('<='), parser.whitespace(' '), parser.comment('-- a'), parser.todo('-'), parser.todo('AND'), parser.todo('('), parser.todo('or'), parser.carriage_return()]
+        self.assertEqual([parser.carriage_return, parser.assignment, parser.whitespace, parser.comment, sign.minus, logical_operator.and_operator, parser.open_parenthesis, unary_logical_operator.or_operator, parser.carriage_return], assign(lTokens))
+        self.assertEqual('AND', lTokens[5].get_value())
+
+    def test_classified_signs(self):
+        lTokens = [parser.carriage_return(), parser.keyword('return'), parser.item('+'), parser.item('x'), parser.item('+'), parser.carriage_return()]
+        self.assertEqual([parser.carriage_return, parser.keyword, sign.plus, parser.item, adding_operator.plus, parser.carriage_return], assign(lTokens))
+
+    def test_first_token_is_only_seen_from_the_second_token(self):
+        self.assertEqual([parser.open_parenthesis, sign.plus], assign([parser.todo('('), parser.todo('+')]))
+        self.assertEqual([parser.open_parenthesis, parser.whitespace, adding_operator.plus], assign([parser.todo('('), parser.whitespace(' '), parser.todo('+')]))
+
+    def test_code_tags(self):
+        lTokens = [parser.comment('-- vsg_off entity_001'), parser.carriage_return(), parser.item('a'), parser.comment('-- vsg_on'), parser.item('b')]
+        post_token_assignments(lTokens)
+        self.assertEqual([('entity_001',), ('entity_001',), ('entity_001',), (), ()], [oToken.code_tags for oToken in lTokens])
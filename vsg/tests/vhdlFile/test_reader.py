@@ -0,0 +1,113 @@
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from vsg.vhdlFile import reader
+from vsg.vhdlFile import utils
+
+
+class test_reader(unittest.TestCase):
+
+    def setUp(self):
+        self.sDirectory = tempfile.mkdtemp()
+        self.sFileName = os.path.join(self.sDirectory, 'test.vhd')
+
+    def tearDown(self):
+        shutil.rmtree(self.sDirectory)
+
+    def write_file(self, bData):
+        with open(self.sFileName, 'wb') as oFile:
+            oFile.write(bData)
+
+    def read_text_mode(self, sEncoding):
+        with open(self.sFileName, encoding=sEncoding) as oFile:
+            return list(oFile)
+
+    def test_newlines_are_translated(self):
+        self.write_file(b'a\r\nb\rc\nd\x0ce\n\n\r')
+        self.assertEqual(['a\n', 'b\n', 'c\n', 'd\x0ce\n', '\n', '\n'], list(reader.lines(self.sFileName)))
+        self.assertEqual(self.read_text_mode('utf-8'), list(reader.lines(self.sFileName)))
+
+    def test_empty_file(self):
+        self.write_file(b'')
+        self.assertEqual(([], None), utils.read_vhdlfile(self.sFileName))
+
+    def test_file_can_be_read_more_than_once(self):
+        self.write_file(b'a\nb\n')
+        oLines = reader.lines(self.sFileName)
+        self.assertEqual(['a\n', 'b\n'], list(oLines))
+        self.assertEqual(['a\n', 'b\n'], list(oLines))
+
+    @mock.patch('locale.getpreferredencoding', return_value='utf-8')
+    def test_encoding_is_detected(self, mock_encoding):
+        self.write_file('entity é is\n'.encode('utf-8'))
+        self.assertEqual('utf-8', reader.lines(self.sFileName).sEncoding)
+        self.assertEqual(['entity é is\n'], utils.read_vhdlfile(self.sFileName)[0])
+
+        self.write_file('entity é is\n'.encode('ISO-8859-1'))
+        self.assertEqual('ISO-8859-1', reader.lines(self.sFileName).sEncoding)
+        self.assertEqual(['entity é is\n'], utils.read_vhdlfile(self.sFileName)[0])
+
+    @mock.patch('locale.getpreferredencoding', return_value='utf-8')
+    def test_line_after_prefix_which_does_not_decode(self, mock_encoding):
+        bPrefix = b'-- a\n' * (reader.iPrefixSize // 5 + 1)
+        self.write_file(bPrefix + 'é\n'.encode('utf-8') + 'é\n'.encode('ISO-8859-1'))
+        lLines = utils.read_vhdlfile(self.sFileName)[0]
+        self.assertEqual(['é\n', 'é\n'], lLines[-2:])
+
+    @mock.patch('locale.getpreferredencoding', return_value='utf-8')
+    def test_text_is_decoded_like_a_file(self, mock_encoding):
+        bPrefix = b'-- a\n' * (reader.iPrefixSize // 5 + 1)
+        for bData in ['entity é is\n'.encode('utf-8'), 'entity é is\n'.encode('ISO-8859-1'), bPrefix + 'é\n'.encode('utf-8') + 'é\n'.encode('ISO-8859-1')]:
+            self.write_file(bData)
+            oLines = reader.lines(self.sFileName)
+            self.assertEqual((''.join(oLines), oLines.sEncoding), utils.decode_vhdl_text(bData))
+
+    @mock.patch.object(reader, 'iChunkSize', 3)
+    def test_lines_are_not_split_between_chunks(self):
+        bData = b'abcdef\r\ngh\r\n\r\ni\rjklm\n'
+        self.write_file(bData)
+        self.assertEqual([b'abcdef\r\n', b'gh\r\n', b'\r\ni\rjklm\n'], list(reader.read_chunks(bData)))
+        self.assertEqual(self.read_text_mode('utf-8'), list(reader.lines(self.sFileName)))
+
+    def test_missing_file(self):
+        oLines, eError = utils.open_vhdlfile(os.path.join(self.sDirectory, 'missing.vhd'))
+        self.assertEqual([], oLines)
+        self.assertIsInstance(eError, OSError)
+
+    def test_file_is_read_once(self):
+        self.write_file(b'a\nb\n')
+        oLines = reader.lines(self.sFileName)
+        os.remove(self.sFileName)
+        self.assertEqual(['a\n', 'b\n'], list(oLines))
+
+    @mock.patch.object(reader, 'bMemoryMap', False)
+    def test_read_error(self):
+        oFile = mock.mock_open()
+        oFile.return_value.read.side_effect = OSError(5, 'Input/output error')
+        with mock.patch('builtins.open', oFile):
+            oLines, eError = utils.open_vhdlfile(self.sFileName)
+        self.assertEqual([], oLines)
+        self.assertIsInstance(eError, OSError)
+
+    @mock.patch.object(reader, 'bMemoryMap', True)
+    def test_only_large_files_are_memory_mapped(self):
+        self.write_file(b'a\nb\n')
+        with mock.patch('mmap.mmap', wraps=reader.mmap.mmap) as mock_mmap:
+            self.assertEqual(['a\n', 'b\n'], list(reader.lines(self.sFileName)))
+            mock_mmap.assert_not_called()
+            with mock.patch.object(reader, 'iMemoryMapSize', 4):
+                self.assertEqual(['a\n', 'b\n'], list(reader.lines(self.sFileName)))
+            mock_mmap.assert_called_once()
+
+    @mock.patch.object(reader, 'bMemoryMap', True)
+    @mock.patch.object(reader, 'iMemoryMapSize', 0)
+    def test_memory_map_can_be_disabled(self):
+        self.write_file(b'a\nb\n')
+        reader.disable_memory_map()
+        with mock.patch('mmap.mmap') as mock_mmap:
+            self.assertEqual(['a\n', 'b\n'], list(reader.lines(self.sFileName)))
+        mock_mmap.assert_not_called()
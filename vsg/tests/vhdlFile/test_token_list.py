@@ -0,0 +1,83 @@
+
+import random
+import unittest
+
+from vsg import parser
+
+from vsg.token import entity_declaration
+
+from vsg.vhdlFile import token_list
+from vsg.vhdlFile import utils
+
+
+def create_tokens():
+    lReturn = []
+    lReturn.append(parser.item('entity'))
+    lReturn.append(parser.whitespace(' '))
+    lReturn.append(parser.item('FOO'))
+    lReturn.append(parser.whitespace(' '))
+    lReturn.append(parser.comment('-- is'))
+    lReturn.append(parser.item('is'))
+    lReturn.append(parser.carriage_return())
+    lReturn.append(parser.item('end'))
+    lReturn.append(parser.item(';'))
+    lReturn.append(parser.carriage_return())
+    return lReturn
+
+
+class test_token_list(unittest.TestCase):
+
+    def test_searches_match_plain_list(self):
+        lTokens = create_tokens()
+        lIndexed = token_list.token_list(lTokens)
+        for iToken in range(len(lTokens)):
+            self.assertEqual(utils.find_next_token(iToken, lTokens), utils.find_next_token(iToken, lIndexed))
+            self.assertEqual(utils.find_next_non_whitespace_token(iToken, lTokens), utils.find_next_non_whitespace_token(iToken, lIndexed))
+        self.assertEqual(utils.find_earliest_occurance([';', 'is'], 0, lTokens), utils.find_earliest_occurance([';', 'is'], 0, lIndexed))
+        self.assertEqual(utils.get_range(lTokens, 1, 'foo'), utils.get_range(lIndexed, 1, 'foo'))
+
+    def test_classified_tokens_are_skipped(self):
+        lTokens = token_list.token_list(create_tokens())
+        self.assertEqual(0, utils.find_next_token(0, lTokens))
+        utils.assign_next_token(entity_declaration.entity_keyword, 0, lTokens)
+        utils.assign_next_token(entity_declaration.identifier, 0, lTokens)
+        utils.assign_next_token(entity_declaration.is_keyword, 0, lTokens)
+        self.assertEqual(7, utils.find_next_token(0, lTokens))
+        lTokens[7] = parser.todo('end')
+        lTokens[8] = parser.todo(';')
+        self.assertEqual(9, utils.find_next_token(9, lTokens))
+        self.assertEqual(3, utils.find_next_token(3, lTokens))
+
+    def test_token_becomes_unclassified(self):
+        lTokens = token_list.token_list(create_tokens())
+        lTokens[0] = parser.todo('entity')
+        self.assertEqual(2, utils.find_next_token(0, lTokens))
+        lTokens[0] = parser.item('entity')
+        self.assertEqual(0, utils.find_next_token(0, lTokens))
+
+    def test_positions_follow_replaced_values(self):
+        lTokens = token_list.token_list(create_tokens())
+        self.assertEqual(5, lTokens.find_next_value('is', 0, len(lTokens)))
+        lTokens[5] = parser.item('of')
+        lTokens[2] = parser.item('Is')
+        self.assertEqual(2, lTokens.find_next_value('is', 0, len(lTokens)))
+        self.assertIsNone(lTokens.find_next_value('is', 3, len(lTokens)))
+        self.assertIsNone(lTokens.find_next_value(';', 0, 8))
+        lTokens.insert(0, parser.item('is'))
+        self.assertEqual(0, lTokens.find_next_value('is', 0, len(lTokens)))
+
+    def test_random_replacements(self):
+        oRandom = random.Random(0)
+        lTokens = create_tokens() * 20
+        lIndexed = token_list.token_list(lTokens)
+        lReplacements = [parser.todo('a'), parser.item('b'), parser.whitespace(' '), parser.keyword('is')]
+        for iCount in range(500):
+            iIndex = oRandom.randrange(len(lTokens))
+            oToken = oRandom.choice(lReplacements)
+            lTokens[iIndex] = oToken
+            lIndexed[iIndex] = oToken
+            iToken = oRandom.randrange(len(lTokens))
+            self.assertEqual(utils.find_next_token(iToken, lTokens), utils.find_next_token(iToken, lIndexed))
+            self.assertEqual(utils.find_next_non_whitespace_token(iToken, lTokens), utils.find_next_non_whitespace_token(iToken, lIndexed))
+            if ';' in [oToken.get_value() for oToken in lTokens[iToken:]]:
+                self.assertEqual(utils.get_range(lTokens, iToken, ';'), utils.get_range(lIndexed, iToken, ';'))
@@ -0,0 +1,84 @@
+
+import unittest
+
+from vsg import parser
+from vsg import vhdlFile
+
+from vsg.token import entity_declaration
+
+from vsg.vhdlFile import token_store
+
+from vsg.tests import utils
+
+lFile = []
+utils.read_file('vsg/tests/styles/code_examples/spi_master.vhd', lFile, False)
+oFile = vhdlFile.vhdlFile(lFile)
+
+
+def summarize(lTokens):
+    lReturn = []
+    for oToken in lTokens:
+        lReturn.append((type(oToken), oToken.get_value(), oToken.get_indent(), oToken.get_hierarchy(), oToken.code_tags, oToken.get_context(), oToken.get_filename()))
+    return lReturn
+
+
+class test_token_store(unittest.TestCase):
+
+    def test_create_objects(self):
+        oStore = token_store.create(oFile.lAllObjects)
+        self.assertEqual(len(oFile.lAllObjects), len(oStore))
+        self.assertEqual(summarize(oFile.lAllObjects), summarize(oStore.create_objects()))
+
+    def test_attributes(self):
+        oToken = entity_declaration.entity_keyword('entity')
+        oToken.set_indent(0)
+        oToken.set_hierarchy(2)
+        oToken.set_code_tags(['entity_001'])
+        oToken.add_context(['a', 'b'])
+        oToken.set_filename('file.vhd')
+        lTokens = [oToken, parser.whitespace('  '), parser.carriage_return()]
+        oStore = token_store.create(lTokens)
+        self.assertEqual(summarize(lTokens), summarize(oStore.create_objects()))
+
+    def test_extend(self):
+        oStore = token_store.create([parser.item('a'), parser.whitespace(' ')])
+        oStore.join_values()
+        oStore.extend([parser.item('b'), parser.carriage_return()])
+        self.assertEqual(['a', ' ', 'b', '\n'], [oToken.get_value() for oToken in oStore.create_objects()])
+        self.assertEqual([parser.item, parser.whitespace, parser.item, parser.carriage_return], [type(oToken) for oToken in oStore.create_objects()])
+
+    def test_empty_store(self):
+        oStore = token_store.create([])
+        self.assertEqual(0, len(oStore))
+        self.assertEqual([], oStore.create_objects())
+
+    def test_bytes(self):
+        oStore = token_store.create(oFile.lAllObjects)
+        oStore = token_store.from_bytes(oStore.to_bytes())
+        self.assertEqual(summarize(oFile.lAllObjects), summarize(oStore.create_objects()))
+
+    def test_bytes_with_attributes(self):
+        oToken = entity_declaration.entity_keyword('entity')
+        oToken.set_code_tags(['entity_001'])
+        oToken.add_context(['a', 'b'])
+        oToken.set_filename('file.vhd')
+        lTokens = [oToken, parser.whitespace('  '), parser.comment('-- \u00e9')]
+        oStore = token_store.from_bytes(token_store.create(lTokens).to_bytes())
+        self.assertEqual(summarize(lTokens), summarize(oStore.create_objects()))
+
+    def test_invalid_bytes(self):
+        bData = token_store.create([parser.item('a'), parser.whitespace(' ')]).to_bytes()
+        with self.assertRaises(ValueError):
+            token_store.from_bytes(b'not a token store')
+        with self.assertRaises(ValueError):
+            token_store.from_bytes(bData[:-1])
+
+    def test_only_token_classes_are_created(self):
+        oStore = token_store.from_bytes(token_store.create([parser.item('a')]).to_bytes())
+        oStore.lClassNames = [('os', 'system')]
+        with self.assertRaises(ValueError):
+            oStore.create_objects()
+        oStore.lClasses = None
+        oStore.lClassNames = [('vsg.parser', 'tEmpty')]
+        with self.assertRaises(ValueError):
+            oStore.create_objects()
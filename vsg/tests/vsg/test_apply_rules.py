@@ -0,0 +1,51 @@
+import sys
+import unittest
+from unittest import mock
+
+from vsg import apply_rules
+from vsg import cmd_line_args
+from vsg import config
+
+sFileName = 'vsg/tests/vsg/entity1.vhd'
+
+
+class testApplyRules(unittest.TestCase):
+
+    def setUp(self):
+        sys.argv = ['vsg', '-f', sFileName, '-of', 'syntastic']
+        self.commandLineArguments = cmd_line_args.parse_command_line_arguments()
+        self.oConfig = config.New(self.commandLineArguments)
+
+    def tearDown(self):
+        apply_rules.oWorkerCommandLineArguments = None
+        apply_rules.oWorkerConfig = None
+
+    def test_apply_rules_in_worker(self):
+        tExpected = apply_rules.apply_rules(self.commandLineArguments, self.oConfig, (0, sFileName))
+
+        apply_rules.initialize_worker(self.commandLineArguments, self.oConfig)
+        lActual = apply_rules.apply_rules_in_worker([(0, sFileName)])
+
+        self.assertEqual(([(0, tExpected)], {}), lActual)
+        self.assertEqual('ERROR: vsg/tests/vsg/entity1.vhd(7)port_007 -- Change the number of spaces after the *in* keyword to four spaces.', lActual[0][0][1][3])
+
+    @mock.patch('vsg.apply_rules.apply_rules')
+    def test_apply_rules_in_worker_uses_stored_configuration(self, mock_apply_rules):
+        apply_rules.initialize_worker(self.commandLineArguments, self.oConfig)
+        apply_rules.apply_rules_in_worker([(3, sFileName), (1, sFileName)])
+        mock_apply_rules.assert_has_calls([
+            mock.call(self.commandLineArguments, self.oConfig, (3, sFileName)),
+            mock.call(self.commandLineArguments, self.oConfig, (1, sFileName))
+        ])
+
+    def test_fix_text(self):
+        with open(sFileName) as oFile:
+            lFileContent = oFile.readlines()
+
+        fStatus, lFixedLines, sOutputStd, sOutputErr = apply_rules.fix_text(self.commandLineArguments, self.oConfig, 'stdin.vhd', lFileContent)
+
+        self.assertFalse(fStatus)
+        self.assertEqual('    port4 : in    std_logic;\n', lFixedLines[6])
+        lFileContent[6] = lFixedLines[6]
+        self.assertEqual(lFileContent, lFixedLines)
+        self.assertEqual('', sOutputStd)
@@ -50,3 +50,17 @@ class TestParser(unittest.TestCase):
             cmd_line_args.parse_command_line_arguments()
 
         self.assertEqual(cm.exception.code, 2)
+
+    def test_jobs_default(self):
+        sys.argv[1:] = ["-f", "a.vhd"]
+
+        result = cmd_line_args.parse_command_line_arguments()
+
+        self.assertEqual(result.jobs, 'auto')
+
+    def test_jobs_auto(self):
+        sys.argv[1:] = ["--jobs", "auto"]
+
+        result = cmd_line_args.parse_command_line_arguments()
+
+        self.assertEqual(result.jobs, 'auto')
@@ -0,0 +1,88 @@
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+
+from vsg import __client__
+from vsg import apply_rules
+from vsg import cmd_line_args
+from vsg import config
+from vsg import server
+
+sFileName = 'vsg/tests/vsg/entity1.vhd'
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'requires Unix domain sockets')
+class testServer(unittest.TestCase):
+
+    def setUp(self):
+        sys.argv = ['vsg', '-of', 'syntastic']
+        self.commandLineArguments = cmd_line_args.parse_command_line_arguments()
+        self.oConfig = config.New(self.commandLineArguments)
+        self.sTempDir = tempfile.mkdtemp()
+        self.sSocketPath = os.path.join(self.sTempDir, 'vsg.sock')
+        self.oServer = server.server(self.sSocketPath, self.commandLineArguments, self.oConfig)
+        self.oThread = threading.Thread(target=self.oServer.serve_forever)
+        self.oThread.start()
+
+    def tearDown(self):
+        self.oServer.shutdown()
+        self.oThread.join()
+        self.oServer.server_close()
+        shutil.rmtree(self.sTempDir)
+
+    def test_file_matches_direct_analysis(self):
+        fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = apply_rules.apply_rules(self.commandLineArguments, self.oConfig, (0, sFileName))
+
+        dRequest = {'filename': sFileName, 'cwd': os.getcwd()}
+        lActual = __client__.send_requests(self.sSocketPath, [dRequest, dRequest])
+
+        self.assertEqual(2, len(lActual))
+        self.assertEqual({'status': 1, 'stdout': sOutputStd, 'stderr': sOutputErr}, lActual[0])
+        self.assertEqual(lActual[0], lActual[1])
+
+    def test_content_is_analyzed_instead_of_file(self):
+        with open(sFileName) as oFile:
+            sContent = oFile.read()
+        dRequest = {'filename': sFileName, 'cwd': os.getcwd(), 'content': sContent.replace('in    ', 'in     ')}
+
+        lActual = __client__.send_requests(self.sSocketPath, [dRequest])
+
+        self.assertEqual(1, lActual[0]['status'])
+        self.assertIn('port_007', lActual[0]['stdout'])
+        self.assertIn(sFileName + '(7)', lActual[0]['stdout'])
+
+    def test_output_format_override(self):
+        dRequest = {'filename': sFileName, 'cwd': os.getcwd(), 'output_format': 'summary'}
+
+        lActual = __client__.send_requests(self.sSocketPath, [dRequest])
+
+        self.assertTrue(lActual[0]['stderr'].startswith('File: ' + sFileName + ' ERROR'))
+
+    def test_invalid_request(self):
+        lActual = __client__.send_requests(self.sSocketPath, [{'cwd': os.getcwd()}])
+
+        self.assertEqual(1, lActual[0]['status'])
+        self.assertTrue(lActual[0]['stderr'].startswith('ERROR: invalid request'))
+
+    def test_stale_socket_is_replaced(self):
+        sSocketPath = os.path.join(self.sTempDir, 'stale.sock')
+        oSocket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        oSocket.bind(sSocketPath)
+        oSocket.close()
+
+        oServer = server.server(sSocketPath, self.commandLineArguments, self.oConfig)
+        oServer.server_close()
+
+        self.assertFalse(os.path.exists(sSocketPath))
+
+    def test_running_server_is_not_replaced(self):
+        with self.assertRaises(OSError):
+            server.server(self.sSocketPath, self.commandLineArguments, self.oConfig)
+
+        self.assertTrue(os.path.exists(self.sSocketPath))
+        lActual = __client__.send_requests(self.sSocketPath, [{'filename': sFileName, 'cwd': os.getcwd()}])
+        self.assertIn('status', lActual[0])
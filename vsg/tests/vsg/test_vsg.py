@@ -507,3 +507,19 @@ class testVsg(unittest.TestCase):
             mock.call('VHDL Style Guide (VSG) version: ' + str(version.sVersion)),
             mock.call('\n')
         ])
+
+    def test_stdin(self):
+        with open('vsg/tests/vsg/entity1.vhd', 'rb') as oFile:
+            bInput = oFile.read()
+
+        oResult = subprocess.run(['bin/vsg', '--stdin', 'entity1.vhd', '-of', 'syntastic'], input=bInput, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        self.assertEqual(0, oResult.returncode)
+        self.assertEqual(bInput.replace(b'port4 : in std_logic', b'port4 : in    std_logic'), oResult.stdout)
+        self.assertEqual(b'', oResult.stderr)
+
+        oResult = subprocess.run(['bin/vsg', '--stdin', '-of', 'syntastic', '--fix_phase', '1'], input=bInput, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        self.assertEqual(1, oResult.returncode)
+        self.assertEqual(bInput, oResult.stdout)
+        self.assertEqual(b'ERROR: stdin(7)port_007 -- Change the number of spaces after the *in* keyword to four spaces.\n', oResult.stderr)
@@ -0,0 +1,142 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from vsg import cmd_line_args
+from vsg import config
+from vsg import watch
+
+sEntity1 = 'vsg/tests/vsg/entity1.vhd'
+sEntity2 = 'vsg/tests/vsg/entity2.vhd'
+
+
+def set_file_time(sFileName, iTime):
+    os.utime(sFileName, ns=(iTime, iTime))
+
+
+class testWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.sTempDir = tempfile.mkdtemp()
+        self.sFileName = os.path.join(self.sTempDir, 'entity1.vhd')
+        shutil.copy(sEntity1, self.sFileName)
+        set_file_time(self.sFileName, 1000000000)
+
+    def tearDown(self):
+        shutil.rmtree(self.sTempDir)
+
+    def test_unchanged_file(self):
+        oWatcher = watch.watcher([self.sFileName])
+        self.assertEqual([], oWatcher.get_changed_files())
+
+    def test_touched_file_is_not_reported(self):
+        oWatcher = watch.watcher([self.sFileName])
+        set_file_time(self.sFileName, 2000000000)
+        self.assertEqual([], oWatcher.get_changed_files())
+
+    def test_modified_file(self):
+        oWatcher = watch.watcher([self.sFileName])
+        with open(self.sFileName, 'a') as oFile:
+            oFile.write('\n')
+        self.assertEqual([self.sFileName], oWatcher.get_changed_files())
+        self.assertEqual([], oWatcher.get_changed_files())
+
+    def test_deleted_file_is_not_reported(self):
+        oWatcher = watch.watcher([self.sFileName])
+        os.remove(self.sFileName)
+        self.assertEqual([], oWatcher.get_changed_files())
+        shutil.copy(sEntity2, self.sFileName)
+        self.assertEqual([self.sFileName], oWatcher.get_changed_files())
+
+
+class testSession(unittest.TestCase):
+
+    def setUp(self):
+        self.sTempDir = tempfile.mkdtemp()
+        self.sFileName1 = os.path.join(self.sTempDir, 'entity1.vhd')
+        self.sFileName2 = os.path.join(self.sTempDir, 'entity2.vhd')
+        self.sConfigName = os.path.join(self.sTempDir, 'config.yaml')
+        shutil.copy(sEntity1, self.sFileName1)
+        shutil.copy(sEntity2, self.sFileName2)
+        with open(self.sConfigName, 'w') as oFile:
+            oFile.write('rule:\n  port_007:\n    disable: false\n')
+        sys.argv = ['vsg', '-f', self.sFileName1, self.sFileName2, '-c', self.sConfigName, '-of', 'syntastic']
+        self.commandLineArguments = cmd_line_args.parse_command_line_arguments()
+        self.oConfig = config.New(self.commandLineArguments)
+
+    def tearDown(self):
+        shutil.rmtree(self.sTempDir)
+
+    @mock.patch('sys.stdout')
+    def test_only_changed_files_are_analyzed(self, mock_stdout):
+        oSession = watch.session(self.commandLineArguments, self.oConfig)
+        self.assertEqual([], oSession.poll())
+
+        with open(self.sFileName2, 'a') as oFile:
+            oFile.write('\n')
+        self.assertEqual([self.sFileName2], oSession.poll())
+        self.assertEqual([], oSession.poll())
+
+    @mock.patch('sys.stdout')
+    def test_configuration_is_only_read_when_changed(self, mock_stdout):
+        oSession = watch.session(self.commandLineArguments, self.oConfig)
+        with mock.patch('vsg.config.New') as mock_new:
+            oSession.poll()
+            mock_new.assert_not_called()
+
+        with open(self.sConfigName, 'w') as oFile:
+            oFile.write('rule:\n  port_007:\n    disable: true\n')
+        self.assertEqual([self.sFileName1, self.sFileName2], oSession.poll())
+        self.assertTrue(oSession.oConfig.dConfig['rule']['port_007']['disable'])
+        self.assertIsNot(self.oConfig, oSession.oConfig)
+
+    @mock.patch('sys.stderr')
+    @mock.patch('sys.stdout')
+    def test_invalid_configuration_is_ignored(self, mock_stdout, mock_stderr):
+        oSession = watch.session(self.commandLineArguments, self.oConfig)
+
+        with open(self.sConfigName, 'w') as oFile:
+            oFile.write('rule:\n  port_007:\n  disable: : true\n')
+        self.assertEqual([], oSession.poll())
+        self.assertIs(self.oConfig, oSession.oConfig)
+
+    @mock.patch('sys.stdout')
+    def test_fixed_files_are_not_analyzed_again(self, mock_stdout):
+        self.commandLineArguments.fix = True
+        oSession = watch.session(self.commandLineArguments, self.oConfig)
+        oSession.analyze([self.sFileName1])
+        self.assertEqual([], oSession.poll())
+
+    @mock.patch('sys.stdout')
+    def test_changed_lines_are_updated(self, mock_stdout):
+        self.commandLineArguments.changed_since = 'HEAD'
+        self.oConfig.dChangedLines = {os.path.realpath(self.sFileName1): [(1, 1)]}
+        oSession = watch.session(self.commandLineArguments, self.oConfig)
+
+        dChangedLines = {os.path.realpath(self.sFileName2): [(1, 3)]}
+        with mock.patch('vsg.changed_lines.get_changed_lines', return_value=dChangedLines) as mock_get_changed_lines:
+            with open(self.sFileName1, 'a') as oFile:
+                oFile.write('\n')
+            self.assertEqual([], oSession.poll())
+            with open(self.sFileName2, 'a') as oFile:
+                oFile.write('\n')
+            self.assertEqual([self.sFileName2], oSession.poll())
+            self.assertEqual(2, mock_get_changed_lines.call_count)
+        self.assertEqual(dChangedLines, oSession.oConfig.dChangedLines)
+
+    @mock.patch('sys.stderr')
+    @mock.patch('sys.stdout')
+    def test_changed_lines_are_kept_when_git_fails(self, mock_stdout, mock_stderr):
+        self.commandLineArguments.changed_since = 'HEAD'
+        dChangedLines = {os.path.realpath(self.sFileName1): [(1, 1)]}
+        self.oConfig.dChangedLines = dChangedLines
+        oSession = watch.session(self.commandLineArguments, self.oConfig)
+
+        with mock.patch('vsg.changed_lines.get_changed_lines', side_effect=OSError('no git')):
+            with open(self.sFileName1, 'a') as oFile:
+                oFile.write('\n')
+            self.assertEqual([self.sFileName1], oSession.poll())
+        self.assertIs(dChangedLines, oSession.oConfig.dChangedLines)
@@ -122,11 +122,7 @@ class New():
 
 
 def extract_unique_id(oToken):
-    lDoc = oToken.__doc__.split()
-    for iDoc, sDoc in enumerate(lDoc):
-        if sDoc == 'unique_id':
-            return lDoc[iDoc + 2], lDoc[iDoc + 4]
-    return None, None
+    return oToken.base_token, oToken.sub_token
 
 
 def process_tokens(lTokens):
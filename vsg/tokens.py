@@ -1,25 +1,59 @@
+import re
 
 lSingleCharacterSymbols = [',', ':', '(', ')', '\'', '"', '+', '&', '-', '*', '/', '<', '>', ';', '=', '[', ']', '?']
 lTwoCharacterSymbols = ['=>','**', ':=', '/=', '>=', '<=', '<>', '??', '?=', '?<', '?>', '<<', '>>', '--']
 lThreeCharacterSymbols = ['?/=', '?<', '?<=', '?>=']
 
 
+def build_token_pattern():
+    '''
+    Returns a regular expression which splits a line into the same tokens as applying the combine_* functions in order.
+    Comments are combined afterwards by the create function.
+    The alternatives are tried in this order:
+
+      1) character literals, including the quirk where three single quotes produce two tokens
+      2) string literals
+      3) two character symbols
+      4) single character symbols
+      5) whitespace
+      6) words
+
+    A double quote between single quotes is only a character literal if no string literal can start at it.
+
+    Returns: (compiled regular expression)
+    '''
+    sSymbols = re.escape(''.join(lSingleCharacterSymbols))
+    lAlternatives = []
+    lAlternatives.append("''(?=')")
+    lAlternatives.append("'[^'(\"]'")
+    lAlternatives.append("'\"'(?!.*\")")
+    lAlternatives.append('"[^"]*"')
+    lAlternatives.extend([re.escape(sSymbol) for sSymbol in lTwoCharacterSymbols])
+    lAlternatives.append('[' + sSymbols + ']')
+    lAlternatives.append(' +')
+    lAlternatives.append('[^ ' + sSymbols + ']+')
+    return re.compile('|'.join(lAlternatives), re.DOTALL)
+
+
+oTokenPattern = build_token_pattern()
+
+
 def create(sString):
     '''
     This function takes a string and returns a list of tokens.
+    The line is scanned once, and everything from the first comment to the end of the line is combined into a single token.
+    Whitespace at the end of a line with a comment is kept as a separate token.
     '''
-    lCharacters = []
-
-    for sChar in sString:
-        lCharacters.append(sChar)
-    lCharacters = combine_whitespace(lCharacters)
-    lCharacters = combine_two_character_symbols(lCharacters)
-    lCharacters = combine_characters_into_words(lCharacters)
-    lCharacters = combine_string_literals(lCharacters)
-    lCharacters = combine_character_literals(lCharacters)
-    lCharacters = combine_comments(lCharacters)
-#    print(lCharacters)
-    return lCharacters
+    lReturn = oTokenPattern.findall(sString)
+    try:
+        iComment = lReturn.index('--')
+    except ValueError:
+        return lReturn
+    iEnd = len(lReturn)
+    if iEnd - 1 > iComment and lReturn[-1].isspace():
+        iEnd -= 1
+    lReturn[iComment:iEnd] = [''.join(lReturn[iComment:iEnd])]
+    return lReturn
 
 
 def combine_comments(lChars):
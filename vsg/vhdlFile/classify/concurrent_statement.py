@@ -1,3 +1,4 @@
+from vsg.vhdlFile import first_set
 
 from vsg.vhdlFile.classify import block_statement
 from vsg.vhdlFile.classify import component_instantiation_statement
@@ -7,6 +8,15 @@ from vsg.vhdlFile.classify import concurrent_signal_assignment_statement
 from vsg.vhdlFile.classify import generate_statement
 from vsg.vhdlFile.classify import process_statement
 
+oAlternatives = first_set.table()
+oAlternatives.add(process_statement, ['process'], 4)
+oAlternatives.add(block_statement, ['block'], 3)
+oAlternatives.add(generate_statement, ['for', 'if', 'case'], 3)
+oAlternatives.add(concurrent_assertion_statement, ['assert'], 4)
+oAlternatives.add(concurrent_signal_assignment_statement)
+oAlternatives.add(concurrent_procedure_call_statement)
+oAlternatives.add(component_instantiation_statement)
+
 
 def detect(iToken, lObjects):
     '''
@@ -20,33 +30,4 @@ def detect(iToken, lObjects):
       | generate_statement
       | PSL_PSL_Directive
     '''
-
-    iCurrent = process_statement.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = block_statement.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = generate_statement.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = concurrent_assertion_statement.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = concurrent_signal_assignment_statement.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = concurrent_procedure_call_statement.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = component_instantiation_statement.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
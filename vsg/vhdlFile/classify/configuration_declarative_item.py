@@ -1,8 +1,14 @@
+from vsg.vhdlFile import first_set
 
 from vsg.vhdlFile.classify import attribute_specification
 from vsg.vhdlFile.classify import group_declaration
 from vsg.vhdlFile.classify import use_clause
 
+oAlternatives = first_set.table()
+oAlternatives.add(use_clause, ['use'])
+oAlternatives.add(attribute_specification, ['attribute'])
+oAlternatives.add(group_declaration, ['group'])
+
 
 def detect(iToken, lObjects):
     '''
@@ -11,17 +17,4 @@ def detect(iToken, lObjects):
       | attribute_specification
       | group_declaration
     '''
-
-    iReturn = use_clause.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = attribute_specification.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = group_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
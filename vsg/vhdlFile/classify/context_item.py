@@ -1,8 +1,15 @@
 
+from vsg.vhdlFile import first_set
+
 from vsg.vhdlFile.classify import context_reference
 from vsg.vhdlFile.classify import library_clause
 from vsg.vhdlFile.classify import use_clause
 
+oAlternatives = first_set.table()
+oAlternatives.add(library_clause, ['library'])
+oAlternatives.add(use_clause, ['use'])
+oAlternatives.add(context_reference, ['context'])
+
 
 def detect(iToken, lObjects):
     '''
@@ -11,17 +18,4 @@ def detect(iToken, lObjects):
       | use_clause
       | context_reference
     '''
-
-    iCurrent = library_clause.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = use_clause.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = context_reference.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
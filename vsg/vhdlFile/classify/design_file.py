@@ -1,4 +1,5 @@
 
+from vsg.vhdlFile import token_list
 from vsg.vhdlFile import utils
 
 from vsg.vhdlFile.classify import design_unit
@@ -8,7 +9,18 @@ def tokenize(lObjects):
     '''
     design_file ::=
         design_unit { design_unit }
+
+    The tokens are classified in a token_list, so searches for the next unclassified token use its indexes.
+    lObjects is updated with the classified tokens.
     '''
+    lTokens = token_list.token_list(lObjects)
+    try:
+        classify(lTokens)
+    finally:
+        lObjects[:] = lTokens
+
+
+def classify(lObjects):
     iReturn = 0
     for iCurrent in range(0, len(lObjects)):
         iTemp = iCurrent
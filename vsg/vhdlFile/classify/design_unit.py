@@ -1,19 +1,17 @@
 
+from vsg.vhdlFile import first_set
+
 from vsg.vhdlFile.classify import context_clause
 from vsg.vhdlFile.classify import library_unit
 
+oAlternatives = first_set.table()
+oAlternatives.add(context_clause, ['library', 'use', 'context'])
+oAlternatives.add(library_unit, ['context', 'entity', 'package', 'configuration', 'architecture'])
+
 
 def detect(iToken, lObjects):
     '''
     design_unit ::=
         context_clause library_unit
     '''
-    iCurrent = context_clause.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = library_unit.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
@@ -1,3 +1,4 @@
+from vsg.vhdlFile import first_set
 
 from vsg.vhdlFile.classify import alias_declaration
 from vsg.vhdlFile.classify import attribute_declaration
@@ -17,6 +18,24 @@ from vsg.vhdlFile.classify import type_declaration
 from vsg.vhdlFile.classify import use_clause
 from vsg.vhdlFile.classify import variable_declaration
 
+oAlternatives = first_set.table()
+oAlternatives.add(subprogram_declaration, ['procedure', 'pure', 'impure', 'function'], 1, subprogram_body)
+oAlternatives.add(subprogram_instantiation_declaration, ['procedure', 'function'])
+oAlternatives.add(package_declaration, ['package'])
+oAlternatives.add(package_body, ['package'])
+oAlternatives.add(package_instantiation_declaration, ['package'])
+oAlternatives.add(type_declaration, ['type'])
+oAlternatives.add(subtype_declaration, ['subtype'])
+oAlternatives.add(constant_declaration, ['constant'])
+oAlternatives.add(signal_declaration, ['signal'])
+oAlternatives.add(variable_declaration, ['shared', 'variable'])
+oAlternatives.add(file_declaration, ['file'])
+oAlternatives.add(alias_declaration, ['alias'])
+oAlternatives.add(component_declaration, ['component'])
+oAlternatives.add(attribute_declaration, ['attribute'])
+oAlternatives.add(attribute_specification, ['attribute'])
+oAlternatives.add(use_clause, ['use'])
+
 
 def detect(iToken, lObjects):
     '''
@@ -44,73 +63,4 @@ def detect(iToken, lObjects):
       | PSL_Sequence_Declaration
       | PSL_Clock_Declaration
     '''
-
-    iCurrent = subprogram_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        iCurrent = subprogram_body.detect(iCurrent, lObjects)
-        return iCurrent
-
-    iCurrent = subprogram_instantiation_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = package_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = package_body.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = package_instantiation_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = type_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = subtype_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = constant_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = signal_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = variable_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = file_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = alias_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = component_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = attribute_declaration.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = attribute_specification.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-
-
-    iCurrent = use_clause.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
@@ -1,7 +1,13 @@
 
+from vsg.vhdlFile import first_set
+
 from vsg.vhdlFile.classify import primary_unit
 from vsg.vhdlFile.classify import secondary_unit
 
+oAlternatives = first_set.table()
+oAlternatives.add(primary_unit, ['context', 'entity', 'package', 'configuration'])
+oAlternatives.add(secondary_unit, ['architecture', 'package'])
+
 
 def detect(iToken, lObjects):
     '''
@@ -9,13 +15,4 @@ def detect(iToken, lObjects):
         primary_unit
       | secondary_unit
     '''
-
-    iCurrent = primary_unit.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    iCurrent = secondary_unit.detect(iToken, lObjects)
-    if iCurrent != iToken:
-        return iCurrent
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
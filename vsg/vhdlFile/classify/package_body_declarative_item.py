@@ -1,3 +1,4 @@
+from vsg.vhdlFile import first_set
 
 from vsg.vhdlFile.classify import subprogram_declaration
 from vsg.vhdlFile.classify import subprogram_body
@@ -16,6 +17,23 @@ from vsg.vhdlFile.classify import attribute_declaration
 from vsg.vhdlFile.classify import attribute_specification
 from vsg.vhdlFile.classify import use_clause
 
+oAlternatives = first_set.table()
+oAlternatives.add(subprogram_declaration, ['procedure', 'pure', 'impure', 'function'], 1, subprogram_body)
+oAlternatives.add(subprogram_instantiation_declaration, ['procedure', 'function'])
+oAlternatives.add(package_declaration, ['package'])
+oAlternatives.add(package_body, ['package'])
+oAlternatives.add(package_instantiation_declaration, ['package'])
+oAlternatives.add(type_declaration, ['type'])
+oAlternatives.add(subtype_declaration, ['subtype'])
+oAlternatives.add(constant_declaration, ['constant'])
+oAlternatives.add(variable_declaration, ['shared', 'variable'])
+oAlternatives.add(file_declaration, ['file'])
+oAlternatives.add(alias_declaration, ['alias'])
+oAlternatives.add(component_declaration, ['component'])
+oAlternatives.add(attribute_declaration, ['attribute'])
+oAlternatives.add(attribute_specification, ['attribute'])
+oAlternatives.add(use_clause, ['use'])
+
 
 def detect(iToken, lObjects):
     '''
@@ -38,69 +56,4 @@ def detect(iToken, lObjects):
       | group_template_declaration
       | group_declaration
     '''
-
-    iReturn = subprogram_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        iReturn = subprogram_body.detect(iReturn, lObjects)
-        return iReturn
-
-    iReturn = subprogram_instantiation_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = package_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = package_body.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = package_instantiation_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = type_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = subtype_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = constant_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = variable_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = file_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = alias_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = component_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = attribute_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = attribute_specification.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-
-
-    iReturn = use_clause.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
@@ -1,3 +1,4 @@
+from vsg.vhdlFile import first_set
 
 from vsg.vhdlFile.classify import subprogram_declaration
 from vsg.vhdlFile.classify import subprogram_instantiation_declaration
@@ -16,6 +17,23 @@ from vsg.vhdlFile.classify import attribute_specification
 
 from vsg.vhdlFile.classify import use_clause
 
+oAlternatives = first_set.table()
+oAlternatives.add(subprogram_declaration, ['procedure', 'pure', 'impure', 'function'])
+oAlternatives.add(subprogram_instantiation_declaration, ['procedure', 'function'])
+oAlternatives.add(package_declaration, ['package'])
+oAlternatives.add(package_instantiation_declaration, ['package'])
+oAlternatives.add(type_declaration, ['type'])
+oAlternatives.add(subtype_declaration, ['subtype'])
+oAlternatives.add(constant_declaration, ['constant'])
+oAlternatives.add(signal_declaration, ['signal'])
+oAlternatives.add(variable_declaration, ['shared', 'variable'])
+oAlternatives.add(file_declaration, ['file'])
+oAlternatives.add(alias_declaration, ['alias'])
+oAlternatives.add(component_declaration, ['component'])
+oAlternatives.add(attribute_declaration, ['attribute'])
+oAlternatives.add(attribute_specification, ['attribute'])
+oAlternatives.add(use_clause, ['use'])
+
 
 def detect(iToken, lObjects):
     '''
@@ -41,65 +59,4 @@ def detect(iToken, lObjects):
       | PSL_Property_Declaration
       | PSL_Sequence_Declaration
     '''
-
-    iReturn = subprogram_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = subprogram_instantiation_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = package_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = package_instantiation_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = type_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = subtype_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = constant_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = signal_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = variable_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = file_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = alias_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = component_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = attribute_declaration.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = attribute_specification.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    iReturn = use_clause.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
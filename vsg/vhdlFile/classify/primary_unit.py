@@ -1,10 +1,19 @@
 
+from vsg.vhdlFile import first_set
+
 from vsg.vhdlFile.classify import configuration_declaration
 from vsg.vhdlFile.classify import context_declaration
 from vsg.vhdlFile.classify import entity_declaration
 from vsg.vhdlFile.classify import package_declaration
 from vsg.vhdlFile.classify import package_instantiation_declaration
 
+oAlternatives = first_set.table()
+oAlternatives.add(context_declaration, ['context'])
+oAlternatives.add(entity_declaration, ['entity'])
+oAlternatives.add(package_declaration, ['package'])
+oAlternatives.add(package_instantiation_declaration, ['package'])
+oAlternatives.add(configuration_declaration, ['configuration'])
+
 
 def detect(iToken, lObjects):
     '''
@@ -16,25 +25,4 @@ def detect(iToken, lObjects):
       | context_declaration
       | PSL_Verification_Unit
     '''
-
-    iReturned = context_declaration.detect(iToken, lObjects)
-    if iReturned != iToken:
-        return iReturned
-
-    iReturned = entity_declaration.detect(iToken, lObjects)
-    if iReturned != iToken:
-        return iReturned
-
-    iReturned = package_declaration.detect(iToken, lObjects)
-    if iReturned != iToken:
-        return iReturned
-
-    iReturned = package_instantiation_declaration.detect(iToken, lObjects)
-    if iReturned != iToken:
-        return iReturned
-
-    iReturned = configuration_declaration.detect(iToken, lObjects)
-    if iReturned != iToken:
-        return iReturned
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
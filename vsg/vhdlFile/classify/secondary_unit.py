@@ -1,7 +1,13 @@
 
+from vsg.vhdlFile import first_set
+
 from vsg.vhdlFile.classify import architecture_body
 from vsg.vhdlFile.classify import package_body
 
+oAlternatives = first_set.table()
+oAlternatives.add(architecture_body, ['architecture'])
+oAlternatives.add(package_body, ['package'])
+
 
 def detect(iToken, lObjects):
     '''
@@ -9,12 +15,4 @@ def detect(iToken, lObjects):
         architecture_body
       | package_body
     '''
-    iReturned = architecture_body.detect(iToken, lObjects)
-    if iReturned != iToken:
-        return iReturned
-
-    iReturned = package_body.detect(iToken, lObjects)
-    if iReturned != iToken:
-        return iReturned
-
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
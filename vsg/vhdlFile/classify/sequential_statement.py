@@ -1,5 +1,5 @@
 
-#from vsg.vhdlFile import utils
+from vsg.vhdlFile import first_set
 
 from vsg.vhdlFile.classify import assertion_statement
 from vsg.vhdlFile.classify import case_statement
@@ -15,6 +15,21 @@ from vsg.vhdlFile.classify import signal_assignment_statement
 from vsg.vhdlFile.classify import variable_assignment_statement
 from vsg.vhdlFile.classify import wait_statement
 
+oAlternatives = first_set.table()
+oAlternatives.add(wait_statement, ['wait'], 3)
+oAlternatives.add(assertion_statement, ['assert'], 3)
+oAlternatives.add(report_statement, ['report'], 3)
+oAlternatives.add(case_statement, ['case'], 3)
+oAlternatives.add(if_statement, ['if'], 3)
+oAlternatives.add(loop_statement, ['loop', 'while', 'for'], 5)
+oAlternatives.add(signal_assignment_statement)
+oAlternatives.add(variable_assignment_statement)
+oAlternatives.add(procedure_call_statement)
+oAlternatives.add(next_statement, ['next'], 3)
+oAlternatives.add(exit_statement, ['exit'], 3)
+oAlternatives.add(return_statement, ['return'], 3)
+oAlternatives.add(null_statement, ['null'], 3)
+
 
 def detect(iToken, lObjects):
     '''
@@ -33,70 +48,4 @@ def detect(iToken, lObjects):
       | return_statement
       | null_statement
     '''
-
-#    print('--> checking wait_statement')
-    iReturn = wait_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking assertion_statement')
-    iReturn = assertion_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking report_statement')
-    iReturn = report_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking case_statement')
-    iReturn = case_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking if_statement')
-    iReturn = if_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking loop_statement')
-    iReturn = loop_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-#    print('--> checking signal_assignment')
-    iReturn = signal_assignment_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking variable_assignment')
-    iReturn = variable_assignment_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking procedure_call_statement')
-    iReturn = procedure_call_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking next_statement')
-    iReturn = next_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking exit_statement')
-    iReturn = exit_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking return_statement')
-    iReturn = return_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-
-#    print('--> checking null_statement')
-    iReturn = null_statement.detect(iToken, lObjects)
-    if iReturn != iToken:
-        return iReturn
-#    print('<-- Returning')
-#    utils.print_next_token(iToken, lObjects)
-    return iToken
+    return oAlternatives.detect(iToken, lObjects)
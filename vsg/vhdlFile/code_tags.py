@@ -1,4 +1,6 @@
 
+import bisect
+
 from vsg import parser
 
 
@@ -9,23 +11,32 @@ class New():
       self.next_line_code_tags = []
       self.bIgnoreNextCarriageReturn = False
       self.iLine = 0
+      self.tTags = parser.tEmpty
 
   def clear(self):
       self.code_tags.clear()
       self.next_line_code_tags.clear()
+      self.tTags = None
 
   def remove(self, sCodeTag):
       self.code_tags.remove(sCodeTag)
+      self.tTags = None
 
   def add(self, sCodeTag):
       if sCodeTag not in self.code_tags:
           self.code_tags.append(sCodeTag)
+          self.tTags = None
 
   def get_tags(self):
-      lReturn = []
-      lReturn.extend(self.code_tags)
-      lReturn.extend(self.next_line_code_tags)
-      return lReturn
+      '''
+      Returns the code tags which apply to the current token.
+      The tags are only combined again after they change, so consecutive tokens share the same interned tuple.
+
+      Returns: (tuple of strings)
+      '''
+      if self.tTags is None:
+          self.tTags = parser.intern_code_tags(self.code_tags + self.next_line_code_tags)
+      return self.tTags
 
   def update(self, oToken):
       if isinstance(oToken, parser.comment):
@@ -51,10 +62,134 @@ class New():
               for sCodeTag in lValues[2:]:
                  if sCodeTag not in self.next_line_code_tags:
                      self.next_line_code_tags.append(sCodeTag)
+                     self.tTags = None
               self.bIgnoreNextCarriageReturn = True
       elif isinstance(oToken, parser.carriage_return):
           self.iLine += 1
           if self.bIgnoreNextCarriageReturn:
               self.bIgnoreNextCarriageReturn = False
-          else:
+          elif len(self.next_line_code_tags) > 0:
               self.next_line_code_tags.clear()
+              self.tTags = None
+
+
+def create_regions(lTokens, oVhdlFile=None):
+    '''
+    Returns the regions of a list of tokens where each code tag applies.
+
+    Parameters:
+
+      lTokens: (list of token objects)
+
+      oVhdlFile: (vhdlFile object) the file the tokens belong to
+
+    Returns: (regions object)
+    '''
+    oReturn = regions(lTokens, oVhdlFile)
+    iStart = 0
+    tCodeTags = parser.tEmpty
+    for iToken, oToken in enumerate(lTokens):
+        if oToken.code_tags is not tCodeTags and oToken.code_tags != tCodeTags:
+            oReturn.add(tCodeTags, iStart, iToken - 1)
+            tCodeTags = oToken.code_tags
+            iStart = iToken
+    oReturn.add(tCodeTags, iStart, len(lTokens) - 1)
+    return oReturn
+
+
+class regions():
+    '''
+    Stores the code tags of a list of tokens as sorted ranges of token indexes for each code tag.
+    Tokens which are tagged with only 'all' are stored under the key None.
+
+    A token has a code tag if it has the same code tag in its code_tags or if its code_tags are only 'all'.
+    Checking if a range of tokens has a code tag uses a binary search instead of checking every token.
+
+    The regions keep the version of the file they were created from.
+    They are only used while the file has the same version, as every change to the tokens of the file increments it.
+
+    Parameters:
+
+      lTokens: (list of token objects)
+
+      oVhdlFile: (vhdlFile object) the file the tokens belong to, or None if the tokens do not change
+    '''
+
+    def __init__(self, lTokens, oVhdlFile=None):
+        self.lTokens = lTokens
+        self.oVhdlFile = oVhdlFile
+        self.iVersion = None
+        if oVhdlFile is not None:
+            self.iVersion = oVhdlFile.iVersion
+        self.dStarts = {}
+        self.dEnds = {}
+
+    def is_current(self):
+        '''
+        Returns True if the tokens have not changed since the regions were created.
+
+        Returns: (boolean)
+        '''
+        return self.oVhdlFile is None or self.oVhdlFile.iVersion == self.iVersion
+
+    def add(self, tCodeTags, iStart, iEnd):
+        if iEnd < iStart or len(tCodeTags) == 0:
+            return
+        if tCodeTags == parser.tAllCodeTags:
+            lKeys = [None]
+        else:
+            lKeys = tCodeTags
+        for sKey in lKeys:
+            lStarts = self.dStarts.setdefault(sKey, [])
+            lEnds = self.dEnds.setdefault(sKey, [])
+            if len(lEnds) > 0 and lEnds[-1] >= iStart - 1:
+                lEnds[-1] = max(lEnds[-1], iEnd)
+            else:
+                lStarts.append(iStart)
+                lEnds.append(iEnd)
+
+    def has_code_tag(self, sCodeTag, iStart, iEnd):
+        '''
+        Returns True if any token between two indexes has a code tag.
+
+        Parameters:
+
+          sCodeTag: (string)
+
+          iStart: (integer)
+
+          iEnd: (integer) inclusive
+
+        Returns: (boolean)
+        '''
+        if iEnd < iStart:
+            return False
+        for sKey in [sCodeTag, None]:
+            try:
+                lStarts = self.dStarts[sKey]
+            except KeyError:
+                continue
+            iRegion = bisect.bisect_right(lStarts, iEnd) - 1
+            if iRegion >= 0 and self.dEnds[sKey][iRegion] >= iStart:
+                return True
+        return False
+
+    def are_tokens_at_index(self, lTokens, iStart):
+        '''
+        Returns True if a list of tokens is the same as the tokens the regions were created from, starting at an index.
+
+        Only the first and last tokens are compared.
+        The tokens of a violation are either a slice of the file or have been filtered, which leaves the last token at a different index.
+
+        Parameters:
+
+          lTokens: (list of token objects)
+
+          iStart: (integer)
+
+        Returns: (boolean)
+        '''
+        iEnd = iStart + len(lTokens) - 1
+        if iStart < 0 or iEnd >= len(self.lTokens) or not self.is_current():
+            return False
+        return self.lTokens[iStart] is lTokens[0] and self.lTokens[iEnd] is lTokens[-1]
@@ -18,7 +18,7 @@ def get_interface_elements_between_tokens(oStart, oEnd, lAllTokens, oTokenMap):
         lTemp = []
         for iIndex in range(0, len(lToi)):
             oToken = lToi[iIndex]
-            if not isinstance(oToken, parser.whitespace) and not isinstance(oToken, parser.carriage_return) and not isinstance(oToken, parser.comment) and not bStore:
+            if not oToken.category & (parser.iWhitespace | parser.iCarriageReturn | parser.iComment) and not bStore:
                 bStore = True
                 iStartIndex = iIndex + iStart + 1
                 iLineNumber = iLine
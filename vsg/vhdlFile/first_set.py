@@ -0,0 +1,84 @@
+
+from vsg.vhdlFile import utils
+
+
+class table():
+    '''
+    Tries the alternatives of a production in order, skipping the alternatives which can not match.
+
+    Each alternative is added with its FIRST keywords and the number of unclassified tokens its detect function looks at to find them.
+    The number of tokens includes an optional label and colon, so [ label : ] keyword is found by looking at three tokens.
+    The lowercase values of the next tokens are read once and an alternative is only tried if one of its FIRST keywords is in them.
+    Alternatives without FIRST keywords, such as statements starting with a name, are always tried.
+
+    If the next tokens can not be read because the end of the file is reached, every alternative is tried.
+    '''
+
+    def __init__(self):
+        self.lAlternatives = []
+        self.iTokens = 0
+
+    def add(self, oModule, lKeywords=None, iTokens=1, oFollowingModule=None):
+        '''
+        Adds an alternative.
+        The detect function of the module is looked up when it is called, so modules which import each other can be added.
+
+        Parameters:
+
+          oModule: (module) classify module with a detect function, which returns the index it classified to or iToken if it does not match
+
+          lKeywords: (list of strings) lowercase FIRST keywords or None to always try the alternative
+
+          iTokens: (integer) number of unclassified tokens the detect function looks at to find the keywords
+
+          oFollowingModule: (module) classify module which is detected after the alternative matches
+
+        Returns: Nothing
+        '''
+        if lKeywords is None:
+            self.lAlternatives.append((oModule, None, 0, oFollowingModule))
+        else:
+            self.lAlternatives.append((oModule, frozenset(lKeywords), iTokens, oFollowingModule))
+            self.iTokens = max(self.iTokens, iTokens)
+
+    def get_alternatives(self, iToken, lObjects):
+        '''
+        Returns the alternatives which might match.
+
+        Parameters:
+
+          iToken: (integer)
+
+          lObjects: (list of token objects)
+
+        Returns: (list of (module, module) tuples)
+        '''
+        try:
+            lValues = utils.get_next_token_values(iToken, lObjects, self.iTokens)
+        except (IndexError, AttributeError):
+            lValues = []
+        lReturn = []
+        for oModule, setKeywords, iTokens, oFollowingModule in self.lAlternatives:
+            if setKeywords is None or len(lValues) < self.iTokens or not setKeywords.isdisjoint(lValues[:iTokens]):
+                lReturn.append((oModule, oFollowingModule))
+        return lReturn
+
+    def detect(self, iToken, lObjects):
+        '''
+        Returns the index after the first alternative which matches or iToken if none of them match.
+
+        Parameters:
+
+          iToken: (integer)
+
+          lObjects: (list of token objects)
+
+        Returns: (integer)
+        '''
+        for oModule, oFollowingModule in self.get_alternatives(iToken, lObjects):
+            iReturn = oModule.detect(iToken, lObjects)
+            if iReturn != iToken:
+                if oFollowingModule is not None:
+                    iReturn = oFollowingModule.detect(iReturn, lObjects)
+                return iReturn
+        return iToken
@@ -3,9 +3,60 @@ from vsg import parser
 from vsg import token
 
 
+lSpecialTokens = []
+lSpecialTokens.append((token.context_declaration.end_keyword, 'library_end'))
+lSpecialTokens.append((token.library_clause.keyword, 'library'))
+lSpecialTokens.append((token.use_clause.keyword, 'use_clause'))
+lSpecialTokens.append((token.context_reference.keyword, 'library_item'))
+lSpecialTokens.append((token.architecture_body.architecture_keyword, 'architecture'))
+lSpecialTokens.append((token.architecture_body.semicolon, 'architecture_end'))
+lSpecialTokens.append((token.entity_declaration.entity_keyword, 'library_end'))
+lSpecialTokens.append((token.package_body.package_keyword, 'library_end'))
+lSpecialTokens.append((token.package_declaration.package_keyword, 'library_end'))
+lSpecialTokens.append((parser.comment, 'library_item'))
+lSpecialTokens.append((token.concurrent_signal_assignment_statement.label_name, 'signal_assignment'))
+lSpecialTokens.append((token.concurrent_signal_assignment_statement.postponed_keyword, 'signal_assignment'))
+lSpecialTokens.append((token.concurrent_simple_signal_assignment.target, 'signal_assignment'))
+lSpecialTokens.append((token.concurrent_conditional_signal_assignment.target, 'signal_assignment'))
+lSpecialTokens.append((token.concurrent_selected_signal_assignment.with_keyword, 'signal_assignment'))
+lSpecialTokens.append((token.concurrent_simple_signal_assignment.semicolon, 'signal_assignment_end'))
+lSpecialTokens.append((token.concurrent_conditional_signal_assignment.semicolon, 'signal_assignment_end'))
+lSpecialTokens.append((token.concurrent_selected_signal_assignment.semicolon, 'signal_assignment_end'))
+
+
+def get_special_action(oToken):
+    '''
+    Returns how a token is handled when setting indents.
+
+    Parameters:
+
+      oToken: (token object)
+
+    Returns: (string) the action of the first class in lSpecialTokens the token is an instance of, or None
+    '''
+    for oClass, sAction in lSpecialTokens:
+        if oClass.type_id in oToken.type_ids:
+            return sAction
+    return None
+
+
 def set_token_indent(dIndentMap, lTokens):
+    '''
+    Sets the indent of every token.
+
+    The indent configuration and the special handling of a token are looked up once per token class.
+
+    Parameters:
+
+      dIndentMap: (indent configuration dictionary)
+
+      lTokens: (list of token objects)
+
+    Returns: Nothing
+    '''
 
-    lTokenKeys, dIndents = process_indent_map(dIndentMap)
+    dIndents = process_indent_map(dIndentMap)
+    dTokenTypes = {}
 
     iIndent = 0
     bLibraryFound = False
@@ -15,112 +66,67 @@ def set_token_indent(dIndentMap, lTokens):
 
     for oToken in lTokens:
 
-        if isinstance(oToken, parser.whitespace):
+        iCategory = oToken.category
+
+        if iCategory & parser.iWhitespace:
             continue
 
-        if isinstance(oToken, parser.blank_line):
+        if iCategory & parser.iBlankLine:
             bLibraryFound = False
             continue
 
-        if isinstance(oToken, parser.carriage_return):
+        if iCategory & parser.iCarriageReturn:
             continue
 
-        sUniqueId = oToken.get_unique_id(sJoin=':')
+        try:
+            dIndent, sAction = dTokenTypes[oToken.type_id]
+        except KeyError:
+            dIndent = dIndents.get(oToken.get_unique_id(sJoin=':'))
+            sAction = get_special_action(oToken)
+            dTokenTypes[oToken.type_id] = dIndent, sAction
 
         iTokenIndent = None
 
-        if sUniqueId in lTokenKeys:
-            token_key = dIndents[sUniqueId]['token']
-            after_key = dIndents[sUniqueId]['after']
+        if dIndent is not None:
+            token_key = dIndent['token']
+            after_key = dIndent['after']
             iTokenIndent = update_indent_var(iIndent, token_key)
             oToken.set_indent(iTokenIndent)
             iIndent = update_indent_var(iIndent, after_key)
 
-        if isinstance(oToken, token.context_declaration.end_keyword):
+        if sAction is None:
+            oToken.set_indent(iTokenIndent)
+
+        elif sAction == 'library_end':
             bLibraryFound = False
-            continue
 
-        if isinstance(oToken, token.library_clause.keyword):
+        elif sAction == 'library':
             bLibraryFound = True
-            continue
 
-        if isinstance(oToken, token.use_clause.keyword):
+        elif sAction == 'use_clause':
             if not bArchitectureFound:
                 oToken.set_indent(iIndent + 1)
             else:
                 oToken.set_indent(iIndent)
-            continue
 
-        if isinstance(oToken, token.context_reference.keyword):
+        elif sAction == 'library_item':
             if bLibraryFound:
                 oToken.set_indent(iIndent + 1)
             else:
                 oToken.set_indent(iIndent)
-            continue
 
-        if isinstance(oToken, token.architecture_body.architecture_keyword):
+        elif sAction == 'architecture':
             bLibraryFound = False
             bArchitectureFound = True
-            continue
 
-        if isinstance(oToken, token.architecture_body.semicolon):
+        elif sAction == 'architecture_end':
             bArchitectureFound = False
-            continue
 
-        if isinstance(oToken, token.entity_declaration.entity_keyword):
-            bLibraryFound = False
-            continue
-
-        if isinstance(oToken, token.package_body.package_keyword):
-            bLibraryFound = False
-            continue
-
-        if isinstance(oToken, token.package_declaration.package_keyword):
-            bLibraryFound = False
-            continue
-
-        ### Comments
-        if isinstance(oToken, parser.comment):
-            if bLibraryFound:
-                oToken.set_indent(iIndent + 1)
-            else:
-                oToken.set_indent(iIndent)
-            continue
-
-        ### Concurrent signal assignment
-        if isinstance(oToken, token.concurrent_signal_assignment_statement.label_name):
-            dVars['insideConcurrentSignalAssignment'] = True
-            continue
-
-        if isinstance(oToken, token.concurrent_signal_assignment_statement.postponed_keyword):
-            dVars['insideConcurrentSignalAssignment'] = True
-            continue
-
-        if isinstance(oToken, token.concurrent_simple_signal_assignment.target):
-            dVars['insideConcurrentSignalAssignment'] = True
-            continue
-
-        if isinstance(oToken, token.concurrent_conditional_signal_assignment.target):
+        elif sAction == 'signal_assignment':
             dVars['insideConcurrentSignalAssignment'] = True
-            continue
-
-        if isinstance(oToken, token.concurrent_selected_signal_assignment.with_keyword):
-            dVars['insideConcurrentSignalAssignment'] = True
-            continue
 
-        if isinstance(oToken, token.concurrent_simple_signal_assignment.semicolon):
+        elif sAction == 'signal_assignment_end':
             dVars['insideConcurrentSignalAssignment'] = False
-            continue
-
-        if isinstance(oToken, token.concurrent_conditional_signal_assignment.semicolon):
-            dVars['insideConcurrentSignalAssignment'] = False
-            continue
-
-        if isinstance(oToken, token.concurrent_selected_signal_assignment.semicolon):
-            dVars['insideConcurrentSignalAssignment'] = False
-            continue
-
-        oToken.set_indent(iTokenIndent)
 
 
 def update_indent_var(iIndent, update):
@@ -142,6 +148,4 @@ def process_indent_map(dIndentMap):
             sUniqueId = sTopKey + ':' + sSubKey
             dReturn[sUniqueId] = dIndentMap['indent']['tokens'][sTopKey][sSubKey]
 
-    lReturn = list(dReturn.keys())
-
-    return lReturn, dReturn
+    return dReturn
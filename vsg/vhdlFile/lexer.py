@@ -0,0 +1,103 @@
+
+from vsg import parser
+from vsg import tokens
+
+from vsg.token import pragma as pragma_token
+
+
+def create_objects(lLines, lOpenPragmas, lClosePragmas, dVars):
+    '''
+    Splits lines into tokens and returns an object for every token, followed by a carriage return at the end of every line.
+
+    The objects are classified as they are created.
+    Lines are scanned one at a time so they can be streamed from the file.
+    The result is the same as creating a parser.item for every token and then running the classify functions in this order:
+
+      1) blank
+      2) whitespace
+      3) comment
+      4) preprocessor
+      5) pragma
+
+    Parameters:
+
+      lLines: (iterable of strings) each line is read once
+
+      lOpenPragmas: (list of strings) comments which start a region of code to ignore
+
+      lClosePragmas: (list of strings) comments which end a region of code to ignore
+
+      dVars: (dictionary) holds the state of the pragma between calls
+
+    Returns: (list of parser objects)
+    '''
+    lReturn = []
+    append = lReturn.append
+    create = tokens.create
+    item = parser.item
+    whitespace = parser.whitespace
+    comment = parser.comment
+    ignore = pragma_token.ignore
+    carriage_return = parser.carriage_return
+    setOpenPragmas = set(lOpenPragmas)
+    setClosePragmas = set(lClosePragmas)
+    bPragma = dVars['pragma']
+
+    for sLine in lLines:
+        sLine = sLine.replace('\t', '  ').rstrip('\n').rstrip('\r')
+        lTokens = create(sLine)
+        if len(lTokens) == 0:
+            append(parser.blank_line())
+            append(carriage_return())
+            continue
+
+        if is_preprocessor(lTokens):
+            # The whole line is a single object, which is ignored if the pragma state after its first token says so
+            bIgnore = False
+            for iToken, sToken in enumerate(lTokens):
+                if sToken in setClosePragmas:
+                    bPragma = False
+                if iToken == 0:
+                    bIgnore = bPragma
+                if sToken in setOpenPragmas:
+                    bPragma = True
+            if bIgnore:
+                append(ignore(sLine))
+            else:
+                append(parser.preprocessor(sLine))
+            append(carriage_return())
+            continue
+
+        for sToken in lTokens:
+            if sToken in setClosePragmas:
+                bPragma = False
+            if bPragma:
+                append(ignore(sToken))
+            elif sToken[0] == ' ':
+                append(whitespace(sToken))
+            elif sToken.startswith('--'):
+                append(comment(sToken))
+            else:
+                append(item(sToken))
+            if sToken in setOpenPragmas:
+                bPragma = True
+
+        append(carriage_return())
+
+    dVars['pragma'] = bPragma
+    return lReturn
+
+
+def is_preprocessor(lTokens):
+    '''
+    Returns True if the tokens of a line form a preprocessor command.
+
+    Parameters:
+
+      lTokens: (list of strings)
+
+    Returns: (boolean)
+    '''
+    if lTokens[0].startswith('#'):
+        return True
+    return len(lTokens) > 1 and lTokens[0].startswith(' ') and lTokens[1].startswith('#')
@@ -0,0 +1,150 @@
+
+import codecs
+import io
+import locale
+import mmap
+import os
+
+iPrefixSize = 65536
+iChunkSize = 1048576
+iMemoryMapSize = 67108864
+
+bMemoryMap = True
+
+sFallbackEncoding = 'ISO-8859-1'
+
+
+class lines():
+    '''
+    Iterates over the lines of a VHDL file without reading the whole file into memory.
+
+    Files of at least iMemoryMapSize bytes are memory mapped, smaller files are read into memory.
+    The file is opened and read once when the object is created, so any error reading it is raised then and not while the lines are lexed.
+    The file is decoded in chunks which end on a line boundary.
+    Newlines are translated the same way as a file opened in text mode, so every line ends with a single \\n.
+
+    The encoding is detected once from the start of the file.
+    The encoding used by open() is tried first and ISO-8859-1 is used if the start of the file does not decode.
+    A chunk further into the file which does not decode is decoded line by line and the lines which fail are decoded as ISO-8859-1.
+
+    Parameters:
+
+      sFileName: (string)
+
+    Raises: OSError if the file can not be read
+    '''
+
+    def __init__(self, sFileName):
+        self.sFileName = sFileName
+        self.oBuffer = None
+        with open(sFileName, 'rb') as oFile:
+            if bMemoryMap and os.fstat(oFile.fileno()).st_size >= iMemoryMapSize:
+                try:
+                    self.oBuffer = mmap.mmap(oFile.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    pass
+            if self.oBuffer is None:
+                self.oBuffer = oFile.read()
+        bPrefix = self.oBuffer[:iPrefixSize]
+        self.sEncoding = detect_encoding(bPrefix, len(bPrefix) < iPrefixSize)
+
+    def __iter__(self):
+        for bChunk in read_chunks(self.oBuffer):
+            yield from io.StringIO(decode_chunk(bChunk, self.sEncoding), newline=None)
+
+
+def disable_memory_map():
+    '''
+    Reads every file into memory instead of memory mapping it.
+
+    The map is read while the lines are lexed.
+    If the file is truncated before then, reading the map raises SIGBUS and stops the process.
+    A process which keeps running while files are edited, such as --watch or --server, should not map files.
+
+    Returns: Nothing
+    '''
+    global bMemoryMap
+    bMemoryMap = False
+
+
+def detect_encoding(bPrefix, bFinal):
+    '''
+    Returns the encoding to decode a file with.
+
+    Parameters:
+
+      bPrefix: (bytes) start of the file
+
+      bFinal: (boolean) True if the prefix is the whole file
+
+    Returns: (string)
+    '''
+    sEncoding = locale.getpreferredencoding(False)
+    try:
+        codecs.getincrementaldecoder(sEncoding)().decode(bPrefix, bFinal)
+        return sEncoding
+    except UnicodeDecodeError:
+        return sFallbackEncoding
+
+
+def decode(bData):
+    '''
+    Decodes VHDL text which is already in memory the same way lines decodes a file.
+
+    Parameters:
+
+      bData: (bytes)
+
+    Returns: (string, string) the text and the encoding detected from the start of the text
+    '''
+    bPrefix = bData[:iPrefixSize]
+    sEncoding = detect_encoding(bPrefix, len(bPrefix) < iPrefixSize)
+    return ''.join(decode_chunk(bChunk, sEncoding) for bChunk in read_chunks(bData)), sEncoding
+
+
+def read_chunks(oBuffer):
+    '''
+    Splits a buffer into chunks of about iChunkSize bytes.
+    Every chunk except the last one ends with a \\n, so lines and \\r\\n pairs are never split.
+
+    Parameters:
+
+      oBuffer: (mmap or bytes)
+
+    Returns: (iterator of bytes)
+    '''
+    iLength = len(oBuffer)
+    iStart = 0
+    while iStart < iLength:
+        iEnd = oBuffer.find(b'\n', min(iStart + iChunkSize, iLength) - 1)
+        if iEnd == -1:
+            iEnd = iLength
+        else:
+            iEnd += 1
+        yield oBuffer[iStart:iEnd]
+        iStart = iEnd
+
+
+def decode_chunk(bChunk, sEncoding):
+    '''
+    Decodes a chunk of a file.
+    If the chunk does not decode, each line is decoded separately and lines which do not decode are decoded as ISO-8859-1.
+
+    Parameters:
+
+      bChunk: (bytes)
+
+      sEncoding: (string)
+
+    Returns: (string)
+    '''
+    try:
+        return bChunk.decode(sEncoding)
+    except UnicodeDecodeError:
+        lReturn = []
+        for bLine in bChunk.splitlines(True):
+            try:
+                lReturn.append(bLine.decode(sEncoding))
+            except UnicodeDecodeError:
+                lReturn.append(bLine.decode(sFallbackEncoding))
+        return ''.join(lReturn)
@@ -0,0 +1,211 @@
+
+import array
+import bisect
+
+from vsg import parser
+
+
+class token_list(list):
+    '''
+    A list of tokens which keeps indexes of the tokens for the classifiers.
+
+    The classifiers search forward for the next token which is not classified yet.
+    A linear search rescans every classified token and scans to the end of the file when every token is classified.
+    The indexes answer these searches without scanning:
+
+      * The next unclassified token is found with a disjoint set forest.
+        Each index points to the next index which might be unclassified and paths are compressed while searching.
+        Classifying a token joins it to the set of the token after it.
+
+      * The next token which is not whitespace or a comment is stored for every index.
+
+      * The indexes of every lowercase value are stored in sorted lists, which are created when they are first needed.
+
+    The indexes are updated when a token is replaced.
+    A replacement which can not be applied to an index, such as a token becoming unclassified again, rebuilds that index when it is next used.
+
+    Parameters:
+
+      lTokens: (list of token objects)
+    '''
+
+    def __init__(self, lTokens):
+        list.__init__(self, lTokens)
+        self.aNextItems = None
+        self.aNextSignificant = None
+        self.dPositions = None
+
+    def __setitem__(self, iIndex, oToken):
+        if not isinstance(iIndex, int):
+            list.__setitem__(self, iIndex, oToken)
+            self.clear_indexes()
+            return
+        if iIndex < 0:
+            iIndex += len(self)
+        oPrevious = self[iIndex]
+        list.__setitem__(self, iIndex, oToken)
+        self.update_next_items(iIndex, oPrevious, oToken)
+        self.update_next_significant(oPrevious, oToken)
+        self.update_positions(iIndex, oPrevious, oToken)
+
+    def __delitem__(self, iIndex):
+        list.__delitem__(self, iIndex)
+        self.clear_indexes()
+
+    def __iadd__(self, lTokens):
+        self.extend(lTokens)
+        return self
+
+    def append(self, oToken):
+        list.append(self, oToken)
+        self.clear_indexes()
+
+    def extend(self, lTokens):
+        list.extend(self, lTokens)
+        self.clear_indexes()
+
+    def insert(self, iIndex, oToken):
+        list.insert(self, iIndex, oToken)
+        self.clear_indexes()
+
+    def pop(self, iIndex=-1):
+        oReturn = list.pop(self, iIndex)
+        self.clear_indexes()
+        return oReturn
+
+    def remove(self, oToken):
+        list.remove(self, oToken)
+        self.clear_indexes()
+
+    def clear_indexes(self):
+        self.aNextItems = None
+        self.aNextSignificant = None
+        self.dPositions = None
+
+    def update_next_items(self, iIndex, oPrevious, oToken):
+        if self.aNextItems is None:
+            return
+        bWasItem = oPrevious.type_id == parser.item.type_id
+        bIsItem = oToken.type_id == parser.item.type_id
+        if bWasItem and not bIsItem:
+            self.aNextItems[iIndex] = iIndex + 1
+        elif bIsItem and not bWasItem:
+            self.aNextItems = None
+
+    def update_next_significant(self, oPrevious, oToken):
+        if self.aNextSignificant is None:
+            return
+        if (oPrevious.category ^ oToken.category) & parser.iWhitespaceOrCommentCategories:
+            self.aNextSignificant = None
+
+    def update_positions(self, iIndex, oPrevious, oToken):
+        if self.dPositions is None:
+            return
+        sPrevious = get_key(oPrevious)
+        sValue = get_key(oToken)
+        if sPrevious == sValue:
+            return
+        lPositions = self.dPositions[sPrevious]
+        del lPositions[bisect.bisect_left(lPositions, iIndex)]
+        bisect.insort(self.dPositions.setdefault(sValue, []), iIndex)
+
+    def create_next_items(self):
+        iItem = parser.item.type_id
+        iLength = len(self)
+        aReturn = array.array('l', range(iLength + 1))
+        iNext = iLength
+        for iIndex in range(iLength - 1, -1, -1):
+            if list.__getitem__(self, iIndex).type_id == iItem:
+                iNext = iIndex
+            aReturn[iIndex] = iNext
+        return aReturn
+
+    def create_next_significant(self):
+        iCategories = parser.iWhitespaceOrCommentCategories
+        iLength = len(self)
+        aReturn = array.array('l', range(iLength + 1))
+        iNext = iLength
+        for iIndex in range(iLength - 1, -1, -1):
+            if not list.__getitem__(self, iIndex).category & iCategories:
+                iNext = iIndex
+            aReturn[iIndex] = iNext
+        return aReturn
+
+    def create_positions(self):
+        dReturn = {}
+        for iIndex, oToken in enumerate(list.__iter__(self)):
+            dReturn.setdefault(get_key(oToken), []).append(iIndex)
+        return dReturn
+
+    def find_next_item(self, iToken):
+        '''
+        Returns the index of the next unclassified token.
+
+        Parameters:
+
+          iToken: (integer) index to start searching from, which must be in the list
+
+        Returns: (integer) index of the token or None if every token from iToken is classified
+        '''
+        if self.aNextItems is None:
+            self.aNextItems = self.create_next_items()
+        aNextItems = self.aNextItems
+        iRoot = iToken
+        while aNextItems[iRoot] != iRoot:
+            iRoot = aNextItems[iRoot]
+        while aNextItems[iToken] != iRoot:
+            iNext = aNextItems[iToken]
+            aNextItems[iToken] = iRoot
+            iToken = iNext
+        if iRoot == len(self):
+            return None
+        return iRoot
+
+    def find_next_significant(self, iToken):
+        '''
+        Returns the index of the next token which is not whitespace or a comment.
+
+        Parameters:
+
+          iToken: (integer) index to start searching from, which must be in the list
+
+        Returns: (integer) index of the token or None if only whitespace and comments follow iToken
+        '''
+        if self.aNextSignificant is None:
+            self.aNextSignificant = self.create_next_significant()
+        iReturn = self.aNextSignificant[iToken]
+        if iReturn == len(self):
+            return None
+        return iReturn
+
+    def find_next_value(self, sValue, iStart, iEnd):
+        '''
+        Returns the index of the first token with a lowercase value between two indexes.
+
+        Parameters:
+
+          sValue: (string) lowercase value
+
+          iStart: (integer)
+
+          iEnd: (integer) exclusive
+
+        Returns: (integer) index of the token or None if no token has the value
+        '''
+        if self.dPositions is None:
+            self.dPositions = self.create_positions()
+        try:
+            lPositions = self.dPositions[sValue]
+        except KeyError:
+            return None
+        iPosition = bisect.bisect_left(lPositions, iStart)
+        if iPosition < len(lPositions) and lPositions[iPosition] < iEnd:
+            return lPositions[iPosition]
+        return None
+
+
+def get_key(oToken):
+    sValue = oToken.get_value()
+    if sValue is None:
+        return None
+    return sValue.lower()
@@ -0,0 +1,269 @@
+
+import array
+import importlib
+import json
+import struct
+import sys
+
+from vsg import parser
+
+iNone = -2 ** 31
+
+bMagic = b'VSGTOKENS1'
+
+tArrayNames = ('aTypes', 'aEnds', 'aIndents', 'aHierarchies', 'aCodeTags')
+
+
+def create(lAllObjects):
+    '''
+    Stores a list of tokens in a token_store.
+
+    Parameters:
+
+      lAllObjects: (list of token objects)
+
+    Returns: (token_store object)
+    '''
+    oReturn = token_store()
+    oReturn.extend(lAllObjects)
+    return oReturn
+
+
+def from_bytes(bData):
+    '''
+    Reads a token_store written by token_store.to_bytes.
+
+    Only token classes defined in vsg.parser and the vsg.token package can be referenced, so reading data from an untrusted source can not run code.
+
+    Parameters:
+
+      bData: (bytes)
+
+    Returns: (token_store object)
+
+    Raises: ValueError if the data is not a token_store
+    '''
+    if not bData.startswith(bMagic):
+        raise ValueError('not a token_store')
+    iOffset = len(bMagic)
+    try:
+        iHeader, iValues = struct.unpack_from('<QQ', bData, iOffset)
+        iOffset += struct.calcsize('<QQ')
+        dHeader = json.loads(bData[iOffset:iOffset + iHeader].decode('utf-8'))
+        iOffset += iHeader
+        sValues = bData[iOffset:iOffset + iValues].decode('utf-8')
+        iOffset += iValues
+        iLength = dHeader['length']
+        oReturn = token_store()
+        for sArrayName in tArrayNames:
+            aArray = getattr(oReturn, sArrayName)
+            iBytes = iLength * aArray.itemsize
+            aArray.frombytes(bData[iOffset:iOffset + iBytes])
+            iOffset += iBytes
+            if len(aArray) != iLength:
+                raise ValueError('token_store is truncated')
+            if dHeader['byteorder'] != sys.byteorder:
+                aArray.byteswap()
+        oReturn.lClassNames = [(sModule, sName) for sModule, sName in dHeader['classes']]
+        oReturn.lCodeTags = [tuple(lCodeTags) for lCodeTags in dHeader['code_tags']]
+        oReturn.dContexts = {iIndex: tuple(lContext) for iIndex, lContext in dHeader['contexts']}
+        oReturn.dFilenames = {iIndex: sFilename for iIndex, sFilename in dHeader['filenames']}
+    except (struct.error, UnicodeDecodeError, KeyError, TypeError) as e:
+        raise ValueError('not a token_store') from e
+    oReturn.sValues = sValues
+    if oReturn.get_end() != len(sValues):
+        raise ValueError('token_store is truncated')
+    return oReturn
+
+
+def get_class_name(oClass):
+    return oClass.__module__, oClass.__qualname__
+
+
+def get_class(tClassName):
+    '''
+    Returns a token class from its module and name.
+
+    Parameters:
+
+      tClassName: (string, string)
+
+    Returns: (class)
+
+    Raises: ValueError if the name does not refer to a token class
+    '''
+    sModule, sName = tClassName
+    if sModule != 'vsg.parser' and not sModule.startswith('vsg.token.'):
+        raise ValueError(f'{sModule} is not a token module')
+    oReturn = importlib.import_module(sModule)
+    for sPart in sName.split('.'):
+        oReturn = getattr(oReturn, sPart)
+    if not isinstance(oReturn, type) or not issubclass(oReturn, parser.item):
+        raise ValueError(f'{sModule}.{sName} is not a token class')
+    return oReturn
+
+
+def encode_integer(iValue):
+    if iValue is None:
+        return iNone
+    return iValue
+
+
+def decode_integer(iValue):
+    if iValue == iNone:
+        return None
+    return iValue
+
+
+class token_store():
+    '''
+    Holds tokens as parallel arrays instead of as a list of objects.
+
+    The values of all tokens are joined into one string and each token keeps the offset where its value ends.
+    The class, indent, hierarchy and code tags of each token are stored as small integers.
+    Classes and code tags are stored once in tables and referenced by their index.
+    Contexts and file names are rare, so they are only stored for the tokens which have them.
+
+    Token objects are created all at once by create_objects.
+    The store is written to the parse cache with to_bytes, which takes a fraction of the time of pickling the list of tokens and holds no code.
+    '''
+
+    def __init__(self):
+        self.lClassNames = []
+        self.lCodeTags = []
+        self.aTypes = array.array('H')
+        self.aEnds = array.array('I')
+        self.aIndents = array.array('i')
+        self.aHierarchies = array.array('i')
+        self.aCodeTags = array.array('H')
+        self.lValues = []
+        self.sValues = ''
+        self.dContexts = {}
+        self.dFilenames = {}
+        self.lClasses = None
+
+    def __len__(self):
+        return len(self.aTypes)
+
+    def to_bytes(self):
+        '''
+        Returns the store as bytes which can be read with from_bytes.
+        Unlike a pickle, the bytes only hold data.
+
+        Returns: (bytes)
+        '''
+        self.join_values()
+        dHeader = {}
+        dHeader['length'] = len(self)
+        dHeader['byteorder'] = sys.byteorder
+        dHeader['classes'] = self.lClassNames
+        dHeader['code_tags'] = self.lCodeTags
+        dHeader['contexts'] = list(self.dContexts.items())
+        dHeader['filenames'] = list(self.dFilenames.items())
+        bHeader = json.dumps(dHeader).encode('utf-8')
+        bValues = self.sValues.encode('utf-8')
+        lReturn = [bMagic, struct.pack('<QQ', len(bHeader), len(bValues)), bHeader, bValues]
+        for sArrayName in tArrayNames:
+            lReturn.append(getattr(self, sArrayName).tobytes())
+        return b''.join(lReturn)
+
+    def extend(self, lAllObjects):
+        '''
+        Adds tokens to the end of the store.
+
+        Parameters:
+
+          lAllObjects: (list of token objects)
+
+        Returns: Nothing
+        '''
+        lClasses = self.get_classes()
+        dClassNames = {oClass: iIndex for iIndex, oClass in enumerate(lClasses)}
+        dCodeTags = {tCodeTags: iIndex for iIndex, tCodeTags in enumerate(self.lCodeTags)}
+        iEnd = self.get_end()
+        for oToken in lAllObjects:
+            oClass = oToken.__class__
+            try:
+                iType = dClassNames[oClass]
+            except KeyError:
+                iType = len(self.lClassNames)
+                dClassNames[oClass] = iType
+                self.lClassNames.append(get_class_name(oClass))
+                lClasses.append(oClass)
+
+            tCodeTags = tuple(oToken.code_tags)
+            try:
+                iCodeTags = dCodeTags[tCodeTags]
+            except KeyError:
+                iCodeTags = len(self.lCodeTags)
+                dCodeTags[tCodeTags] = iCodeTags
+                self.lCodeTags.append(tCodeTags)
+
+            iIndex = len(self.aTypes)
+            if len(oToken.context) > 0:
+                self.dContexts[iIndex] = tuple(oToken.context)
+            if oToken.filename is not None:
+                self.dFilenames[iIndex] = oToken.filename
+
+            iEnd += len(oToken.value)
+            self.lValues.append(oToken.value)
+            self.aTypes.append(iType)
+            self.aEnds.append(iEnd)
+            self.aIndents.append(encode_integer(oToken.indent))
+            self.aHierarchies.append(encode_integer(oToken.hierarchy))
+            self.aCodeTags.append(iCodeTags)
+
+    def get_end(self):
+        if len(self.aEnds) == 0:
+            return 0
+        return self.aEnds[-1]
+
+    def join_values(self):
+        if len(self.lValues) > 0:
+            self.sValues += ''.join(self.lValues)
+            self.lValues = []
+
+    def get_classes(self):
+        '''
+        Returns the token classes used in the store, importing them if needed.
+
+        Returns: (list of classes)
+        '''
+        if self.lClasses is None:
+            self.lClasses = [get_class(tClassName) for tClassName in self.lClassNames]
+        return self.lClasses
+
+    def get_code_tags(self):
+        return [parser.intern_code_tags(tCodeTags) for tCodeTags in self.lCodeTags]
+
+    def create_objects(self):
+        '''
+        Creates every token in the store.
+
+        Returns: (list of token objects)
+        '''
+        self.join_values()
+        lClasses = self.get_classes()
+        lCodeTags = self.get_code_tags()
+        sValues = self.sValues
+        dContexts = self.dContexts
+        dFilenames = self.dFilenames
+        tEmpty = parser.tEmpty
+        lReturn = []
+        iStart = 0
+        for iType, iEnd, iIndent, iHierarchy, iCodeTags in zip(self.aTypes, self.aEnds, self.aIndents, self.aHierarchies, self.aCodeTags):
+            oClass = lClasses[iType]
+            oToken = oClass.__new__(oClass)
+            oToken.value = sValues[iStart:iEnd]
+            oToken.indent = None if iIndent == iNone else iIndent
+            oToken.hierarchy = None if iHierarchy == iNone else iHierarchy
+            oToken.code_tags = lCodeTags[iCodeTags]
+            oToken.context = tEmpty
+            oToken.filename = None
+            lReturn.append(oToken)
+            iStart = iEnd
+        for iIndex, tContext in dContexts.items():
+            lReturn[iIndex].context = tContext
+        for iIndex, sFilename in dFilenames.items():
+            lReturn[iIndex].filename = sFilename
+        return lReturn
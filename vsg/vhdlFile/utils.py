@@ -1,6 +1,9 @@
 
 from vsg import parser
 
+from vsg.vhdlFile import reader
+from vsg.vhdlFile import token_list
+
 
 def assign_tokens_until(sToken, token, iToken, lObjects):
     iCurrent = iToken
@@ -75,12 +78,16 @@ def object_value_is(lAllObjects, iToken, sString):
 
 
 def is_item(lAllObjects, iToken):
-    if type(lAllObjects[iToken]) == parser.item:
+    if lAllObjects[iToken].type_id == parser.item.type_id:
         return True
     return False
 
 
 def get_range(lObjects, iStart, sEnd):
+    if is_indexed(lObjects, iStart):
+        iEnd = lObjects.find_next_value(sEnd, iStart, len(lObjects))
+        if iEnd is not None:
+            return iStart, iEnd
     iIndex = iStart
     while lObjects[iIndex].get_value().lower() != sEnd:
         iIndex += 1
@@ -132,7 +139,7 @@ def are_next_consecutive_token_types(lTypes, iToken, lObjects):
     try:
         while iTokenCount < iMaxTokenCount:
             if not lTypes[iTokenCount] is None:
-                if not isinstance(lObjects[iCurrent], lTypes[iTokenCount]):
+                if lTypes[iTokenCount].type_id not in lObjects[iCurrent].type_ids:
                     return False
             iCurrent += 1
             iTokenCount += 1
@@ -149,7 +156,7 @@ def are_next_consecutive_token_types_ignoring_whitespace(lTypes, iToken, lObject
         while iTokenCount < iMaxTokenCount:
             iCurrent = find_next_non_whitespace_token(iCurrent, lObjects)
             if not lTypes[iTokenCount] is None:
-                if not isinstance(lObjects[iCurrent], lTypes[iTokenCount]):
+                if lTypes[iTokenCount].type_id not in lObjects[iCurrent].type_ids:
                     return False
             iCurrent += 1
             iTokenCount += 1
@@ -166,7 +173,7 @@ def are_previous_consecutive_token_types_ignoring_whitespace(lTypes, iToken, lOb
             iCurrent = find_previous_non_whitespace_token(iCurrent, lObjects)
 #            print(f'{lObjects[iCurrent].get_value()} | {lObjects[iCurrent]} | {lTypes[iTokenCount - 1]}')
             if not lTypes[iTokenCount - 1] is None:
-                if not isinstance(lObjects[iCurrent], lTypes[iTokenCount - 1]):
+                if lTypes[iTokenCount - 1].type_id not in lObjects[iCurrent].type_ids:
                     return False
             iCurrent -= 1
             iTokenCount -= 1
@@ -190,7 +197,41 @@ def find_in_next_n_tokens(sValue, iMax, iToken, lObjects):
     return False
 
 
+def get_next_token_values(iToken, lObjects, iMax):
+    '''
+    Returns the lowercase values of the tokens find_in_next_n_tokens would check.
+
+    Parameters:
+
+      iToken: (integer)
+
+      lObjects: (list of token objects)
+
+      iMax: (integer) number of tokens
+
+    Returns: (list of strings) which is shorter than iMax if the end of the file is reached
+    '''
+    lReturn = []
+    iEnd = len(lObjects)
+    iCurrent = iToken
+    while len(lReturn) < iMax:
+        iCurrent = find_next_token(iCurrent, lObjects)
+        lReturn.append(lObjects[iCurrent].get_value().lower())
+        iCurrent += 1
+        if iCurrent == iEnd:
+            break
+    return lReturn
+
+
 def find_earliest_occurance(lEnd, iToken, lObjects):
+    if is_indexed(lObjects, iToken):
+        iEarliest = None
+        for sEnd in lEnd:
+            iIndex = lObjects.find_next_value(sEnd, iToken, len(lObjects) - 1)
+            if iIndex is not None and (iEarliest is None or iIndex < iEarliest):
+                iEarliest = iIndex
+        if iEarliest is not None:
+            return lObjects[iEarliest].get_value()
     iEarliest = 9999999999999999999999999999
     for sEnd in lEnd:
         for iIndex in range(iToken, len(lObjects) - 1):
@@ -201,18 +242,43 @@ def find_earliest_occurance(lEnd, iToken, lObjects):
     return sEarliest
 
 
+def is_indexed(lObjects, iToken):
+    '''
+    Returns True if the indexes of a token_list can be used to search from a token.
+
+    Parameters:
+
+      lObjects: (list of token objects)
+
+      iToken: (integer)
+
+    Returns: (boolean)
+    '''
+    return isinstance(lObjects, token_list.token_list) and 0 <= iToken < len(lObjects)
+
+
 def find_next_token(iToken, lObjects):
+    if is_indexed(lObjects, iToken):
+        iReturn = lObjects.find_next_item(iToken)
+        if iReturn is None:
+            return iToken
+        return iReturn
+    iItem = parser.item.type_id
     for iCurrent in range(iToken, len(lObjects)):
-        if is_item(lObjects, iCurrent):
+        if lObjects[iCurrent].type_id == iItem:
             return iCurrent
     return iToken
 
 
 def find_next_non_whitespace_token(iToken, lObjects):
+    if is_indexed(lObjects, iToken):
+        iReturn = lObjects.find_next_significant(iToken)
+        if iReturn is None:
+            return iToken
+        return iReturn
     iCurrent = iToken
     for iIndex in range(iToken, len(lObjects)):
-        oToken = lObjects[iIndex]
-        if token_is_whitespace_or_comment(oToken):
+        if lObjects[iIndex].category & parser.iWhitespaceOrCommentCategories:
             continue
         return iIndex
     return iCurrent
@@ -221,8 +287,7 @@ def find_next_non_whitespace_token(iToken, lObjects):
 def find_previous_non_whitespace_token(iToken, lObjects):
     iCurrent = iToken
     for iIndex in range(iToken, 0, -1):
-        oToken = lObjects[iIndex]
-        if token_is_whitespace_or_comment(oToken):
+        if lObjects[iIndex].category & parser.iWhitespaceOrCommentCategories:
             continue
         return iIndex
     return iCurrent
@@ -298,7 +363,7 @@ def print_token(iObject, lObjects):
 def print_line(lObjects, iStart):
     iIndex = iStart
     sOutput = ''
-    while not isinstance(lObjects[iIndex], parser.carriage_return):
+    while not lObjects[iIndex].category & parser.iCarriageReturn:
         sOutput += lObjects[iIndex].get_value()
         iIndex += 1
     print(sOutput)
@@ -366,7 +431,7 @@ def classify_subelement_until(sToken, element, iToken, lObjects):
 def calculate_line_number(iToken, lObjects):
     iReturn = 1
     for iIndex in range(0, iToken):
-        if isinstance(lObjects[iIndex], parser.carriage_return):
+        if lObjects[iIndex].category & parser.iCarriageReturn:
             iReturn += 1
     return iReturn
 
@@ -374,7 +439,7 @@ def calculate_line_number(iToken, lObjects):
 def calculate_column(iToken, lObjects):
     iColumn = 0
     for iCarriageReturn in range(iToken, 0, -1):
-        if isinstance(lObjects[iCarriageReturn], parser.carriage_return):
+        if lObjects[iCarriageReturn].category & parser.iCarriageReturn:
             break;
     for iIndex in range(iCarriageReturn + 1, iToken):
         iColumn += len(lObjects[iIndex].get_value())
@@ -450,7 +515,7 @@ def does_length_of_tokens_exceed(lObjects, iLength):
 def remove_carriage_returns_from_token_list(lTokens):
     lMyTokens = []
     for oToken in lTokens:
-        if isinstance(oToken, parser.carriage_return):
+        if oToken.category & parser.iCarriageReturn:
             continue
         lMyTokens.append(oToken)
     return lMyTokens
@@ -459,7 +524,7 @@ def remove_carriage_returns_from_token_list(lTokens):
 def remove_comments_from_token_list(lTokens):
     lMyTokens = []
     for oToken in lTokens:
-        if isinstance(oToken, parser.comment):
+        if oToken.category & parser.iComment:
             continue
         lMyTokens.append(oToken)
     return lMyTokens
@@ -471,7 +536,7 @@ def remove_consecutive_whitespace_tokens(lTokens):
         if iToken == 0:
             lMyTokens.append(oToken)
         else:
-            if isinstance(oToken, parser.whitespace) and isinstance(lTokens[iToken - 1], parser.whitespace):
+            if oToken.category & parser.iWhitespace and lTokens[iToken - 1].category & parser.iWhitespace:
                 continue
             else:
                 lMyTokens.append(oToken)
@@ -481,14 +546,14 @@ def remove_consecutive_whitespace_tokens(lTokens):
 def remove_whitespace_from_token_list(lTokens):
     lMyTokens = []
     for oToken in lTokens:
-        if isinstance(oToken, parser.whitespace):
+        if oToken.category & parser.iWhitespace:
             continue
         lMyTokens.append(oToken)
     return lMyTokens
 
 
 def remove_comment_at_end_of_token_list(lTokens):
-    if isinstance(lTokens[-1], parser.comment):
+    if lTokens[-1].category & parser.iComment:
         return lTokens[:-1]
     return lTokens
 
@@ -536,34 +601,27 @@ def remove_leading_whitespace_and_comments(iToken, lTokens):
 
 
 def token_is_whitespace_or_comment(oToken):
-    if isinstance(oToken, parser.whitespace) or \
-       isinstance(oToken, parser.carriage_return) or \
-       isinstance(oToken, parser.comment) or \
-       isinstance(oToken, parser.blank_line) or \
-       isinstance(oToken, parser.preprocessor):
+    if oToken.category & parser.iWhitespaceOrCommentCategories:
         return True
     else:
         return False
 
 
 def token_is_whitespace(oToken):
-    if isinstance(oToken, parser.whitespace) or \
-       isinstance(oToken, parser.carriage_return) or \
-       isinstance(oToken, parser.blank_line) or \
-       isinstance(oToken, parser.preprocessor):
+    if oToken.category & parser.iWhitespaceCategories:
         return True
     else:
         return False
 
 
 def increment_line_number(iLine, oToken):
-    if isinstance(oToken, parser.carriage_return):
+    if oToken.category & parser.iCarriageReturn:
         return iLine + 1
     return iLine
 
 
 def decrement_line_number(iLine, oToken):
-    if isinstance(oToken, parser.carriage_return):
+    if oToken.category & parser.iCarriageReturn:
         return iLine - 1
     return iLine
 
@@ -577,7 +635,7 @@ def count_carriage_returns(lTokens):
 
 def find_carriage_return(lTokens, iToken=0):
     for iIndex in range(iToken, len(lTokens)):
-        if isinstance(lTokens[iIndex], parser.carriage_return):
+        if lTokens[iIndex].category & parser.iCarriageReturn:
             return iIndex
     return None
 
@@ -601,9 +659,9 @@ def get_toi_parameters(oToi):
 
 
 def does_token_start_line(iToken, lTokens):
-    if isinstance(lTokens[iToken - 1], parser.whitespace) and isinstance(lTokens[iToken - 2], parser.carriage_return):
+    if lTokens[iToken - 1].category & parser.iWhitespace and lTokens[iToken - 2].category & parser.iCarriageReturn:
         return True
-    if isinstance(lTokens[iToken - 1], parser.carriage_return):
+    if lTokens[iToken - 1].category & parser.iCarriageReturn:
         return True
     return False
 
@@ -619,14 +677,14 @@ def fix_blank_lines(lTokens):
     lReturn = []
     for iToken, oToken in enumerate(lTokens):
         try:
-            if isinstance(oToken, parser.carriage_return) and isinstance(lTokens[iToken + 1], parser.carriage_return):
+            if oToken.category & parser.iCarriageReturn and lTokens[iToken + 1].category & parser.iCarriageReturn:
                 lReturn.append(oToken)
                 lReturn.append(parser.blank_line())
                 continue
         except IndexError:
             pass
         try:
-            if isinstance(lTokens[iToken - 1], parser.carriage_return) and isinstance(oToken, parser.whitespace) and isinstance(lTokens[iToken + 1], parser.carriage_return):
+            if lTokens[iToken - 1].category & parser.iCarriageReturn and oToken.category & parser.iWhitespace and lTokens[iToken + 1].category & parser.iCarriageReturn:
                 lReturn.append(parser.blank_line())
                 continue
         except IndexError:
@@ -637,36 +695,46 @@ def fix_blank_lines(lTokens):
 
 
 def is_whitespace(oObject):
-    if isinstance(oObject, parser.carriage_return):
-        return True
-    if isinstance(oObject, parser.blank_line):
-        return True
-    if isinstance(oObject, parser.comment):
-        return True
-    if isinstance(oObject, parser.whitespace):
-        return True
-    if isinstance(oObject, parser.preprocessor):
+    if oObject.category & parser.iWhitespaceOrCommentCategories:
         return True
     return False
 
 
 def read_vhdlfile(sFileName):
+    oLines, eError = open_vhdlfile(sFileName)
+    return list(oLines), eError
+
+
+def open_vhdlfile(sFileName):
+    '''
+    Opens a VHDL file for reading one line at a time.
+    The lines are decoded as they are read, so the file is never held in memory as a list of lines.
+
+    Parameters:
+
+      sFileName: (string)
+
+    Returns: (iterable of strings, OSError) the error is None if the file could be opened
+    '''
     try:
-        lLines = []
-        with open(sFileName) as oFile:
-            for sLine in oFile:
-                lLines.append(sLine)
-        return lLines, None
-    except UnicodeDecodeError:
-        lLines = []
-        with open(sFileName, encoding="ISO-8859-1") as oFile:
-            for sLine in oFile:
-                lLines.append(sLine)
-        return lLines, None
+        return reader.lines(sFileName), None
     except OSError as e:
         return [], e
 
 
+def decode_vhdl_text(bData):
+    '''
+    Decodes VHDL text, such as text read from stdin, with the same encoding detection and fallback used for files.
+
+    Parameters:
+
+      bData: (bytes)
+
+    Returns: (string, string) the text and the encoding detected from the start of the text
+    '''
+    return reader.decode(bData)
+
+
 def is_token_at_end_of_line(iToken, lTokens):
     iMyToken = iToken + 1
     if are_next_consecutive_token_types([parser.carriage_return], iMyToken, lTokens):
@@ -1,9 +1,11 @@
 
+import sys
+
+from vsg import changed_lines
 from vsg import parser
+from vsg import profiler
 from vsg import token
 
-from vsg import tokens
-
 from vsg.token import adding_operator
 from vsg.token import direction
 from vsg.token import logical_operator
@@ -17,14 +19,10 @@ from vsg.token.ieee.std_logic_1164 import types
 from vsg.token.ieee.std_logic_1164 import function
 
 from vsg.vhdlFile import extract
+from vsg.vhdlFile import lexer
 from vsg.vhdlFile import utils
 
-from vsg.vhdlFile.classify import blank
-from vsg.vhdlFile.classify import comment
 from vsg.vhdlFile.classify import design_file
-from vsg.vhdlFile.classify import whitespace
-from vsg.vhdlFile.classify import preprocessor
-from vsg.vhdlFile.classify import pragma
 
 from vsg.vhdlFile.indent.set_token_indent import set_token_indent
 
@@ -42,13 +40,20 @@ class vhdlFile():
 
     Parameters:
 
-       filecontent: (list)
+       filecontent: (list or iterable of strings)
+
+       sFilename: (string)
+
+       eError: (OSError)
+
+       lAllObjects: (list of token objects)
+         Previously classified tokens, which will be used instead of processing filecontent.
 
     Returns:
 
        fileobject
     '''
-    def __init__(self, filecontent, sFilename=None, eError=None):
+    def __init__(self, filecontent, sFilename=None, eError=None, lAllObjects=None):
         self.filecontent = filecontent
         self.hasArchitecture = False
         self.hasEntity = False
@@ -60,26 +65,23 @@ class vhdlFile():
         self.dVars = {}
         self.dVars['pragma'] = False
         self.eError = eError
-        self._processFile()
+        self.oCodeTagRegions = None
+        self.iVersion = 0
+        self.lLineRanges = None
+        self.setChangedTokens = None
+        self.bChangedToEnd = False
+        self.iLineRangesVersion = 0
+        if lAllObjects is None:
+            with profiler.timer('vhdlFile._processFile'):
+                self._processFile()
+        else:
+            self._restoreFile(lAllObjects)
 
     def _processFile(self):
 
-        self.lAllObjects = []
-        for sLine in self.filecontent:
-            lTokens = tokens.create(sLine.replace('\t', '  ').rstrip('\n').rstrip('\r'))
-#            lTokens = tokens.create(sLine.replace('\t', '  ').rstrip())
-            lObjects = []
-            for sToken in lTokens:
-                lObjects.append(parser.item(sToken))
-
-            blank.classify(lObjects)
-            whitespace.classify(lTokens, lObjects)
-            comment.classify(lTokens, lObjects)
-            preprocessor.classify(lTokens, lObjects)
-            pragma.classify(lTokens, lObjects, self.lOpenPragmas, self.lClosePragmas, self.dVars)
-
-            self.lAllObjects.extend(lObjects)
-            self.lAllObjects.append(parser.carriage_return())
+        # Lines are read from the file as they are lexed
+        with profiler.timer('lexer.create_objects'):
+            self.lAllObjects = lexer.create_objects(self.filecontent, self.lOpenPragmas, self.lClosePragmas, self.dVars)
 
         try:
             self.lAllObjects[0].set_filename(self.filename)
@@ -91,25 +93,41 @@ class vhdlFile():
         self.lAllObjects = combine_use_clause_selected_name(self.lAllObjects)
 
         set_token_hierarchy_value(self.lAllObjects)
-        self.oTokenMap = process_tokens(self.lAllObjects)
+        with profiler.timer('token_map.process_tokens'):
+            self.oTokenMap = process_tokens(self.lAllObjects)
+
+    def _restoreFile(self, lAllObjects):
+
+        self.lAllObjects = lAllObjects
+        try:
+            self.lAllObjects[0].set_filename(self.filename)
+        except IndexError:
+            pass
+
+        with profiler.timer('token_map.process_tokens'):
+            self.oTokenMap = process_tokens(self.lAllObjects)
 
     def update(self, lUpdates):
 
         if len(lUpdates) == 0:
             return
-        bUpdateMap = True
-        for oUpdate in lUpdates[::-1]:
-            iStart = oUpdate.oTokens.iStartIndex
-            lTokens = oUpdate.get_tokens()
-            iEnd = oUpdate.oTokens.iEndIndex
-            lMyTokens = remove_beginning_of_file_tokens(lTokens)
-            self.lAllObjects[iStart:iEnd] = lMyTokens
-        if bUpdateMap:
-            self.oTokenMap = process_tokens(self.lAllObjects)
+        with profiler.timer('vhdlFile.update'):
+            bUpdateMap = True
+            for oUpdate in lUpdates[::-1]:
+                iStart = oUpdate.oTokens.iStartIndex
+                lTokens = oUpdate.get_tokens()
+                iEnd = oUpdate.oTokens.iEndIndex
+                lMyTokens = remove_beginning_of_file_tokens(lTokens)
+                self.lAllObjects[iStart:iEnd] = lMyTokens
+            self.iVersion += 1
+            if bUpdateMap:
+                with profiler.timer('token_map.process_tokens'):
+                    self.oTokenMap = process_tokens(self.lAllObjects)
 
     def set_indent_map(self, dIndentMap):
         self.dIndentMap = dIndentMap
-        set_token_indent(self.dIndentMap, self.lAllObjects)
+        with profiler.timer('vhdlFile.set_indent_map'):
+            set_token_indent(self.dIndentMap, self.lAllObjects)
 
     def get_indent_map(self):
         return self.dIndentMap
@@ -136,6 +154,51 @@ class vhdlFile():
 
     def fix_blank_lines(self):
         self.lAllObjects = utils.fix_blank_lines(self.lAllObjects)
+        self.iVersion += 1
+
+    def get_code_tag_regions(self):
+        '''
+        Returns the regions of the file where each code tag applies.
+        The regions are created when they are first requested after the tokens change.
+
+        Returns: (code_tags.regions object)
+        '''
+        if self.oCodeTagRegions is None or not self.oCodeTagRegions.is_current():
+            self.oCodeTagRegions = code_tags.create_regions(self.lAllObjects, self)
+        return self.oCodeTagRegions
+
+    def set_line_ranges(self, lLineRanges):
+        '''
+        Sets the ranges of lines which changed.
+        The tokens on those lines are remembered, so the ranges follow the lines when fixes insert or remove lines.
+
+        Parameters:
+
+          lLineRanges: (list of (integer, integer) tuples) or None if every line changed
+        '''
+        self.lLineRanges = lLineRanges
+        self.iLineRangesVersion = self.iVersion
+        if lLineRanges is None:
+            self.setChangedTokens = None
+            self.bChangedToEnd = False
+        else:
+            self.setChangedTokens = changed_lines.get_tokens_in_ranges(self.lAllObjects, lLineRanges)
+            self.bChangedToEnd = len(lLineRanges) > 0 and lLineRanges[-1][1] > self.get_line_count()
+
+    def get_line_ranges(self):
+        '''
+        Returns the ranges of lines which changed.
+        The ranges are found again from the changed tokens when the tokens have changed since they were set.
+        Lines which were added by a fix are only included if they hold a changed token.
+
+        Returns: (list of (integer, integer) tuples) or None if every line changed
+        '''
+        if self.setChangedTokens is not None and self.iLineRangesVersion != self.iVersion:
+            self.lLineRanges = changed_lines.get_ranges_of_tokens(self.lAllObjects, self.setChangedTokens)
+            if self.bChangedToEnd and len(self.lLineRanges) > 0:
+                self.lLineRanges[-1] = (self.lLineRanges[-1][0], sys.maxsize)
+            self.iLineRangesVersion = self.iVersion
+        return self.lLineRanges
 
     def set_token_indent(self):
         set_token_indent(self.dIndentMap, self.lAllObjects)
@@ -304,190 +367,141 @@ def split_on_carriage_return(lObjects):
     return lReturn
 
 
+tSignPreviousTokens = (parser.open_parenthesis, parser.keyword, parser.assignment, parser.comma)
+tUnaryPreviousTokens = (parser.open_parenthesis, parser.assignment, parser.comma)
+tClassifiedSignPreviousTokens = (parser.open_parenthesis, parser.keyword)
+
+dTodoTokens = {}
+dTodoTokens['&'] = adding_operator.concat
+dTodoTokens['('] = parser.open_parenthesis
+dTodoTokens[')'] = parser.close_parenthesis
+dTodoTokens[','] = parser.comma
+dTodoTokens['to'] = direction.to
+dTodoTokens['downto'] = direction.downto
+dTodoTokens['**'] = miscellaneous_operator.double_star
+dTodoTokens['abs'] = miscellaneous_operator.abs_operator
+dTodoTokens['not'] = miscellaneous_operator.not_operator
+dTodoTokens['*'] = multiplying_operator.star
+dTodoTokens['/'] = multiplying_operator.slash
+dTodoTokens['mod'] = multiplying_operator.mod_operator
+dTodoTokens['rem'] = multiplying_operator.rem_operator
+dTodoTokens['='] = relational_operator.equal
+dTodoTokens["'"] = parser.tic
+dTodoTokens['event'] = parser.event_keyword
+dTodoTokens['rising_edge'] = function.rising_edge
+dTodoTokens['falling_edge'] = function.falling_edge
+dTodoTokens['std_logic_vector'] = types.std_logic_vector
+dTodoTokens['std_ulogic_vector'] = types.std_ulogic_vector
+dTodoTokens['std_ulogic'] = types.std_ulogic
+
+lFixedValueTokens = [parser.open_parenthesis, parser.close_parenthesis]
+
+dUnaryTodoTokens = {}
+dUnaryTodoTokens['+'] = (sign.plus, adding_operator.plus, tSignPreviousTokens)
+dUnaryTodoTokens['-'] = (sign.minus, adding_operator.minus, tSignPreviousTokens)
+dUnaryTodoTokens['and'] = (unary_logical_operator.and_operator, logical_operator.and_operator, tUnaryPreviousTokens)
+dUnaryTodoTokens['or'] = (unary_logical_operator.or_operator, logical_operator.or_operator, tUnaryPreviousTokens)
+dUnaryTodoTokens['nand'] = (unary_logical_operator.nand_operator, logical_operator.nand_operator, tUnaryPreviousTokens)
+dUnaryTodoTokens['nor'] = (unary_logical_operator.nor_operator, logical_operator.nor_operator, tUnaryPreviousTokens)
+dUnaryTodoTokens['xor'] = (unary_logical_operator.xor_operator, logical_operator.xor_operator, tUnaryPreviousTokens)
+dUnaryTodoTokens['xnor'] = (unary_logical_operator.xnor_operator, logical_operator.xnor_operator, tUnaryPreviousTokens)
+
+dClassifiedTokens = {}
+dClassifiedTokens['+'] = (sign.plus, adding_operator.plus, tClassifiedSignPreviousTokens)
+dClassifiedTokens['-'] = (sign.minus, adding_operator.minus, tClassifiedSignPreviousTokens)
+
+
 def post_token_assignments(lTokens):
+    '''
+    Assigns code tags to every token and classifies the operators, types and literals left as parser.todo by the classifiers.
+
+    The previous token which is not whitespace or a comment is tracked during the pass.
+    It decides if a +, - or logical operator is unary.
+    Like utils.are_previous_consecutive_token_types_ignoring_whitespace, the first token is only seen from the second token.
+
+    Parameters:
+
+      lTokens: (list of token objects)
+
+    Returns: Nothing
+    '''
     oCodeTags = code_tags.New()
+    # The first token looks back to the last token, as a search from index -1 would
+    try:
+        oPrevious = lTokens[-1]
+    except IndexError:
+        oPrevious = None
     for iToken, oToken in enumerate(lTokens):
-        oToken.set_code_tags(oCodeTags.get_tags())
         if isinstance(oToken, parser.todo):
+            oToken.set_code_tags(oCodeTags.get_tags())
+            oNewToken = refine_todo_token(oToken.get_value(), oPrevious)
+            if oNewToken is not None:
+                lTokens[iToken] = oNewToken
+                oToken = oNewToken
+        else:
+            oCodeTags.update(oToken)
+            oToken.set_code_tags(oCodeTags.get_tags())
             sValue = oToken.get_value()
-            if sValue == '&':
-                lTokens[iToken] = adding_operator.concat()
-                continue
-            if sValue  == '+':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.plus()
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.keyword], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.plus()
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.assignment], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.plus()
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.comma], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.plus()
-                else:
-                    lTokens[iToken] = adding_operator.plus()
-                continue
-            if sValue  == '-':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.minus()
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.keyword], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.minus()
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.assignment], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.minus()
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.comma], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.minus()
-                else:
-                    lTokens[iToken] = adding_operator.minus()
-                continue
-            if sValue == '(':
-                lTokens[iToken] = parser.open_parenthesis()
-                continue
-            if sValue == ')':
-                lTokens[iToken] = parser.close_parenthesis()
-                continue
-            if sValue == ',':
-                lTokens[iToken] = parser.comma()
-                continue
-            if sValue.lower() == 'to':
-                lTokens[iToken] = direction.to(sValue)
-                continue
-            if sValue.lower() == 'downto':
-                lTokens[iToken] = direction.downto(sValue)
-                continue
-            if sValue.lower() == 'and':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.and_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.assignment], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.and_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.comma], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.and_operator(sValue)
-                else:
-                    lTokens[iToken] = logical_operator.and_operator(sValue)
-                continue
-            if sValue.lower() == 'or':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.or_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.assignment], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.or_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.comma], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.or_operator(sValue)
-                else:
-                    lTokens[iToken] = logical_operator.or_operator(sValue)
-                continue
-            if sValue.lower() == 'nand':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.nand_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.assignment], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.nand_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.comma], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.nand_operator(sValue)
-                else:
-                    lTokens[iToken] = logical_operator.nand_operator(sValue)
-                continue
-            if sValue.lower() == 'nor':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.nor_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.assignment], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.nor_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.comma], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.nor_operator(sValue)
-                else:
-                    lTokens[iToken] = logical_operator.nor_operator(sValue)
-                continue
-            if sValue.lower() == 'xor':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.xor_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.assignment], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.xor_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.comma], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.xor_operator(sValue)
-                else:
-                    lTokens[iToken] = logical_operator.xor_operator(sValue)
-                continue
-            if sValue.lower() == 'xnor':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.xnor_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.assignment], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.xnor_operator(sValue)
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.comma], iToken - 1, lTokens):
-                    lTokens[iToken] = unary_logical_operator.xnor_operator(sValue)
-                else:
-                    lTokens[iToken] = logical_operator.xnor_operator(sValue)
-                continue
-            if sValue.lower() == '**':
-                lTokens[iToken] = miscellaneous_operator.double_star(sValue)
-                continue
-            if sValue.lower() == 'abs':
-                lTokens[iToken] = miscellaneous_operator.abs_operator(sValue)
-                continue
-            if sValue.lower() == 'not':
-                lTokens[iToken] = miscellaneous_operator.not_operator(sValue)
-                continue
+            if sValue in dClassifiedTokens:
+                oToken = refine_unary_token(dClassifiedTokens, sValue, oPrevious)
+                lTokens[iToken] = oToken
 
-            if sValue.lower() == '*':
-                lTokens[iToken] = multiplying_operator.star(sValue)
-                continue
-            if sValue.lower() == '/':
-                lTokens[iToken] = multiplying_operator.slash(sValue)
-                continue
-            if sValue.lower() == 'mod':
-                lTokens[iToken] = multiplying_operator.mod_operator(sValue)
-                continue
-            if sValue.lower() == 'rem':
-                lTokens[iToken] = multiplying_operator.rem_operator(sValue)
-                continue
+        if iToken == 0 or not oToken.category & parser.iWhitespaceOrCommentCategories:
+            oPrevious = oToken
+        elif iToken == 1:
+            oPrevious = None
 
-            if sValue == '=':
-                lTokens[iToken] = relational_operator.equal(sValue)
-                continue
 
+def refine_todo_token(sValue, oPrevious):
+    '''
+    Returns a new token for a token which was not classified.
 
+    Parameters:
 
-            if sValue == "'":
-                lTokens[iToken] = parser.tic(sValue)
-                continue
-            if sValue.lower() == 'event':
-                lTokens[iToken] = parser.event_keyword(sValue)
-                continue
+      sValue: (string)
 
-            ### IEEE values
-            if sValue.lower() == 'rising_edge':
-                lTokens[iToken] = function.rising_edge(sValue)
-                continue
-            if sValue.lower() == 'falling_edge':
-                lTokens[iToken] = function.falling_edge(sValue)
-                continue
+      oPrevious: (token object) previous token which is not whitespace or a comment
 
-            if sValue.lower() == 'std_logic_vector':
-                lTokens[iToken] = types.std_logic_vector(sValue)
+    Returns: (token object) or None if the token stays unclassified
+    '''
+    sLowerValue = sValue.lower()
+    oClass = dTodoTokens.get(sLowerValue)
+    if oClass is not None:
+        if oClass in lFixedValueTokens:
+            return oClass()
+        return oClass(sValue)
+    if sLowerValue in dUnaryTodoTokens:
+        return refine_unary_token(dUnaryTodoTokens, sLowerValue, oPrevious, sValue)
+    if len(sValue) == 3 and sValue.startswith("'") and sValue.endswith("'"):
+        return parser.character_literal(sValue)
+    return None
+
+
+def refine_unary_token(dTokens, sKey, oPrevious, sValue=None):
+    '''
+    Returns a new token for an operator which can be unary.
+    The operator is unary if the previous token is one of the types in the table.
 
-            if sValue.lower() == 'std_ulogic_vector':
-                lTokens[iToken] = types.std_ulogic_vector(sValue)
+    Parameters:
 
-            if sValue.lower() == 'std_ulogic':
-                lTokens[iToken] = types.std_ulogic(sValue)
+      dTokens: (dictionary) maps operators to the unary class, the binary class and the previous token types
 
-            if len(sValue) == 3 and sValue.startswith("'") and sValue.endswith("'"):
-                lTokens[iToken] = parser.character_literal(sValue)
-                continue
-        else:
-            oCodeTags.update(oToken)
-            oToken.set_code_tags(oCodeTags.get_tags())
-            sValue = oToken.get_value()
-            if sValue  == '+':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.plus()
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.keyword], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.plus()
-                else:
-                    lTokens[iToken] = adding_operator.plus()
-                continue
-            if sValue  == '-':
-                if utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.open_parenthesis], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.minus()
-                elif utils.are_previous_consecutive_token_types_ignoring_whitespace([parser.keyword], iToken - 1, lTokens):
-                    lTokens[iToken] = sign.minus()
-                else:
-                    lTokens[iToken] = adding_operator.minus()
-                continue
+      sKey: (string) lowercase operator
+
+      oPrevious: (token object) previous token which is not whitespace or a comment
+
+      sValue: (string) value of the token or None to use the default value of the class
+
+    Returns: (token object)
+    '''
+    oUnaryClass, oBinaryClass, tPreviousTokens = dTokens[sKey]
+    if isinstance(oPrevious, tPreviousTokens):
+        oClass = oUnaryClass
+    else:
+        oClass = oBinaryClass
+    if sValue is None:
+        return oClass()
+    return oClass(sValue)
 
 
 def set_token_hierarchy_value(lTokens):
@@ -34,9 +34,25 @@ class New():
   def get_token_value(self):
       return self.oTokens.get_token_value()
 
-  def has_code_tag(self, sCodeTag):
+  def has_code_tag(self, sCodeTag, oRegions=None):
+      '''
+      Returns True if any token of the violation has a code tag.
+      The regions of the file are searched instead of the tokens if the tokens are still at their index in the file.
+
+      Parameters:
+
+        sCodeTag: (string)
+
+        oRegions: (code_tags.regions object)
+
+      Returns: (boolean)
+      '''
       try:
-          for oToken in self.oTokens.get_tokens():
+          lTokens = self.oTokens.get_tokens()
+          iStart = self.oTokens.iStartIndex
+          if oRegions is not None and len(lTokens) > 0 and oRegions.are_tokens_at_index(lTokens, iStart):
+              return oRegions.has_code_tag(sCodeTag, iStart, iStart + len(lTokens) - 1)
+          for oToken in lTokens:
               if oToken.has_code_tag(sCodeTag):
                   return True
           return False
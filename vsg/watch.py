@@ -0,0 +1,232 @@
+
+import copy
+import os
+import sys
+import time
+
+from . import apply_rules
+from . import cache
+from . import changed_lines
+from . import config
+
+from .vhdlFile import reader
+
+fPollInterval = 0.25
+
+
+def get_file_state(sFileName):
+    '''
+    Returns the modification time and size of a file.
+
+    Parameters:
+
+      sFileName: (string)
+
+    Returns: (tuple of integers) or None if the file can not be accessed
+    '''
+    try:
+        oStat = os.stat(sFileName)
+    except OSError:
+        return None
+    return oStat.st_mtime_ns, oStat.st_size
+
+
+def get_configuration_files(commandLineArguments):
+    '''
+    Returns the files which make up the configuration.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+    Returns: (list of strings)
+    '''
+    lReturn = []
+    if commandLineArguments.configuration:
+        lReturn.extend(commandLineArguments.configuration)
+    if commandLineArguments.fix_only:
+        lReturn.append(commandLineArguments.fix_only)
+    return lReturn
+
+
+class watcher():
+    '''
+    Detects changes to the contents of a list of files.
+    The modification time and size of each file are checked first and the contents are only hashed when either changed.
+
+    Parameters:
+
+      lFileNames: (list of strings)
+    '''
+
+    def __init__(self, lFileNames):
+        self.lFileNames = []
+        self.dStates = {}
+        self.dDigests = {}
+        self.set_file_names(lFileNames)
+
+    def set_file_names(self, lFileNames):
+        '''
+        Replaces the files being watched and records their current contents.
+
+        Parameters:
+
+          lFileNames: (list of strings)
+
+        Returns: Nothing
+        '''
+        self.lFileNames = list(lFileNames)
+        self.dStates = {}
+        self.dDigests = {}
+        for sFileName in self.lFileNames:
+            self.update(sFileName)
+
+    def update(self, sFileName):
+        '''
+        Records the current contents of a file so it is not reported as changed.
+
+        Parameters:
+
+          sFileName: (string)
+
+        Returns: Nothing
+        '''
+        self.dStates[sFileName] = get_file_state(sFileName)
+        self.dDigests[sFileName] = cache.create_file_digest(sFileName)
+
+    def get_changed_files(self):
+        '''
+        Returns the files whose contents changed since they were last recorded.
+        Files which were only touched are not reported.
+
+        Returns: (list of strings)
+        '''
+        lReturn = []
+        for sFileName in self.lFileNames:
+            tState = get_file_state(sFileName)
+            if tState == self.dStates[sFileName]:
+                continue
+            self.dStates[sFileName] = tState
+            sDigest = cache.create_file_digest(sFileName)
+            if sDigest == self.dDigests[sFileName]:
+                continue
+            self.dDigests[sFileName] = sDigest
+            if sDigest is not None:
+                lReturn.append(sFileName)
+        return lReturn
+
+
+class session():
+    '''
+    Analyzes files again whenever they change.
+    The configuration is only read again when one of the configuration files changes, in which case every file is analyzed again.
+
+    With --changed_since, git is asked for the changed lines again before files are analyzed, as editing a file moves its changed lines.
+    Every file is watched, so a file without changes is analyzed once it is edited.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+    '''
+
+    def __init__(self, commandLineArguments, oConfig):
+        self.commandLineArguments = commandLineArguments
+        self.oConfig = oConfig
+        self.oFileWatcher = watcher(commandLineArguments.filename)
+        self.oConfigWatcher = watcher(get_configuration_files(commandLineArguments))
+
+    def update_changed_lines(self):
+        '''
+        Asks git for the lines changed since the --changed_since revision.
+        The previous lines are kept if git fails.
+
+        Returns: Nothing
+        '''
+        try:
+            self.oConfig.dChangedLines = changed_lines.get_changed_lines(self.commandLineArguments.changed_since)
+        except OSError as e:
+            print('ERROR: could not get the lines changed since ' + self.commandLineArguments.changed_since + ': ' + str(e), file=sys.stderr)
+
+    def analyze(self, lFileNames):
+        '''
+        Applies the rules to files and prints the results.
+        With --changed_since, only the files with changed lines are analyzed.
+
+        Parameters:
+
+          lFileNames: (list of strings)
+
+        Returns: (list of strings) the files which were analyzed
+        '''
+        if len(lFileNames) > 0 and self.commandLineArguments.changed_since:
+            self.update_changed_lines()
+            if self.oConfig.dChangedLines is not None:
+                lFileNames = changed_lines.filter_file_names(lFileNames, self.oConfig.dChangedLines)
+        for iIndex, sFileName in enumerate(lFileNames):
+            fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr = apply_rules.apply_rules(self.commandLineArguments, self.oConfig, (iIndex, sFileName))
+            if sOutputStd:
+                print(sOutputStd)
+            if sOutputErr:
+                print(sOutputErr, file=sys.stderr)
+            # Changes made by --fix should not trigger another analysis
+            self.oFileWatcher.update(sFileName)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        return lFileNames
+
+    def reload_configuration(self):
+        '''
+        Reads the configuration files again.
+        The previous configuration is kept if the new one can not be read.
+
+        Returns: (boolean) True if the configuration was replaced
+        '''
+        commandLineArguments = copy.copy(self.commandLineArguments)
+        commandLineArguments.filename = list(self.commandLineArguments.filename)
+        try:
+            oConfig = config.New(commandLineArguments)
+        except SystemExit:
+            print('ERROR: keeping the previous configuration', file=sys.stderr)
+            return False
+        oConfig.dChangedLines = self.oConfig.dChangedLines
+        self.commandLineArguments = commandLineArguments
+        self.oConfig = oConfig
+        self.oFileWatcher.set_file_names(commandLineArguments.filename)
+        return True
+
+    def poll(self):
+        '''
+        Analyzes the files which changed since the last poll.
+
+        Returns: (list of strings) the files which were analyzed
+        '''
+        if len(self.oConfigWatcher.get_changed_files()) > 0 and self.reload_configuration():
+            lFileNames = list(self.commandLineArguments.filename)
+        else:
+            lFileNames = self.oFileWatcher.get_changed_files()
+        return self.analyze(lFileNames)
+
+
+def watch(commandLineArguments, oConfig):
+    '''
+    Analyzes all files and then analyzes them again as they change until interrupted.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+    Returns: Nothing
+    '''
+    reader.disable_memory_map()
+    oSession = session(commandLineArguments, oConfig)
+    oSession.analyze(commandLineArguments.filename)
+    try:
+        while True:
+            time.sleep(fPollInterval)
+            oSession.poll()
+    except KeyboardInterrupt:
+        pass